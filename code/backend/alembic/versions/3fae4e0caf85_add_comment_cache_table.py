@@ -0,0 +1,36 @@
+"""Add comment_cache table
+
+Revision ID: 3fae4e0caf85
+Revises: 8eb62ce5e262
+Create Date: 2026-10-18 11:04:52.193847
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3fae4e0caf85'
+down_revision: Union[str, None] = '8eb62ce5e262'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('comment_cache',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('comment', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_comment_cache_key', 'comment_cache', ['cache_key'], unique=True)
+    op.create_index(op.f('ix_comment_cache_id'), 'comment_cache', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_comment_cache_id'), table_name='comment_cache')
+    op.drop_index('idx_comment_cache_key', table_name='comment_cache')
+    op.drop_table('comment_cache')
@@ -0,0 +1,39 @@
+"""Add dashboard_summary snapshot table
+
+Revision ID: 5d1c7e04a9b2
+Revises: 3fae4e0caf85
+Create Date: 2026-10-18 12:21:37.508214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1c7e04a9b2'
+down_revision: Union[str, None] = '3fae4e0caf85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('dashboard_summary',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('program_count', sa.Integer(), nullable=False),
+    sa.Column('facility_total', sa.Integer(), nullable=False),
+    sa.Column('facility_base_ym', sa.String(length=10), nullable=True),
+    sa.Column('facility_region_count', sa.Integer(), nullable=False),
+    sa.Column('support_total_recipients', sa.Integer(), nullable=False),
+    sa.Column('support_base_year', sa.Integer(), nullable=True),
+    sa.Column('coach_total', sa.Integer(), nullable=False),
+    sa.Column('coach_latest_year', sa.Integer(), nullable=True),
+    sa.Column('talent_test_count', sa.Integer(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('dashboard_summary')
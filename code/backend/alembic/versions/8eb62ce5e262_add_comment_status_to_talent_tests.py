@@ -0,0 +1,33 @@
+"""Add comment_status to talent_tests
+
+Revision ID: 8eb62ce5e262
+Revises: bac8fb47afd1
+Create Date: 2026-10-18 10:12:31.482913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8eb62ce5e262'
+down_revision: Union[str, None] = 'bac8fb47afd1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create the enum type first
+    comment_status_enum = sa.Enum('pending', 'completed', 'failed', name='commentstatus')
+    comment_status_enum.create(op.get_bind(), checkfirst=True)
+
+    # Add the column
+    op.add_column('talent_tests', sa.Column('comment_status', comment_status_enum, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('talent_tests', 'comment_status')
+    # Drop the enum type
+    sa.Enum(name='commentstatus').drop(op.get_bind(), checkfirst=True)
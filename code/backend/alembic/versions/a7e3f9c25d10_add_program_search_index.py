@@ -0,0 +1,52 @@
+"""Add program full-text search index (pg_trgm GIN / SQLite FTS5)
+
+Revision ID: a7e3f9c25d10
+Revises: 5d1c7e04a9b2
+Create Date: 2026-10-18 13:02:11.734920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e3f9c25d10'
+down_revision: Union[str, None] = '5d1c7e04a9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 검색/필터 대상 컬럼 (app/services/program_search.py FTS_COLUMNS와 동일)
+SEARCH_COLUMNS = ('program_name', 'facility_name', 'program_type', 'target_group', 'industry_name')
+
+
+def upgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+
+    if dialect_name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in SEARCH_COLUMNS:
+            op.create_index(
+                f'idx_programs_{column}_trgm', 'programs', [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+    elif dialect_name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS programs_fts USING fts5("
+            + ", ".join(SEARCH_COLUMNS)
+            + ", content='programs', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute("INSERT INTO programs_fts(programs_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect_name = op.get_bind().dialect.name
+
+    if dialect_name == 'postgresql':
+        for column in SEARCH_COLUMNS:
+            op.drop_index(f'idx_programs_{column}_trgm', table_name='programs')
+    elif dialect_name == 'sqlite':
+        op.execute('DROP TABLE IF EXISTS programs_fts')
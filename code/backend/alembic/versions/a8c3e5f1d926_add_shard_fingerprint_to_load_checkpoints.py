@@ -0,0 +1,27 @@
+"""Add shard_fingerprint to load_checkpoints
+
+Revision ID: a8c3e5f1d926
+Revises: f2a9c4e7b318
+Create Date: 2026-10-18 20:05:37.214608
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c3e5f1d926'
+down_revision: Union[str, None] = 'f2a9c4e7b318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 기존 체크포인트는 해시가 없으므로 다음 --resume 때 무효 처리되어 전체 재적재
+    op.add_column('load_checkpoints', sa.Column('shard_fingerprint', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('load_checkpoints', 'shard_fingerprint')
@@ -0,0 +1,35 @@
+"""Add dataset_registry table for skipping unchanged data loads
+
+Revision ID: b5d2f8e4a613
+Revises: e91a5b3c7d24
+Create Date: 2026-10-18 16:02:41.318254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d2f8e4a613'
+down_revision: Union[str, None] = 'e91a5b3c7d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('dataset_registry',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('source_files', sa.String(length=1000), nullable=True),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('loaded_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('dataset_registry')
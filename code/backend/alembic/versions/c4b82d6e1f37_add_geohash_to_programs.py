@@ -0,0 +1,100 @@
+"""Add geohash column to programs for nearby search
+
+Revision ID: c4b82d6e1f37
+Revises: a7e3f9c25d10
+Create Date: 2026-10-18 13:48:26.119305
+
+"""
+import math
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4b82d6e1f37'
+down_revision: Union[str, None] = 'a7e3f9c25d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 10000
+
+# 마이그레이션 시점의 geohash 규칙 (app 코드가 바뀌어도 이 리비전의 결과는 고정)
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9
+KOREA_LAT_RANGE = (33.0, 39.0)
+KOREA_LON_RANGE = (124.0, 132.0)
+
+
+def _geohash_or_none(lat, lon):
+    """국내 범위 안의 좌표면 geohash, 아니면 None"""
+    if lat is None or lon is None or math.isnan(lat) or math.isnan(lon):
+        return None
+    if not (KOREA_LAT_RANGE[0] <= lat <= KOREA_LAT_RANGE[1]
+            and KOREA_LON_RANGE[0] <= lon <= KOREA_LON_RANGE[1]):
+        return None
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit, ch, even = 0, 0, True
+    while len(chars) < GEOHASH_PRECISION:
+        value, bounds = (lon, lon_range) if even else (lat, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        if value >= mid:
+            ch = (ch << 1) | 1
+            bounds[0] = mid
+        else:
+            ch <<= 1
+            bounds[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(GEOHASH_ALPHABET[ch])
+            bit, ch = 0, 0
+    return "".join(chars)
+
+
+def upgrade() -> None:
+    op.add_column('programs', sa.Column('geohash', sa.String(length=12), nullable=True))
+
+    # 기존 행 geohash 채우기 (id 순 배치)
+    bind = op.get_bind()
+    programs = sa.table(
+        'programs',
+        sa.column('id', sa.Integer),
+        sa.column('latitude', sa.Float),
+        sa.column('longitude', sa.Float),
+        sa.column('geohash', sa.String),
+    )
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(programs.c.id, programs.c.latitude, programs.c.longitude)
+            .where(programs.c.id > last_id, programs.c.latitude.isnot(None))
+            .order_by(programs.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        updates = []
+        for row in rows:
+            geohash = _geohash_or_none(row.latitude, row.longitude)
+            if geohash:
+                updates.append({"row_id": row.id, "geohash": geohash})
+        if updates:
+            bind.execute(
+                programs.update()
+                .where(programs.c.id == sa.bindparam('row_id'))
+                .values(geohash=sa.bindparam('geohash')),
+                updates,
+            )
+        last_id = rows[-1].id
+
+    op.create_index('idx_programs_geohash', 'programs', ['geohash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_programs_geohash', table_name='programs')
+    op.drop_column('programs', 'geohash')
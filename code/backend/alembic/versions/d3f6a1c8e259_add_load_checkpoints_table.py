@@ -0,0 +1,35 @@
+"""Add load_checkpoints table for resumable program loads
+
+Revision ID: d3f6a1c8e259
+Revises: b5d2f8e4a613
+Create Date: 2026-10-18 17:24:09.551872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f6a1c8e259'
+down_revision: Union[str, None] = 'b5d2f8e4a613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('load_checkpoints',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('target_table', sa.String(length=100), nullable=False),
+    sa.Column('shard_file', sa.String(length=255), nullable=False),
+    sa.Column('rows_done', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name', 'shard_file', name='uq_load_checkpoints_name_shard')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('load_checkpoints')
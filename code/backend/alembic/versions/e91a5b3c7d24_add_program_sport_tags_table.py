@@ -0,0 +1,40 @@
+"""Add program_sport_tags table for talent-based recommendations
+
+Revision ID: e91a5b3c7d24
+Revises: c4b82d6e1f37
+Create Date: 2026-10-18 14:31:05.582716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91a5b3c7d24'
+down_revision: Union[str, None] = 'c4b82d6e1f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('program_sport_tags',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('program_id', sa.Integer(), nullable=False),
+    sa.Column('sport', sa.String(length=50), nullable=False),
+    sa.Column('geohash', sa.String(length=12), nullable=True),
+    sa.ForeignKeyConstraint(['program_id'], ['programs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_program_sport_tags_sport_geohash', 'program_sport_tags', ['sport', 'geohash'], unique=False)
+    op.create_index('idx_program_sport_tags_program', 'program_sport_tags', ['program_id'], unique=False)
+
+    # 태그는 프로그램 적재 마무리(finalize_program_load)에서 계산하므로 backfill하지 않음
+    # (이후 리비전의 dataset_registry가 비어 있어 다음 load_all이 programs를 다시 적재함)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_program_sport_tags_program', table_name='program_sport_tags')
+    op.drop_index('idx_program_sport_tags_sport_geohash', table_name='program_sport_tags')
+    op.drop_table('program_sport_tags')
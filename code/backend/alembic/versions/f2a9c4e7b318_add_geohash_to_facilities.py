@@ -0,0 +1,29 @@
+"""Add geohash column to facilities for area search
+
+Revision ID: f2a9c4e7b318
+Revises: d3f6a1c8e259
+Create Date: 2026-10-18 18:11:52.840317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a9c4e7b318'
+down_revision: Union[str, None] = 'd3f6a1c8e259'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # facilities는 아직 적재 스크립트가 없어 비어 있으므로 backfill 없이 추가
+    op.add_column('facilities', sa.Column('geohash', sa.String(length=12), nullable=True))
+    op.create_index('idx_facilities_geohash', 'facilities', ['geohash'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_facilities_geohash', table_name='facilities')
+    op.drop_column('facilities', 'geohash')
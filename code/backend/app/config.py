@@ -7,6 +7,10 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "postgresql+psycopg://shinjuyong@localhost:5432/suminjae"
+    DB_POOL_SIZE: int = 5  # 상시 유지 커넥션 수 (워커 프로세스당, 동기/비동기 엔진 각각)
+    DB_MAX_OVERFLOW: int = 10  # pool_size 초과 시 추가 허용 커넥션 수
+    DB_POOL_TIMEOUT: float = 30.0  # 커넥션 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재생성 주기 (초, -1이면 비활성)
 
     @property
     def database_url_sync(self) -> str:
@@ -17,13 +21,58 @@ class Settings(BaseSettings):
             url = url.replace("postgresql://", "postgresql+psycopg://", 1)
         return url
 
+    @property
+    def database_url_async(self) -> str:
+        """SQLAlchemy AsyncEngine용 URL 반환 (psycopg async / aiosqlite)"""
+        url = self.database_url_sync
+        if url.startswith("postgresql+psycopg2://"):
+            url = url.replace("postgresql+psycopg2://", "postgresql+psycopg://", 1)
+        elif url.startswith("sqlite://"):
+            url = url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        return url
+
     # JWT
     JWT_SECRET: str = "your-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRE_MINUTES: int = 60 * 24  # 24시간
+    AUTH_TOKEN_CACHE_SIZE: int = 4096  # 검증된 토큰 캐시 최대 항목 수
+    AUTH_USER_CACHE_SIZE: int = 4096  # 사용자 캐시 최대 항목 수
+    AUTH_USER_CACHE_TTL: int = 30  # 사용자 캐시 유효 시간 (초)
+    BCRYPT_WORKERS: int = 2  # bcrypt 해싱 전용 스레드 수
+    BCRYPT_MAX_PENDING: int = 64  # bcrypt 대기 작업 상한 (초과 시 503)
+    INTERNAL_METRICS_TOKEN: Optional[str] = None  # /internal/metrics 접근 토큰 (미설정 시 비활성)
 
     # Gemini (선택적)
     GEMINI_API_KEY: Optional[str] = None
+    GEMINI_API_URL: str = "https://generativelanguage.googleapis.com/v1beta/models/gemini-3-pro:generateContent"
+    GEMINI_TIMEOUT: float = 10.0  # 요청 타임아웃 (초)
+    GEMINI_MAX_CONNECTIONS: int = 10  # 커넥션 풀 크기 (keep-alive)
+    GEMINI_MAX_CONCURRENCY: int = 4  # 동시 호출 상한
+    GEMINI_MAX_RETRIES: int = 2  # 429/5xx 재시도 횟수
+    GEMINI_RETRY_BACKOFF: float = 0.5  # 재시도 기본 대기 시간 (초, 지수 증가 + 지터)
+    GEMINI_BREAKER_THRESHOLD: int = 5  # 연속 실패 시 회로 차단 기준
+    GEMINI_BREAKER_COOLDOWN: float = 30.0  # 회로 차단 유지 시간 (초)
+    COMMENT_CACHE_SIZE: int = 2048  # 코멘트 캐시 최대 항목 수 (LRU)
+    COMMENT_CACHE_TTL: int = 60 * 60 * 24 * 7  # 코멘트 캐시 유효 시간 (초)
+    COMMENT_CACHE_SCORE_BUCKET: float = 1.0  # 캐시 키 점수 구간 폭 (점)
+    COMMENT_CACHE_PERSISTENT: bool = False  # comment_cache 테이블 사용 여부
+    COMMENT_WORKER_COUNT: int = 2  # 백그라운드 코멘트 생성 워커 수
+    COMMENT_QUEUE_MAXSIZE: int = 1000  # 코멘트 대기열 최대 길이
+    COMMENT_PENDING_TIMEOUT: int = 15 * 60  # 이 시간(초)이 지나도 pending인 코멘트는 failed로 정리
+
+    # Programs
+    PROGRAM_COUNT_CACHE_SIZE: int = 1024  # 필터 조합별 총 개수 캐시 최대 항목 수
+    PROGRAM_COUNT_CACHE_TTL: int = 300  # 총 개수 캐시 유효 시간 (초)
+    PROGRAM_FACET_CACHE_TTL: int = 300  # 패싯 집계 캐시 유효 시간 (초)
+
+    # Data loading (app/scripts)
+    LOAD_PARSE_WORKERS: int = 1  # 프로그램 CSV 파싱 프로세스 수 (1이면 순차 적재)
+    LOAD_WRITER_CONNECTIONS: int = 2  # 병렬 적재 시 INSERT/COPY 커넥션 수 (SQLite는 1)
+    LOAD_QUEUE_MAXSIZE: int = 8  # 파싱 완료 후 적재 대기 배치 수 상한
+    LOAD_STREAM_BATCH_ROWS: int = 10000  # --stream 적재 배치 행 수
+    LOAD_STREAM_BATCH_MB: int = 32  # --stream 적재 배치 메모리 상한 (MB, 행 수보다 우선)
+    DATA_PARQUET_CACHE: bool = True  # 원본 CSV를 Parquet 캐시로 변환해 읽기 (pyarrow 필요)
+    DATA_CACHE_DIR: Optional[str] = None  # Parquet 캐시 경로 (기본: data/.parquet)
 
     # App
     DEBUG: bool = True
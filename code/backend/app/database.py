@@ -1,6 +1,19 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
 from app.config import settings
+from app.pool_metrics import instrumented_pool_class, sync_pool_metrics, async_pool_metrics
+
+
+# 커넥션 풀 설정 (PostgreSQL, 동기/비동기 엔진 공통)
+pool_options = {
+    "pool_pre_ping": True,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
 
 
 # SQLite와 PostgreSQL 모두 지원
@@ -17,11 +30,34 @@ else:
     engine = create_engine(
         db_url,
         echo=settings.DEBUG,
-        pool_pre_ping=True
+        poolclass=instrumented_pool_class(QueuePool, sync_pool_metrics),
+        **pool_options
     )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (API 조회 라우터용, 적재 스크립트는 동기 엔진 사용)
+async_db_url = settings.database_url_async
+if async_db_url.startswith("sqlite"):
+    async_engine = create_async_engine(
+        async_db_url,
+        echo=settings.DEBUG,
+    )
+else:
+    async_engine = create_async_engine(
+        async_db_url,
+        echo=settings.DEBUG,
+        poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, async_pool_metrics),
+        **pool_options
+    )
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy 모델 기반 클래스"""
@@ -35,3 +71,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency: 비동기 DB 세션 주입 (이벤트 루프를 막지 않음)"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,9 +1,15 @@
-from fastapi import Depends, HTTPException, status
+import secrets
+import time
+from collections import OrderedDict
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import Optional
-from app.database import get_db
-from app.services.auth_service import decode_access_token, get_user_by_id
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+from typing import Optional, Dict, Tuple, Any
+from app.config import settings
+from app.database import get_async_db
+from app.services.auth_service import decode_access_token
 from app.models.user import User
 
 
@@ -11,13 +17,117 @@ security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
 
+class _ExpiringLRU:
+    """만료 시각을 가진 항목의 크기 제한 LRU 캐시 (프로세스 내)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, now: float):
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= now:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key, value, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> Dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# 검증된 토큰 → JWT payload (토큰 exp까지 유효, 벽시계 기준)
+_token_cache = _ExpiringLRU(settings.AUTH_TOKEN_CACHE_SIZE)
+# 사용자 ID → 컬럼 값 스냅샷 (짧은 TTL, 단조 시계 기준)
+_user_cache = _ExpiringLRU(settings.AUTH_USER_CACHE_SIZE)
+
+
+def _verify_token(token: str) -> Optional[dict]:
+    """JWT 검증 (검증된 payload는 토큰 만료 시각까지 캐시)"""
+    payload = _token_cache.get(token, time.time())
+    if payload is not None:
+        return payload
+
+    payload = decode_access_token(token)
+    if payload is not None and payload.get("exp") is not None:
+        _token_cache.set(token, payload, float(payload["exp"]))
+    return payload
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """
+    사용자 조회 (짧은 TTL 스냅샷 캐시 사용)
+
+    캐시 적중 시 DB 조회 없이 스냅샷을 현재 세션에 병합하므로
+    라우터가 get_async_db로 같은 요청 세션을 받아 속성 수정 후 commit하는 흐름이 그대로 동작합니다.
+    """
+    now = time.monotonic()
+    snapshot = _user_cache.get(user_id, now)
+    if snapshot is not None:
+        cached_user = User(**snapshot)
+        make_transient_to_detached(cached_user)
+        return await db.merge(cached_user, load=False)
+
+    user = await db.get(User, user_id)
+    if user is not None:
+        snapshot = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs
+        }
+        _user_cache.set(user_id, snapshot, now + settings.AUTH_USER_CACHE_TTL)
+    return user
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """사용자 정보 변경 시 캐시 무효화 (프로필 수정 등)"""
+    _user_cache.pop(user_id)
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    """
+    내부 API 접근 확인 (X-Internal-Token 헤더)
+
+    INTERNAL_METRICS_TOKEN이 설정되지 않았으면 엔드포인트가 없는 것처럼 404를 반환합니다.
+    """
+    expected = settings.INTERNAL_METRICS_TOKEN
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if x_internal_token is None or not secrets.compare_digest(x_internal_token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="내부 API 접근 권한이 없습니다.",
+        )
+
+
+def get_auth_cache_stats() -> Dict:
+    """인증 캐시 적중/미스 통계"""
+    return {
+        "token_cache": _token_cache.stats(),
+        "user_cache": _user_cache.stats(),
+    }
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """현재 로그인한 사용자 조회 (JWT 검증)"""
     token = credentials.credentials
-    payload = decode_access_token(token)
+    payload = _verify_token(token)
 
     if payload is None:
         raise HTTPException(
@@ -34,7 +144,7 @@ async def get_current_user(
         )
 
     user_id = int(user_id_str)
-    user = get_user_by_id(db, user_id)
+    user = await _load_user(db, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -46,7 +156,7 @@ async def get_current_user(
 
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> Optional[User]:
     """현재 사용자 조회 (로그인 선택적)"""
     if credentials is None:
@@ -54,7 +164,7 @@ async def get_current_user_optional(
 
     try:
         token = credentials.credentials
-        payload = decode_access_token(token)
+        payload = _verify_token(token)
         if payload is None:
             return None
 
@@ -63,6 +173,6 @@ async def get_current_user_optional(
             return None
 
         user_id = int(user_id_str)
-        return get_user_by_id(db, user_id)
+        return await _load_user(db, user_id)
     except Exception:
         return None
@@ -1,7 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.routers import auth, talent, programs, facilities, dashboard, me, inquiry
+from app.database import async_engine
+from app.routers import auth, talent, programs, facilities, dashboard, me, inquiry, metrics
+from app.services.comment_worker import start_comment_workers, stop_comment_workers
+from app.services.gemini_client import init_gemini_client, close_gemini_client
+from app.services.auth_service import password_hasher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 백그라운드 작업 관리"""
+    await init_gemini_client()
+    await start_comment_workers()
+    yield
+    await stop_comment_workers()
+    await close_gemini_client()
+    password_hasher.shutdown()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -9,7 +26,8 @@ app = FastAPI(
     description="청소년 스포츠 재능 발굴 및 매칭 플랫폼 백엔드",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS 설정 (프론트엔드 연동용)
@@ -35,6 +53,7 @@ app.include_router(facilities.router, prefix="/api/facilities", tags=["Facilitie
 app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
 app.include_router(me.router, prefix="/api/me", tags=["MyPage"])
 app.include_router(inquiry.router, tags=["Inquiry"])
+app.include_router(metrics.router, prefix="/internal/metrics", tags=["Internal"], include_in_schema=False)
 
 
 @app.get("/")
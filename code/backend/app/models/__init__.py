@@ -1,21 +1,27 @@
 from app.database import Base
 from app.models.user import User, UserRole
-from app.models.talent import TalentTest, TalentScore, GradeLevel, Gender
+from app.models.talent import TalentTest, TalentScore, GradeLevel, Gender, CommentStatus
 from app.models.facility import Facility, FacilityStats
-from app.models.program import Program
+from app.models.program import Program, ProgramSportTag
 from app.models.coach import CoachStats
 from app.models.support import SupportStats
 from app.models.bookmark import Bookmark, Notification, TargetType
 from app.models.inquiry import Inquiry, InquiryStatus
+from app.models.comment_cache import CommentCache
+from app.models.dashboard import DashboardSummary
+from app.models.dataset import DatasetRegistry, LoadCheckpoint
 
 __all__ = [
     "Base",
     "User", "UserRole",
-    "TalentTest", "TalentScore", "GradeLevel", "Gender",
+    "TalentTest", "TalentScore", "GradeLevel", "Gender", "CommentStatus",
     "Facility", "FacilityStats",
-    "Program",
+    "Program", "ProgramSportTag",
     "CoachStats",
     "SupportStats",
     "Bookmark", "Notification", "TargetType",
     "Inquiry", "InquiryStatus",
+    "CommentCache",
+    "DashboardSummary",
+    "DatasetRegistry", "LoadCheckpoint",
 ]
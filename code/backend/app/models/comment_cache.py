@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, func, Index
+from app.database import Base
+
+
+class CommentCache(Base):
+    """Gemini 코멘트 캐시 (프롬프트 입력 해시 기준)"""
+    __tablename__ = "comment_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), nullable=False)  # 정규화된 프롬프트 입력의 SHA-256
+    comment = Column(Text, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_comment_cache_key", "cache_key", unique=True),
+    )
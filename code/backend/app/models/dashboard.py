@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, DateTime, func
+from app.database import Base
+
+
+class DashboardSummary(Base):
+    """대시보드 요약 스냅샷 (단일 행, 적재 스크립트가 갱신)"""
+    __tablename__ = "dashboard_summary"
+
+    id = Column(Integer, primary_key=True)  # 항상 1
+
+    program_count = Column(Integer, nullable=False, default=0)  # 프로그램 수
+
+    facility_total = Column(Integer, nullable=False, default=0)  # 최신 기준년월 시설 수 합계
+    facility_base_ym = Column(String(10), nullable=True)  # 시설 통계 기준년월
+    facility_region_count = Column(Integer, nullable=False, default=0)  # 최신 기준년월 지역 수
+
+    support_total_recipients = Column(Integer, nullable=False, default=0)  # 최신 연도 수혜자 수 합계
+    support_base_year = Column(Integer, nullable=True)  # 스포츠강좌이용권 기준년도
+
+    coach_total = Column(Integer, nullable=False, default=0)  # 최신 연도 체육지도자 수
+    coach_latest_year = Column(Integer, nullable=True)  # 체육지도자 최신 연도
+
+    talent_test_count = Column(Integer, nullable=False, default=0)  # 재능 진단 수 (진단 저장 시 증가)
+
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
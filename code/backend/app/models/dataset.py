@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint, func
+from app.database import Base
+
+
+class DatasetRegistry(Base):
+    """적재된 원본 데이터셋 기록 (원본 파일 해시가 같으면 재적재 생략)"""
+    __tablename__ = "dataset_registry"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), unique=True, nullable=False)  # 데이터셋 이름 (예: facility_stats)
+    fingerprint = Column(String(64), nullable=False)  # 원본 파일 해시 + 적재 옵션 sha256
+    source_files = Column(String(1000), nullable=True)  # 원본 파일 이름 목록
+    row_count = Column(Integer, nullable=False, default=0)  # 적재된 행 수
+    loaded_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class LoadCheckpoint(Base):
+    """분할 파일별 적재 진행 위치 (배치 commit과 같은 트랜잭션에서 갱신, --resume용)"""
+    __tablename__ = "load_checkpoints"
+    __table_args__ = (UniqueConstraint("name", "shard_file", name="uq_load_checkpoints_name_shard"),)
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), nullable=False)  # 데이터셋 이름 (예: programs)
+    target_table = Column(String(100), nullable=False)  # 적재 대상 테이블 (shadow 모드면 shadow 테이블)
+    shard_file = Column(String(255), nullable=False)  # 분할 파일 이름
+    shard_fingerprint = Column(String(64), nullable=True)  # 분할 파일 내용 sha256 (바뀌면 체크포인트 무효)
+    rows_done = Column(Integer, nullable=False, default=0)  # 분할 파일 앞에서부터 적재 완료된 행 수
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -23,6 +23,7 @@ class Facility(Base):
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
     homepage_url = Column(String(500), nullable=True)
+    geohash = Column(String(12), nullable=True)  # 위치/영역 검색용 geohash (좌표가 유효한 경우)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -30,6 +31,7 @@ class Facility(Base):
     __table_args__ = (
         Index("idx_facilities_region", "region_sido", "region_sigungu"),
         Index("idx_facilities_type", "facility_type_name"),
+        Index("idx_facilities_geohash", "geohash"),
     )
 
 
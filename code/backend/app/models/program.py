@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, func, Index
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, ForeignKey, func, Index
 from app.database import Base
 
 
@@ -26,6 +26,7 @@ class Program(Base):
     # 좌표
     latitude = Column(Float, nullable=True)
     longitude = Column(Float, nullable=True)
+    geohash = Column(String(12), nullable=True)  # 위치 검색용 geohash (좌표가 유효한 경우)
 
     # 프로그램 정보
     program_type = Column(String(100), nullable=True)  # PROGRM_TY_NM
@@ -43,7 +44,25 @@ class Program(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Indexes
+    # 텍스트 검색 인덱스(pg_trgm GIN / SQLite FTS5)는 마이그레이션에서 생성 (app/services/program_search.py)
     __table_args__ = (
         Index("idx_programs_region", "region_sido", "region_sigungu"),
         Index("idx_programs_target", "target_group"),
+        Index("idx_programs_geohash", "geohash"),
+    )
+
+
+class ProgramSportTag(Base):
+    """프로그램 종목 태그 (적재 시 키워드 매칭으로 계산, 재능 진단 종목 코드)"""
+    __tablename__ = "program_sport_tags"
+
+    id = Column(Integer, primary_key=True)
+    program_id = Column(Integer, ForeignKey("programs.id", ondelete="CASCADE"), nullable=False)
+    sport = Column(String(50), nullable=False)  # soccer, para_swimming 등 (SPORT_NAMES_KO 키)
+    geohash = Column(String(12), nullable=True)  # 프로그램 geohash 복사본 (종목+위치 인덱스 조회용)
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_program_sport_tags_sport_geohash", "sport", "geohash"),
+        Index("idx_program_sport_tags_program", "program_id"),
     )
@@ -27,6 +27,13 @@ class DisabilityType(str, enum.Enum):
     intellectual = "intellectual"  # 지적장애
 
 
+class CommentStatus(str, enum.Enum):
+    """Gemini 코멘트 생성 상태"""
+    pending = "pending"  # 생성 대기중
+    completed = "completed"  # 생성 완료
+    failed = "failed"  # 생성 실패
+
+
 class TalentTest(Base):
     """체력 측정 입력 기록"""
     __tablename__ = "talent_tests"
@@ -56,6 +63,9 @@ class TalentTest(Base):
     cardio_endurance = Column(Float, nullable=True)  # 심폐지구력
     flexibility = Column(Float, nullable=True)  # 유연성
 
+    # Gemini 코멘트 생성 상태 (NULL: 코멘트 미요청)
+    comment_status = Column(Enum(CommentStatus), nullable=True)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
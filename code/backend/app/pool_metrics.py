@@ -0,0 +1,118 @@
+"""
+DB 커넥션 풀 계측
+- 커넥션 checkout 대기 시간 히스토그램
+- 사용 중 / overflow 커넥션 게이지
+- checkout 타임아웃 횟수
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Type
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+
+# checkout 대기 시간 히스토그램 구간 (ms, 상한 포함)
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """커넥션 풀 계측값 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+        self.checkouts = 0
+        self.wait_ms_sum = 0.0
+        self.wait_ms_max = 0.0
+        self.timeouts = 0
+        self.pool: Optional[Pool] = None
+
+    def observe_checkout(self, wait_ms: float) -> None:
+        index = len(CHECKOUT_BUCKETS_MS)
+        for i, upper in enumerate(CHECKOUT_BUCKETS_MS):
+            if wait_ms <= upper:
+                index = i
+                break
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.checkouts += 1
+            self.wait_ms_sum += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict:
+        """현재 게이지 + 누적 히스토그램"""
+        pool = self.pool
+        gauges = {}
+        if pool is not None and hasattr(pool, "checkedout"):
+            gauges = {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+            }
+
+        with self._lock:
+            buckets = {}
+            cumulative = 0
+            for upper, count in zip(CHECKOUT_BUCKETS_MS, self.bucket_counts):
+                cumulative += count
+                buckets[f"le_{upper}ms"] = cumulative
+            buckets["le_inf"] = cumulative + self.bucket_counts[-1]
+
+            return {
+                **gauges,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "checkout_wait_ms": {
+                    "avg": round(self.wait_ms_sum / self.checkouts, 3) if self.checkouts else 0.0,
+                    "max": round(self.wait_ms_max, 3),
+                    "buckets": buckets,
+                },
+            }
+
+
+def instrumented_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """
+    checkout 대기 시간을 측정하는 풀 클래스 생성
+
+    engine.dispose() 등으로 풀이 재생성되어도 같은 metrics를 공유하도록
+    클래스 속성으로 연결한다.
+    """
+
+    class InstrumentedPool(base):
+        _metrics = metrics
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._metrics.pool = self
+
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except exc.TimeoutError:
+                self._metrics.record_timeout()
+                raise
+            self._metrics.observe_checkout((time.perf_counter() - started) * 1000)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+sync_pool_metrics = PoolMetrics("sync")
+async_pool_metrics = PoolMetrics("async")
+
+
+def get_pool_metrics() -> Dict:
+    """동기/비동기 엔진 풀 계측값"""
+    return {
+        "sync": sync_pool_metrics.snapshot(),
+        "async": async_pool_metrics.snapshot(),
+    }
@@ -12,6 +12,15 @@ from app.models.user import User
 router = APIRouter()
 
 
+def _busy_exception() -> HTTPException:
+    """bcrypt 대기열 포화 시 응답 (back-pressure)"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"},
+    )
+
+
 class EmailCheckRequest(BaseModel):
     email: EmailStr
 
@@ -82,12 +91,20 @@ async def signup(request: SignupRequest, db: Session = Depends(get_db)):
             detail="이미 등록된 이메일입니다."
         )
 
+    # 비밀번호 해싱 (bcrypt 전용 스레드 풀, 대기 중 DB 커넥션 반환)
+    db.rollback()
+    try:
+        password_hash = await auth_service.hash_password_async(request.password)
+    except auth_service.PasswordHasherBusyError:
+        raise _busy_exception()
+
     # 사용자 생성
     user = auth_service.create_user(
         db=db,
         name=request.name,
         email=request.email,
         password=request.password,
+        password_hash=password_hash,
         role=request.role,
         school_or_org=request.school_or_org,
         region_sido=request.region_sido,
@@ -111,7 +128,10 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     - email: 이메일
     - password: 비밀번호
     """
-    user = auth_service.authenticate_user(db, request.email, request.password)
+    try:
+        user = await auth_service.authenticate_user_async(db, request.email, request.password)
+    except auth_service.PasswordHasherBusyError:
+        raise _busy_exception()
 
     if not user:
         raise HTTPException(
@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
-from app.database import get_db
-from app.schemas.program import FacilityStatsResponse, FacilityStatsListResponse
-from app.models.facility import FacilityStats
+from app.database import get_async_db
+from app.schemas.program import (
+    FacilityStatsResponse,
+    FacilityStatsListResponse,
+    FacilityResponse,
+    FacilityListResponse,
+    FacilityNearbyItem,
+    FacilityNearbyResponse,
+)
+from app.models.facility import Facility, FacilityStats
+from app.services.geo import area_conditions, find_nearby
 
 
 router = APIRouter()
@@ -12,7 +20,7 @@ router = APIRouter()
 
 @router.get("", response_model=FacilityStatsListResponse)
 async def get_facility_stats(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     region_sido: Optional[str] = Query(None, description="시/도 필터"),
     region_sigungu: Optional[str] = Query(None, description="시/군/구 필터"),
     base_ym: Optional[str] = Query(None, description="기준년월 필터 (예: 202507)"),
@@ -23,21 +31,23 @@ async def get_facility_stats(
 
     지역별 시설 수, 인구 수, 1인당 시설 수 등의 통계 데이터를 조회합니다.
     """
-    query = db.query(FacilityStats)
+    query = select(FacilityStats)
 
     # 필터 적용
     if region_sido:
-        query = query.filter(FacilityStats.region_sido == region_sido)
+        query = query.where(FacilityStats.region_sido == region_sido)
     if region_sigungu:
-        query = query.filter(FacilityStats.region_sigungu == region_sigungu)
+        query = query.where(FacilityStats.region_sigungu == region_sigungu)
     if base_ym:
-        query = query.filter(FacilityStats.base_ym == base_ym)
+        query = query.where(FacilityStats.base_ym == base_ym)
 
     # 총 개수
-    total = query.count()
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
     # 최신 데이터 우선
-    stats = query.order_by(FacilityStats.base_ym.desc()).limit(limit).all()
+    stats = (await db.scalars(
+        query.order_by(FacilityStats.base_ym.desc()).limit(limit)
+    )).all()
 
     return FacilityStatsListResponse(
         items=[FacilityStatsResponse.model_validate(s) for s in stats],
@@ -47,17 +57,19 @@ async def get_facility_stats(
 
 @router.get("/regions")
 async def get_facility_regions(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     시설 통계가 존재하는 지역 목록 조회
     """
-    regions = db.query(
-        FacilityStats.region_sido,
-        FacilityStats.region_sigungu
-    ).distinct().filter(
-        FacilityStats.region_sido.isnot(None)
-    ).order_by(FacilityStats.region_sido, FacilityStats.region_sigungu).limit(500).all()
+    regions = (await db.execute(
+        select(
+            FacilityStats.region_sido,
+            FacilityStats.region_sigungu
+        ).distinct().where(
+            FacilityStats.region_sido.isnot(None)
+        ).order_by(FacilityStats.region_sido, FacilityStats.region_sigungu).limit(500)
+    )).all()
 
     result = {}
     for sido, sigungu in regions:
@@ -71,7 +83,7 @@ async def get_facility_regions(
 
 @router.get("/summary")
 async def get_facility_summary(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     base_ym: Optional[str] = Query(None, description="기준년월 (미입력시 최신)"),
 ):
     """
@@ -81,11 +93,13 @@ async def get_facility_summary(
     """
     # 최신 기준년월 조회
     if not base_ym:
-        latest = db.query(func.max(FacilityStats.base_ym)).scalar()
+        latest = await db.scalar(select(func.max(FacilityStats.base_ym)))
         base_ym = latest if latest else "202507"
 
     # 해당 기준년월의 통계 집계
-    stats = db.query(FacilityStats).filter(FacilityStats.base_ym == base_ym).all()
+    stats = (await db.scalars(
+        select(FacilityStats).where(FacilityStats.base_ym == base_ym)
+    )).all()
 
     if not stats:
         return {
@@ -118,3 +132,106 @@ async def get_facility_summary(
         "avg_facility_per_person": round(avg_facility_per_person, 6),
         "by_sido": sido_summary,
     }
+
+
+def facility_query(
+    region_sido: Optional[str] = None,
+    region_sigungu: Optional[str] = None,
+    facility_type: Optional[str] = None,
+    industry_name: Optional[str] = None,
+):
+    """시설 조회 기본 쿼리 (지역/유형 필터, 인덱스 컬럼 일치 조건)"""
+    query = select(Facility)
+    if region_sido:
+        query = query.where(Facility.region_sido == region_sido)
+    if region_sigungu:
+        query = query.where(Facility.region_sigungu == region_sigungu)
+    if facility_type:
+        query = query.where(Facility.facility_type_name == facility_type)
+    if industry_name:
+        query = query.where(Facility.industry_name == industry_name)
+    return query
+
+
+@router.get("/search", response_model=FacilityListResponse)
+async def search_facilities(
+    db: AsyncSession = Depends(get_async_db),
+    region_sido: Optional[str] = Query(None, description="시/도 필터"),
+    region_sigungu: Optional[str] = Query(None, description="시/군/구 필터"),
+    facility_type: Optional[str] = Query(None, description="시설 구분 필터 (FCLTY_FLAG_NM)"),
+    industry_name: Optional[str] = Query(None, description="업종명 필터 (수영장, 체육관 등)"),
+    min_lat: Optional[float] = Query(None, ge=-90, le=90, description="영역 남쪽 위도"),
+    min_lon: Optional[float] = Query(None, ge=-180, le=180, description="영역 서쪽 경도"),
+    max_lat: Optional[float] = Query(None, ge=-90, le=90, description="영역 북쪽 위도"),
+    max_lon: Optional[float] = Query(None, ge=-180, le=180, description="영역 동쪽 경도"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    limit: int = Query(20, ge=1, le=100, description="페이지당 개수"),
+):
+    """
+    공공체육시설 검색
+
+    지역/시설 구분/업종 필터와 지도 영역(min_lat, min_lon, max_lat, max_lon)으로 시설을 조회합니다.
+    영역 조건은 geohash 인덱스로 영역을 덮는 구간만 조회한 뒤 위경도 범위로 거릅니다.
+    """
+    query = facility_query(region_sido, region_sigungu, facility_type, industry_name)
+
+    bbox = (min_lat, min_lon, max_lat, max_lon)
+    if any(value is not None for value in bbox):
+        if any(value is None for value in bbox):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="영역 검색에는 min_lat, min_lon, max_lat, max_lon이 모두 필요합니다."
+            )
+        if min_lat > max_lat or min_lon > max_lon:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="영역의 최솟값이 최댓값보다 클 수 없습니다."
+            )
+        query = query.where(*area_conditions(Facility, min_lat, min_lon, max_lat, max_lon))
+
+    # 총 개수
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+
+    facilities = (await db.scalars(
+        query.order_by(Facility.id).offset((page - 1) * limit).limit(limit)
+    )).all()
+
+    return FacilityListResponse(
+        items=[FacilityResponse.model_validate(f) for f in facilities],
+        total=total,
+        page=page,
+        limit=limit,
+    )
+
+
+@router.get("/nearby", response_model=FacilityNearbyResponse)
+async def get_nearby_facilities(
+    db: AsyncSession = Depends(get_async_db),
+    lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+    lon: float = Query(..., ge=-180, le=180, description="기준 경도"),
+    radius: int = Query(3000, ge=100, le=50000, description="검색 반경 (m)"),
+    facility_type: Optional[str] = Query(None, description="시설 구분 필터 (FCLTY_FLAG_NM)"),
+    industry_name: Optional[str] = Query(None, description="업종명 필터 (수영장, 체육관 등)"),
+    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+):
+    """
+    내 주변 공공체육시설 조회
+
+    geohash 인덱스로 반경을 덮는 영역만 조회한 뒤 대권 거리 기준 가까운 순으로 반환합니다.
+    """
+    query = facility_query(facility_type=facility_type, industry_name=industry_name)
+    nearby = await find_nearby(db, Facility, lat, lon, radius, limit, base_query=query)
+
+    return FacilityNearbyResponse(
+        items=[
+            FacilityNearbyItem(
+                **FacilityResponse.model_validate(f).model_dump(),
+                distance_m=round(distance, 1),
+            )
+            for f, distance in nearby
+        ],
+        total=len(nearby),
+        lat=lat,
+        lon=lon,
+        radius=radius,
+    )
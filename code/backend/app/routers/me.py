@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from pydantic import BaseModel, EmailStr, Field
-from app.database import get_db
-from app.dependencies import get_current_user
+from app.database import get_async_db
+from app.dependencies import get_current_user, invalidate_user_cache
 from app.models.user import User, UserRole
 from app.models.bookmark import Bookmark, Notification, TargetType
 from app.models.talent import TalentTest
@@ -34,7 +34,7 @@ router = APIRouter()
 
 @router.get("/overview", response_model=MyOverviewResponse)
 async def get_my_overview(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -43,37 +43,43 @@ async def get_my_overview(
     사용자의 전체 활동 요약 정보를 반환합니다.
     """
     # 재능 진단 통계
-    talent_test_count = db.query(TalentTest).filter(
-        TalentTest.user_id == current_user.id
-    ).count()
+    talent_test_count = await db.scalar(
+        select(func.count(TalentTest.id)).where(TalentTest.user_id == current_user.id)
+    )
 
-    latest_test = db.query(TalentTest).filter(
-        TalentTest.user_id == current_user.id
-    ).order_by(TalentTest.created_at.desc()).first()
+    latest_test = await db.scalar(
+        select(TalentTest).where(
+            TalentTest.user_id == current_user.id
+        ).order_by(TalentTest.created_at.desc()).limit(1)
+    )
 
     # 북마크 통계
-    bookmark_count = db.query(Bookmark).filter(
-        Bookmark.user_id == current_user.id
-    ).count()
+    bookmark_count = await db.scalar(
+        select(func.count(Bookmark.id)).where(Bookmark.user_id == current_user.id)
+    )
 
-    bookmark_by_type = db.query(
-        Bookmark.target_type,
-        func.count(Bookmark.id).label("count")
-    ).filter(
-        Bookmark.user_id == current_user.id
-    ).group_by(Bookmark.target_type).all()
+    bookmark_by_type = (await db.execute(
+        select(
+            Bookmark.target_type,
+            func.count(Bookmark.id).label("count")
+        ).where(
+            Bookmark.user_id == current_user.id
+        ).group_by(Bookmark.target_type)
+    )).all()
 
     bookmark_type_counts = {t.value: c for t, c in bookmark_by_type}
 
     # 알림 통계
-    notification_count = db.query(Notification).filter(
-        Notification.user_id == current_user.id
-    ).count()
+    notification_count = await db.scalar(
+        select(func.count(Notification.id)).where(Notification.user_id == current_user.id)
+    )
 
-    unread_count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False
-    ).count()
+    unread_count = await db.scalar(
+        select(func.count(Notification.id)).where(
+            Notification.user_id == current_user.id,
+            Notification.is_read == False
+        )
+    )
 
     return MyOverviewResponse(
         user={
@@ -104,7 +110,7 @@ async def get_my_overview(
 @router.put("/profile", response_model=UserResponse)
 async def update_profile(
     data: ProfileUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -121,15 +127,16 @@ async def update_profile(
     if data.region_sigungu is not None:
         current_user.region_sigungu = data.region_sigungu
 
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
+    invalidate_user_cache(current_user.id)
 
     return UserResponse.model_validate(current_user)
 
 
 @router.get("/bookmarks", response_model=BookmarkListResponse)
 async def get_my_bookmarks(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     target_type: Optional[TargetTypeEnum] = Query(None, description="대상 유형 필터"),
     limit: int = Query(50, ge=1, le=200, description="조회 개수"),
@@ -140,13 +147,16 @@ async def get_my_bookmarks(
 
     사용자가 저장한 북마크 목록을 반환합니다.
     """
-    query = db.query(Bookmark).filter(Bookmark.user_id == current_user.id)
+    conditions = [Bookmark.user_id == current_user.id]
 
     if target_type:
-        query = query.filter(Bookmark.target_type == target_type.value)
+        conditions.append(Bookmark.target_type == target_type.value)
 
-    total = query.count()
-    bookmarks = query.order_by(Bookmark.created_at.desc()).offset(offset).limit(limit).all()
+    total = await db.scalar(select(func.count(Bookmark.id)).where(*conditions))
+    bookmarks = (await db.scalars(
+        select(Bookmark).where(*conditions)
+        .order_by(Bookmark.created_at.desc()).offset(offset).limit(limit)
+    )).all()
 
     # 북마크된 대상의 상세 정보 조회
     items = []
@@ -155,7 +165,7 @@ async def get_my_bookmarks(
         target_detail = None
 
         if b.target_type == TargetType.program:
-            program = db.query(Program).filter(Program.id == b.target_id).first()
+            program = await db.get(Program, b.target_id)
             if program:
                 target_name = program.program_name
                 target_detail = f"{program.region_sido} {program.region_sigungu or ''}"
@@ -175,7 +185,7 @@ async def get_my_bookmarks(
 @router.post("/bookmarks", response_model=BookmarkResponse)
 async def create_bookmark(
     data: BookmarkCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -184,11 +194,13 @@ async def create_bookmark(
     프로그램, 시설 등을 북마크에 추가합니다.
     """
     # 중복 체크
-    existing = db.query(Bookmark).filter(
-        Bookmark.user_id == current_user.id,
-        Bookmark.target_type == data.target_type.value,
-        Bookmark.target_id == data.target_id,
-    ).first()
+    existing = await db.scalar(
+        select(Bookmark.id).where(
+            Bookmark.user_id == current_user.id,
+            Bookmark.target_type == data.target_type.value,
+            Bookmark.target_id == data.target_id,
+        ).limit(1)
+    )
 
     if existing:
         raise HTTPException(status_code=400, detail="이미 북마크된 항목입니다")
@@ -198,7 +210,7 @@ async def create_bookmark(
     target_detail = None
 
     if data.target_type == TargetTypeEnum.program:
-        program = db.query(Program).filter(Program.id == data.target_id).first()
+        program = await db.get(Program, data.target_id)
         if not program:
             raise HTTPException(status_code=404, detail="프로그램을 찾을 수 없습니다")
         target_name = program.program_name
@@ -210,8 +222,8 @@ async def create_bookmark(
         target_id=data.target_id,
     )
     db.add(bookmark)
-    db.commit()
-    db.refresh(bookmark)
+    await db.commit()
+    await db.refresh(bookmark)
 
     return BookmarkResponse(
         id=bookmark.id,
@@ -226,29 +238,31 @@ async def create_bookmark(
 @router.delete("/bookmarks/{bookmark_id}")
 async def delete_bookmark(
     bookmark_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     북마크 삭제
     """
-    bookmark = db.query(Bookmark).filter(
-        Bookmark.id == bookmark_id,
-        Bookmark.user_id == current_user.id,
-    ).first()
+    bookmark = await db.scalar(
+        select(Bookmark).where(
+            Bookmark.id == bookmark_id,
+            Bookmark.user_id == current_user.id,
+        )
+    )
 
     if not bookmark:
         raise HTTPException(status_code=404, detail="북마크를 찾을 수 없습니다")
 
-    db.delete(bookmark)
-    db.commit()
+    await db.delete(bookmark)
+    await db.commit()
 
     return {"message": "북마크가 삭제되었습니다", "id": bookmark_id}
 
 
 @router.get("/notifications", response_model=NotificationListResponse)
 async def get_my_notifications(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     unread_only: bool = Query(False, description="읽지 않은 알림만"),
     limit: int = Query(50, ge=1, le=200, description="조회 개수"),
@@ -257,18 +271,23 @@ async def get_my_notifications(
     """
     알림 목록 조회
     """
-    query = db.query(Notification).filter(Notification.user_id == current_user.id)
+    conditions = [Notification.user_id == current_user.id]
 
     if unread_only:
-        query = query.filter(Notification.is_read == False)
-
-    total = query.count()
-    unread_count = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False
-    ).count()
+        conditions.append(Notification.is_read == False)
+
+    total = await db.scalar(select(func.count(Notification.id)).where(*conditions))
+    unread_count = await db.scalar(
+        select(func.count(Notification.id)).where(
+            Notification.user_id == current_user.id,
+            Notification.is_read == False
+        )
+    )
 
-    notifications = query.order_by(Notification.created_at.desc()).offset(offset).limit(limit).all()
+    notifications = (await db.scalars(
+        select(Notification).where(*conditions)
+        .order_by(Notification.created_at.desc()).offset(offset).limit(limit)
+    )).all()
 
     return NotificationListResponse(
         items=[NotificationResponse.model_validate(n) for n in notifications],
@@ -280,39 +299,43 @@ async def get_my_notifications(
 @router.post("/notifications/{notification_id}/read")
 async def mark_notification_read(
     notification_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     알림 읽음 처리
     """
-    notification = db.query(Notification).filter(
-        Notification.id == notification_id,
-        Notification.user_id == current_user.id,
-    ).first()
+    notification = await db.scalar(
+        select(Notification).where(
+            Notification.id == notification_id,
+            Notification.user_id == current_user.id,
+        )
+    )
 
     if not notification:
         raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다")
 
     notification.is_read = True
-    db.commit()
+    await db.commit()
 
     return {"message": "알림이 읽음 처리되었습니다", "id": notification_id}
 
 
 @router.post("/notifications/read-all")
 async def mark_all_notifications_read(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     모든 알림 읽음 처리
     """
-    updated = db.query(Notification).filter(
-        Notification.user_id == current_user.id,
-        Notification.is_read == False,
-    ).update({"is_read": True})
-
-    db.commit()
+    updated = (await db.execute(
+        update(Notification).where(
+            Notification.user_id == current_user.id,
+            Notification.is_read == False,
+        ).values(is_read=True)
+    )).rowcount
+
+    await db.commit()
 
     return {"message": f"{updated}개의 알림이 읽음 처리되었습니다", "count": updated}
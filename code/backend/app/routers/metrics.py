@@ -0,0 +1,30 @@
+"""내부 운영 지표 API 라우터"""
+from fastapi import APIRouter, Depends
+from app.dependencies import get_auth_cache_stats, require_internal_token
+from app.pool_metrics import get_pool_metrics
+from app.services.auth_service import password_hasher
+from app.services.gemini_client import get_gemini_client_stats
+from app.services.comment_cache import get_comment_cache_stats
+from app.services.comment_worker import get_comment_queue_stats
+
+
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+
+@router.get("")
+async def get_internal_metrics():
+    """
+    내부 운영 지표
+
+    Gemini 클라이언트, 코멘트 대기열, 코멘트/인증 캐시 적중률,
+    bcrypt 스레드 풀 대기열, DB 커넥션 풀 상태를 반환합니다.
+    X-Internal-Token 헤더가 INTERNAL_METRICS_TOKEN과 일치해야 합니다.
+    """
+    return {
+        "gemini": get_gemini_client_stats(),
+        "comment_queue": get_comment_queue_stats(),
+        "comment_cache": get_comment_cache_stats(),
+        "auth_cache": get_auth_cache_stats(),
+        "password_hasher": password_hasher.stats(),
+        "db_pool": get_pool_metrics(),
+    }
@@ -1,76 +1,234 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from typing import Optional, List
-from app.database import get_db
-from app.schemas.program import ProgramResponse, ProgramListResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import select, func, or_, and_, null
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List, Dict
+from app.config import settings
+from app.database import get_async_db
+from app.schemas.program import (
+    ProgramResponse,
+    ProgramListResponse,
+    ProgramNearbyItem,
+    ProgramNearbyResponse,
+    ProgramFacetsResponse,
+)
 from app.models.program import Program
+from app.services.program_search import apply_program_search, search_dialect
+from app.services.geo import find_nearby
+from app.services.program_facets import compute_program_facets
+from app.services.pagination import (
+    SignatureCache,
+    InvalidCursorError,
+    filter_signature,
+    encode_cursor,
+    decode_cursor,
+    estimate_row_count,
+)
 
 
 router = APIRouter()
 
 
-@router.get("", response_model=ProgramListResponse)
-async def get_programs(
-    db: Session = Depends(get_db),
+# 필터 조합별 총 개수 캐시 (count_mode=cached)
+program_count_cache = SignatureCache(
+    max_size=settings.PROGRAM_COUNT_CACHE_SIZE,
+    ttl=settings.PROGRAM_COUNT_CACHE_TTL,
+)
+
+# 필터 조합별 패싯 집계 캐시
+program_facet_cache = SignatureCache(
+    max_size=settings.PROGRAM_COUNT_CACHE_SIZE,
+    ttl=settings.PROGRAM_FACET_CACHE_TTL,
+)
+
+
+def program_filter_params(
     region_sido: Optional[str] = Query(None, description="시/도 필터"),
     region_sigungu: Optional[str] = Query(None, description="시/군/구 필터"),
     program_type: Optional[str] = Query(None, description="프로그램 유형 필터"),
     target_group: Optional[str] = Query(None, description="대상 그룹 필터 (청소년, 성인 등)"),
     industry_name: Optional[str] = Query(None, description="업종명 필터 (수영장, 체육관 등)"),
     keyword: Optional[str] = Query(None, description="프로그램명 또는 시설명 검색"),
-    page: int = Query(1, ge=1, description="페이지 번호"),
+) -> Dict[str, Optional[str]]:
+    """Dependency: 프로그램 목록/패싯 공통 필터"""
+    return {
+        "region_sido": region_sido,
+        "region_sigungu": region_sigungu,
+        "program_type": program_type,
+        "target_group": target_group,
+        "industry_name": industry_name,
+        "keyword": keyword,
+    }
+
+
+async def build_program_query(db: AsyncSession, filters: Dict[str, Optional[str]]):
+    """
+    필터가 적용된 프로그램 쿼리 생성
+
+    Returns:
+        (쿼리, 관련도 점수 식 또는 None, 필터 조합 시그니처)
+    """
+    query = select(Program)
+
+    # 필터 적용
+    if filters["region_sido"]:
+        query = query.where(Program.region_sido == filters["region_sido"])
+    if filters["region_sigungu"]:
+        query = query.where(Program.region_sigungu == filters["region_sigungu"])
+
+    # 텍스트 필터/키워드 검색 (검색 인덱스 사용, 키워드가 있으면 관련도순)
+    dialect_name, fts_available = await search_dialect(db)
+    query, relevance = apply_program_search(
+        query,
+        dialect_name,
+        fts_available,
+        program_type=filters["program_type"],
+        target_group=filters["target_group"],
+        industry_name=filters["industry_name"],
+        keyword=filters["keyword"],
+    )
+
+    return query, relevance, filter_signature(filters)
+
+
+@router.get("", response_model=ProgramListResponse)
+async def get_programs(
+    db: AsyncSession = Depends(get_async_db),
+    filters: Dict[str, Optional[str]] = Depends(program_filter_params),
+    page: int = Query(1, ge=1, description="페이지 번호 (cursor 사용 시 무시)"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (무한 스크롤)"),
+    count_mode: str = Query(
+        "exact",
+        pattern="^(exact|cached|estimate|none)$",
+        description="총 개수 계산 방식 (exact: 매번 집계, cached: 캐시, estimate: 플래너 추정, none: 생략)",
+    ),
 ):
     """
     프로그램 목록 조회
 
     다양한 필터와 검색 조건으로 청소년/유아동 이용가능 프로그램을 조회합니다.
-    """
-    query = db.query(Program)
+    키워드 검색 시 관련도순, 그 외에는 최신 등록순으로 정렬합니다.
 
-    # 필터 적용
-    if region_sido:
-        query = query.filter(Program.region_sido == region_sido)
-    if region_sigungu:
-        query = query.filter(Program.region_sigungu == region_sigungu)
-    if program_type:
-        query = query.filter(Program.program_type.ilike(f"%{program_type}%"))
-    if target_group:
-        query = query.filter(Program.target_group.ilike(f"%{target_group}%"))
-    if industry_name:
-        query = query.filter(Program.industry_name.ilike(f"%{industry_name}%"))
-    if keyword:
-        query = query.filter(
-            (Program.program_name.ilike(f"%{keyword}%")) |
-            (Program.facility_name.ilike(f"%{keyword}%"))
-        )
+    cursor를 넘기면 OFFSET 대신 정렬 키 기준 키셋 페이지네이션을 사용하므로
+    페이지 깊이와 무관하게 일정한 비용으로 다음 페이지를 조회합니다.
+    """
+    query, relevance, signature = await build_program_query(db, filters)
 
     # 총 개수
-    total = query.count()
+    total, total_estimated = None, False
+    if count_mode == "estimate":
+        total = await estimate_row_count(db, query)
+        total_estimated = total is not None
+    if count_mode == "cached" or (count_mode == "estimate" and total is None):
+        total = program_count_cache.get(signature)
+    if count_mode != "none" and total is None:
+        total = await db.scalar(select(func.count()).select_from(query.subquery()))
+        if count_mode != "exact":
+            program_count_cache.set(signature, total)
+
+    # 정렬 (관련도 점수는 커서 생성을 위해 함께 조회)
+    if relevance is None:
+        page_query = query.add_columns(null().label("relevance"))
+        order_by = [Program.id.desc()]
+    else:
+        page_query = query.add_columns(relevance.label("relevance"))
+        order_by = [relevance.desc(), Program.id.desc()]
 
-    # 페이지네이션
-    offset = (page - 1) * limit
-    programs = query.order_by(Program.id.desc()).offset(offset).limit(limit).all()
+    # 페이지네이션 (다음 페이지 존재 여부 확인을 위해 1건 더 조회)
+    if cursor:
+        try:
+            last_id, last_rank = decode_cursor(cursor, signature)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if relevance is None or last_rank is None:
+            page_query = page_query.where(Program.id < last_id)
+        else:
+            page_query = page_query.where(or_(
+                relevance < last_rank,
+                and_(relevance == last_rank, Program.id < last_id),
+            ))
+    else:
+        page_query = page_query.offset((page - 1) * limit)
+
+    rows = (await db.execute(page_query.order_by(*order_by).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_program, last_rank = rows[-1]
+        next_cursor = encode_cursor(last_program.id, signature, last_rank)
 
     return ProgramListResponse(
-        items=[ProgramResponse.model_validate(p) for p in programs],
+        items=[ProgramResponse.model_validate(p) for p, _ in rows],
         total=total,
+        total_estimated=total_estimated,
         page=page,
         limit=limit,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/facets", response_model=ProgramFacetsResponse)
+async def get_program_facets(
+    db: AsyncSession = Depends(get_async_db),
+    filters: Dict[str, Optional[str]] = Depends(program_filter_params),
+):
+    """
+    프로그램 필터 패싯 조회
+
+    현재 필터 조합에서 시도/시군구/프로그램 유형/대상/업종별 프로그램 수를
+    한 번의 집계로 반환합니다. 결과는 필터 조합별로 캐시됩니다.
+    """
+    query, _, signature = await build_program_query(db, filters)
+
+    facets = program_facet_cache.get(signature)
+    if facets is None:
+        facets = await compute_program_facets(db, query)
+        program_facet_cache.set(signature, facets)
+
+    return ProgramFacetsResponse(**facets)
+
+
+@router.get("/nearby", response_model=ProgramNearbyResponse)
+async def get_nearby_programs(
+    db: AsyncSession = Depends(get_async_db),
+    lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+    lon: float = Query(..., ge=-180, le=180, description="기준 경도"),
+    radius: int = Query(3000, ge=100, le=50000, description="검색 반경 (m)"),
+    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+):
+    """
+    내 주변 프로그램 조회
+
+    geohash 인덱스로 반경을 덮는 영역만 조회한 뒤 대권 거리 기준 가까운 순으로 반환합니다.
+    """
+    nearby = await find_nearby(db, Program, lat, lon, radius, limit)
+
+    return ProgramNearbyResponse(
+        items=[
+            ProgramNearbyItem(
+                **ProgramResponse.model_validate(p).model_dump(),
+                distance_m=round(distance, 1),
+            )
+            for p, distance in nearby
+        ],
+        total=len(nearby),
+        lat=lat,
+        lon=lon,
+        radius=radius,
     )
 
 
 @router.get("/{program_id}", response_model=ProgramResponse)
 async def get_program_detail(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     프로그램 상세 조회
     """
-    program = db.query(Program).filter(Program.id == program_id).first()
+    program = await db.get(Program, program_id)
     if not program:
-        from fastapi import HTTPException, status
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="프로그램을 찾을 수 없습니다."
@@ -80,17 +238,19 @@ async def get_program_detail(
 
 @router.get("/regions/list")
 async def get_program_regions(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     프로그램이 존재하는 지역 목록 조회
     """
-    regions = db.query(
-        Program.region_sido,
-        Program.region_sigungu
-    ).distinct().filter(
-        Program.region_sido.isnot(None)
-    ).order_by(Program.region_sido, Program.region_sigungu).limit(500).all()
+    regions = (await db.execute(
+        select(
+            Program.region_sido,
+            Program.region_sigungu
+        ).distinct().where(
+            Program.region_sido.isnot(None)
+        ).order_by(Program.region_sido, Program.region_sigungu).limit(500)
+    )).all()
 
     result = {}
     for sido, sigungu in regions:
@@ -104,13 +264,15 @@ async def get_program_regions(
 
 @router.get("/types/list")
 async def get_program_types(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     프로그램 유형 목록 조회
     """
-    types = db.query(Program.program_type).distinct().filter(
-        Program.program_type.isnot(None)
-    ).limit(100).all()
+    types = (await db.execute(
+        select(Program.program_type).distinct().where(
+            Program.program_type.isnot(None)
+        ).limit(100)
+    )).all()
 
     return [t[0] for t in types if t[0]]
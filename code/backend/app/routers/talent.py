@@ -1,28 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
-from app.database import get_db
+from app.database import get_async_db
 from app.schemas.talent import (
     TalentTestRequest,
+    TalentBatchRequest,
+    TalentBatchResponse,
     TalentScoreResponse,
     TalentScoreItem,
     TalentTestListItem,
     TalentTestListResponse,
 )
-from app.models.talent import TalentTest, TalentScore, GradeLevel, Gender, DisabilityType
+from app.schemas.program import (
+    ProgramResponse,
+    ProgramRecommendationItem,
+    ProgramRecommendationResponse,
+    RecommendedSport,
+)
+from app.models.talent import TalentTest, TalentScore, GradeLevel, Gender, DisabilityType, CommentStatus
 from app.models.user import User
 from app.dependencies import get_current_user, get_current_user_optional
-from app.services.scoring_service import calculate_all_sport_scores
-from app.services.gemini_client import generate_talent_comment
+from app.services.scoring_service import (
+    calculate_all_sport_scores,
+    calculate_sport_scores_batch,
+    metrics_to_matrix,
+    SPORT_NAMES_KO,
+)
+from app.services.comment_worker import is_comment_enabled, enqueue_talent_comment
+from app.services.dashboard_service import increment_talent_test_count
+from app.services.recommendation_service import recommend_programs
 
 
 router = APIRouter()
 
 
+def _build_talent_test_values(request: TalentTestRequest, user_id: Optional[int]) -> dict:
+    """진단 요청을 TalentTest 컬럼 값으로 변환 (BMI 계산 포함)"""
+    bmi = None
+    if request.height and request.weight:
+        height_m = request.height / 100
+        bmi = round(request.weight / (height_m ** 2), 2)
+
+    return {
+        "user_id": user_id,
+        "age": request.age,
+        "grade": request.grade,
+        "gender": Gender(request.gender.value),
+        "region_sido": request.region_sido,
+        "region_sigungu": request.region_sigungu,
+        "disability_type": DisabilityType(request.disability_type.value) if request.disability_type else None,
+        "height": request.height,
+        "weight": request.weight,
+        "bmi": bmi,
+        "grip_strength": request.grip_strength,
+        "sit_ups": request.sit_ups,
+        "standing_long_jump": request.standing_long_jump,
+        "shuttle_run_20m": request.shuttle_run_20m,
+        "sit_and_reach": request.sit_and_reach,
+    }
+
+
 @router.post("/score", response_model=TalentScoreResponse, status_code=status.HTTP_201_CREATED)
 async def create_talent_score(
     request: TalentTestRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -31,33 +73,15 @@ async def create_talent_score(
     체력 측정 데이터를 입력받아 종목별 재능 점수를 계산합니다.
     로그인하지 않아도 사용 가능하며, 로그인 시 기록이 저장됩니다.
     """
-    # BMI 계산
-    bmi = None
-    if request.height and request.weight:
-        height_m = request.height / 100
-        bmi = round(request.weight / (height_m ** 2), 2)
-
-    # TalentTest 레코드 생성
+    # TalentTest 레코드 생성 (ID 확보를 위해 flush만 수행)
     talent_test = TalentTest(
-        user_id=current_user.id if current_user else None,
-        age=request.age,
-        grade=request.grade,
-        gender=Gender(request.gender.value),
-        region_sido=request.region_sido,
-        region_sigungu=request.region_sigungu,
-        disability_type=DisabilityType(request.disability_type.value) if request.disability_type else None,
-        height=request.height,
-        weight=request.weight,
-        bmi=bmi,
-        grip_strength=request.grip_strength,
-        sit_ups=request.sit_ups,
-        standing_long_jump=request.standing_long_jump,
-        shuttle_run_20m=request.shuttle_run_20m,
-        sit_and_reach=request.sit_and_reach,
+        **_build_talent_test_values(request, current_user.id if current_user else None)
     )
+    comment_status = CommentStatus.pending if is_comment_enabled() else None
+    talent_test.comment_status = comment_status
     db.add(talent_test)
-    db.commit()
-    db.refresh(talent_test)
+    await db.flush()
+    test_id = talent_test.id
 
     # 종목별 점수 계산 (장애 유형 및 성별 포함)
     sport_scores = calculate_all_sport_scores(
@@ -74,7 +98,7 @@ async def create_talent_score(
     score_items = []
     for score_data in sport_scores:
         talent_score = TalentScore(
-            talent_test_id=talent_test.id,
+            talent_test_id=test_id,
             sport=score_data["sport"],
             score=score_data["score"],
             percentile=score_data["percentile"],
@@ -88,12 +112,13 @@ async def create_talent_score(
             grade_level=score_data["grade_level"],
         ))
 
-    db.commit()
+    await db.run_sync(increment_talent_test_count)
+    await db.commit()
 
-    # Gemini로 코멘트 생성 (비동기, 실패해도 무시)
-    overall_comment = None
-    try:
-        overall_comment = await generate_talent_comment(
+    # Gemini 코멘트는 백그라운드 워커에서 생성 (응답 지연 없음)
+    if comment_status == CommentStatus.pending:
+        queued = enqueue_talent_comment(
+            test_id=test_id,
             scores=sport_scores,
             user_profile={
                 "age": request.age,
@@ -101,19 +126,92 @@ async def create_talent_score(
                 "region_sido": request.region_sido,
             }
         )
-    except Exception:
-        pass
+        if not queued:
+            comment_status = CommentStatus.failed
+            await db.execute(
+                update(TalentTest).where(TalentTest.id == test_id).values(comment_status=comment_status)
+            )
+            await db.commit()
 
     return TalentScoreResponse(
-        test_id=talent_test.id,
+        test_id=test_id,
         scores=score_items,
-        comment=overall_comment,
+        comment_status=comment_status.value if comment_status else None,
     )
 
 
+@router.post("/score/batch", response_model=TalentBatchResponse, status_code=status.HTTP_201_CREATED)
+async def create_talent_scores_batch(
+    batch: TalentBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    재능 진단 일괄 API
+
+    학급 명단 단위로 여러 학생의 체력 측정 데이터를 한 번에 진단합니다.
+    모든 TalentTest/TalentScore 레코드는 하나의 트랜잭션에서 일괄 삽입되며,
+    응답은 요청 순서와 동일한 순서로 학생별 결과를 반환합니다.
+    대량 처리를 위해 Gemini 코멘트는 생성하지 않습니다.
+    """
+    requests = batch.tests
+    user_id = current_user.id if current_user else None
+
+    # 종목별 점수 일괄 계산
+    sport_scores_list = calculate_sport_scores_batch(
+        metrics_to_matrix([r.model_dump() for r in requests]),
+        genders=[r.gender.value for r in requests],
+        disability_types=[r.disability_type.value if r.disability_type else None for r in requests],
+    )
+
+    try:
+        # TalentTest 일괄 삽입 (요청 순서대로 ID 반환)
+        test_ids = (await db.execute(
+            insert(TalentTest).returning(TalentTest.id, sort_by_parameter_order=True),
+            [_build_talent_test_values(r, user_id) for r in requests],
+        )).scalars().all()
+
+        # TalentScore 일괄 삽입
+        score_rows = [
+            {
+                "talent_test_id": test_id,
+                "sport": score_data["sport"],
+                "score": score_data["score"],
+                "percentile": score_data["percentile"],
+                "grade_level": GradeLevel(score_data["grade_level"]),
+            }
+            for test_id, sport_scores in zip(test_ids, sport_scores_list)
+            for score_data in sport_scores
+        ]
+        await db.execute(insert(TalentScore), score_rows)
+        await db.run_sync(increment_talent_test_count, len(test_ids))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    items = [
+        TalentScoreResponse(
+            test_id=test_id,
+            scores=[
+                TalentScoreItem(
+                    sport=score_data["sport"],
+                    score=score_data["score"],
+                    percentile=score_data["percentile"],
+                    grade_level=score_data["grade_level"],
+                )
+                for score_data in sport_scores
+            ],
+        )
+        for test_id, sport_scores in zip(test_ids, sport_scores_list)
+    ]
+
+    return TalentBatchResponse(items=items, total=len(items))
+
+
 @router.get("/tests", response_model=TalentTestListResponse)
 async def get_talent_tests(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     limit: int = 10,
     offset: int = 0,
@@ -124,21 +222,25 @@ async def get_talent_tests(
     로그인한 사용자의 체력 측정 기록과 상위 3개 종목 점수를 반환합니다.
     """
     # 총 개수 조회
-    total = db.query(TalentTest).filter(
-        TalentTest.user_id == current_user.id
-    ).count()
+    total = await db.scalar(
+        select(func.count(TalentTest.id)).where(TalentTest.user_id == current_user.id)
+    )
 
     # 테스트 목록 조회
-    tests = db.query(TalentTest).filter(
-        TalentTest.user_id == current_user.id
-    ).order_by(TalentTest.created_at.desc()).offset(offset).limit(limit).all()
+    tests = (await db.scalars(
+        select(TalentTest).where(
+            TalentTest.user_id == current_user.id
+        ).order_by(TalentTest.created_at.desc()).offset(offset).limit(limit)
+    )).all()
 
     items = []
     for test in tests:
         # 상위 3개 점수 조회
-        top_scores = db.query(TalentScore).filter(
-            TalentScore.talent_test_id == test.id
-        ).order_by(TalentScore.score.desc()).limit(3).all()
+        top_scores = (await db.scalars(
+            select(TalentScore).where(
+                TalentScore.talent_test_id == test.id
+            ).order_by(TalentScore.score.desc()).limit(3)
+        )).all()
 
         items.append(TalentTestListItem(
             id=test.id,
@@ -168,15 +270,18 @@ async def get_talent_tests(
 @router.get("/tests/{test_id}", response_model=TalentScoreResponse)
 async def get_talent_test_detail(
     test_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """
     특정 테스트 상세 조회
 
     테스트 ID로 상세 결과를 조회합니다.
+    Gemini 코멘트는 백그라운드에서 생성되므로 comment_status가
+    pending인 동안 이 API를 폴링하여 완료 여부를 확인할 수 있습니다.
+    서버 종료나 장애로 처리되지 못한 코멘트는 failed로 바뀌므로 폴링은 항상 끝납니다.
     """
-    test = db.query(TalentTest).filter(TalentTest.id == test_id).first()
+    test = await db.get(TalentTest, test_id)
 
     if not test:
         raise HTTPException(
@@ -191,9 +296,11 @@ async def get_talent_test_detail(
             detail="접근 권한이 없습니다."
         )
 
-    scores = db.query(TalentScore).filter(
-        TalentScore.talent_test_id == test_id
-    ).order_by(TalentScore.score.desc()).all()
+    scores = (await db.scalars(
+        select(TalentScore).where(
+            TalentScore.talent_test_id == test_id
+        ).order_by(TalentScore.score.desc())
+    )).all()
 
     return TalentScoreResponse(
         test_id=test.id,
@@ -207,4 +314,83 @@ async def get_talent_test_detail(
             )
             for s in scores
         ],
+        comment=scores[0].comment if scores else None,
+        comment_status=test.comment_status.value if test.comment_status else None,
+    )
+
+
+@router.get("/tests/{test_id}/programs", response_model=ProgramRecommendationResponse)
+async def get_recommended_programs(
+    test_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
+    lat: Optional[float] = Query(None, ge=-90, le=90, description="기준 위도 (미입력시 진단 지역 기준)"),
+    lon: Optional[float] = Query(None, ge=-180, le=180, description="기준 경도"),
+    radius: int = Query(5000, ge=100, le=50000, description="검색 반경 (m)"),
+    top: int = Query(3, ge=1, le=8, description="추천에 사용할 상위 종목 수"),
+    limit: int = Query(20, ge=1, le=100, description="조회 개수"),
+):
+    """
+    재능 기반 프로그램 추천
+
+    진단 결과의 상위 종목(패럴림픽 종목 포함)에 해당하는 프로그램을
+    가까운 순(위치 지정 시) 또는 진단 지역 기준으로 추천합니다.
+    """
+    if (lat is None) != (lon is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="lat과 lon은 함께 입력해야 합니다."
+        )
+
+    test = await db.get(TalentTest, test_id)
+    if not test:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="테스트를 찾을 수 없습니다."
+        )
+
+    # 로그인한 사용자의 테스트인지 확인 (비로그인 테스트도 조회 가능)
+    if test.user_id and current_user and test.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="접근 권한이 없습니다."
+        )
+
+    top_scores = (await db.scalars(
+        select(TalentScore).where(
+            TalentScore.talent_test_id == test_id
+        ).order_by(TalentScore.score.desc()).limit(top)
+    )).all()
+    sports = [s.sport for s in top_scores]
+
+    recommendations = await recommend_programs(
+        db,
+        sports,
+        limit,
+        lat=lat,
+        lon=lon,
+        radius_m=radius,
+        region_sido=test.region_sido,
+        region_sigungu=test.region_sigungu,
+    )
+
+    return ProgramRecommendationResponse(
+        test_id=test_id,
+        sports=[
+            RecommendedSport(
+                sport=s.sport,
+                sport_name_ko=SPORT_NAMES_KO.get(s.sport, s.sport),
+                score=s.score,
+            )
+            for s in top_scores
+        ],
+        items=[
+            ProgramRecommendationItem(
+                **ProgramResponse.model_validate(program).model_dump(),
+                matched_sports=matched,
+                distance_m=round(distance, 1) if distance is not None else None,
+            )
+            for program, matched, distance in recommendations
+        ],
+        total=len(recommendations),
     )
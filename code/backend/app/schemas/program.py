@@ -32,9 +32,62 @@ class ProgramResponse(BaseModel):
 class ProgramListResponse(BaseModel):
     """프로그램 목록 응답"""
     items: List[ProgramResponse]
-    total: int
+    total: Optional[int] = None  # count_mode=none이면 None
+    total_estimated: bool = False  # 추정치 여부 (count_mode=estimate)
     page: int
     limit: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
+class ProgramNearbyItem(ProgramResponse):
+    """위치 기반 프로그램 항목"""
+    distance_m: float  # 기준 위치로부터의 대권 거리 (m)
+
+
+class ProgramNearbyResponse(BaseModel):
+    """위치 기반 프로그램 목록 응답 (가까운 순)"""
+    items: List[ProgramNearbyItem]
+    total: int
+    lat: float
+    lon: float
+    radius: int
+
+
+class RecommendedSport(BaseModel):
+    """추천 기준 종목 (진단 상위 종목)"""
+    sport: str
+    sport_name_ko: str
+    score: float
+
+
+class ProgramRecommendationItem(ProgramResponse):
+    """재능 기반 추천 프로그램 항목"""
+    matched_sports: List[str]  # 프로그램이 해당하는 추천 종목 (진단 점수 순)
+    distance_m: Optional[float] = None  # 위치를 지정한 경우 거리 (m)
+
+
+class ProgramRecommendationResponse(BaseModel):
+    """재능 기반 프로그램 추천 응답"""
+    test_id: int
+    sports: List[RecommendedSport]
+    items: List[ProgramRecommendationItem]
+    total: int
+
+
+class FacetItem(BaseModel):
+    """패싯 값별 프로그램 수"""
+    value: str
+    count: int
+    region_sido: Optional[str] = None  # region_sigungu 패싯에서만 사용
+
+
+class ProgramFacetsResponse(BaseModel):
+    """프로그램 필터 패싯 응답 (현재 필터 조합 기준, 건수 내림차순)"""
+    region_sido: List[FacetItem]
+    region_sigungu: List[FacetItem]
+    program_type: List[FacetItem]
+    target_group: List[FacetItem]
+    industry_name: List[FacetItem]
 
 
 class FacilityStatsResponse(BaseModel):
@@ -56,3 +109,44 @@ class FacilityStatsListResponse(BaseModel):
     """시설 통계 목록 응답"""
     items: List[FacilityStatsResponse]
     total: int
+
+
+class FacilityResponse(BaseModel):
+    """시설 응답"""
+    id: int
+    name: str
+    facility_type_name: Optional[str] = None
+    industry_name: Optional[str] = None
+    region_sido: Optional[str] = None
+    region_sigungu: Optional[str] = None
+    emd_name: Optional[str] = None
+    address: Optional[str] = None
+    phone: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    homepage_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class FacilityListResponse(BaseModel):
+    """시설 목록 응답"""
+    items: List[FacilityResponse]
+    total: int
+    page: int
+    limit: int
+
+
+class FacilityNearbyItem(FacilityResponse):
+    """위치 기반 시설 항목"""
+    distance_m: float  # 기준 위치로부터의 대권 거리 (m)
+
+
+class FacilityNearbyResponse(BaseModel):
+    """위치 기반 시설 목록 응답 (가까운 순)"""
+    items: List[FacilityNearbyItem]
+    total: int
+    lat: float
+    lon: float
+    radius: int
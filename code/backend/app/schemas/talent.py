@@ -75,11 +75,23 @@ class TalentScoreResponse(BaseModel):
     test_id: int
     scores: List[TalentScoreItem]
     comment: Optional[str] = None  # 전체 코멘트 (Gemini 생성)
+    comment_status: Optional[str] = None  # 코멘트 생성 상태 (pending/completed/failed)
 
     class Config:
         from_attributes = True
 
 
+class TalentBatchRequest(BaseModel):
+    """재능 진단 일괄 요청 (학급 명단 단위)"""
+    tests: List[TalentTestRequest] = Field(..., min_length=1, max_length=1000, description="진단 요청 목록")
+
+
+class TalentBatchResponse(BaseModel):
+    """재능 진단 일괄 응답 (요청 순서와 동일)"""
+    items: List[TalentScoreResponse]
+    total: int
+
+
 class TalentTestListItem(BaseModel):
     """테스트 목록 아이템"""
     id: int
@@ -0,0 +1,114 @@
+"""
+로그인 폭주 중 /health 응답 지연 측정 벤치마크
+
+수업 시작 시점처럼 로그인 요청이 몰릴 때 bcrypt가 이벤트 루프를
+막지 않는지 확인합니다. 실행 중인 서버와 테스트 계정이 필요합니다.
+(python -m app.scripts.create_accounts)
+
+usage: python -m app.scripts.bench_login_storm [--base-url URL] [--logins N] [--concurrency C]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+
+
+def summarize(latencies_ms):
+    """지연 시간 요약 (p50/p95/p99/max)"""
+    if not latencies_ms:
+        return "no samples"
+    ordered = sorted(latencies_ms)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    return (
+        f"n={len(ordered)} p50={statistics.median(ordered):.1f}ms "
+        f"p95={pct(0.95):.1f}ms p99={pct(0.99):.1f}ms max={ordered[-1]:.1f}ms"
+    )
+
+
+async def probe_health(client, stop_event, latencies_ms, interval):
+    """stop_event가 설정될 때까지 /health 지연 측정"""
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        await client.get("/health")
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+
+
+async def login_storm(client, email, password, logins, concurrency, status_counts):
+    """동시 로그인 요청 발생"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login():
+        async with semaphore:
+            response = await client.post("/api/auth/login", json={"email": email, "password": password})
+            status_counts[response.status_code] = status_counts.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*[login() for _ in range(logins)])
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.concurrency + 4)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60.0, limits=limits) as client:
+        # 1. 유휴 상태 기준선
+        idle_latencies = []
+        stop_event = asyncio.Event()
+        probe = asyncio.create_task(probe_health(client, stop_event, idle_latencies, args.interval))
+        await asyncio.sleep(args.baseline_seconds)
+        stop_event.set()
+        await probe
+
+        # 2. 로그인 폭주 중 측정
+        storm_latencies = []
+        status_counts = {}
+        stop_event = asyncio.Event()
+        probe = asyncio.create_task(probe_health(client, stop_event, storm_latencies, args.interval))
+        started = time.perf_counter()
+        await login_storm(client, args.email, args.password, args.logins, args.concurrency, status_counts)
+        elapsed = time.perf_counter() - started
+        stop_event.set()
+        await probe
+
+        metrics = None
+        try:
+            response = await client.get("/internal/metrics")
+            if response.status_code == 200:
+                metrics = response.json().get("password_hasher")
+        except httpx.HTTPError:
+            pass
+
+    print("=" * 60)
+    print(f"Target: {args.base_url}")
+    print(f"Logins: {args.logins} (concurrency {args.concurrency}) in {elapsed:.2f}s "
+          f"-> {args.logins / elapsed:.1f} logins/sec")
+    print(f"Login status codes: {status_counts}")
+    print(f"/health idle:        {summarize(idle_latencies)}")
+    print(f"/health during storm: {summarize(storm_latencies)}")
+    if metrics:
+        print(f"bcrypt pool: {metrics}")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure /health latency during a login storm")
+    parser.add_argument("--base-url", default="http://localhost:10000", help="API base URL")
+    parser.add_argument("--email", default="user@suminjae.com", help="Login email")
+    parser.add_argument("--password", default="User1234!", help="Login password")
+    parser.add_argument("--logins", type=int, default=200, help="Total login requests")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent login requests")
+    parser.add_argument("--interval", type=float, default=0.02, help="Seconds between /health probes")
+    parser.add_argument("--baseline-seconds", type=float, default=2.0, help="Idle baseline duration")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
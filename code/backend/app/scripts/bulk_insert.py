@@ -0,0 +1,73 @@
+"""
+대량 적재 도구
+- PostgreSQL: COPY FROM STDIN (CSV 스트림)
+- 그 외 (SQLite): executemany 일괄 INSERT
+
+DataFrame 컬럼 이름은 대상 테이블 컬럼 이름과 같아야 합니다.
+정수 컬럼은 pandas nullable Int64로 넘겨야 COPY에서 "12.0" 형태가 되지 않습니다.
+DataFrame에 없는 컬럼은 COPY/INSERT 모두 server_default가 적용됩니다.
+
+COPY CSV 규칙: 결측은 따옴표 없는 \\N, 빈 문자열은 빈 필드(NULL 아님),
+따옴표/쉼표/줄바꿈이 든 값은 따옴표로 감쌈. 문자열 값 자체가 \\N이면
+NULL과 구분할 수 없으므로 그 DataFrame은 INSERT로 적재합니다.
+점검: python -m app.scripts.check_copy_roundtrip
+"""
+
+import io
+from typing import List, Dict, Any
+import pandas as pd
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+
+# COPY CSV의 NULL 표기
+COPY_NULL = "\\N"
+
+
+def dataframe_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """DataFrame → executemany용 dict 리스트 (결측값은 None)"""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def has_null_marker(df: pd.DataFrame) -> bool:
+    """문자열 컬럼에 COPY NULL 표기와 같은 값이 있는지 확인"""
+    for name in df.columns:
+        column = df[name]
+        if column.dtype == object or isinstance(column.dtype, pd.StringDtype):
+            if column.eq(COPY_NULL).any():
+                return True
+    return False
+
+
+def copy_dataframe(db: Session, table: Table, df: pd.DataFrame) -> int:
+    """PostgreSQL COPY FROM STDIN으로 적재 (psycopg 3 / psycopg2 모두 지원)"""
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, na_rep=COPY_NULL, lineterminator="\n")
+    buffer.seek(0)
+
+    columns = ", ".join(f'"{name}"' for name in df.columns)
+    sql = f"COPY {table.name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+
+    cursor = db.connection().connection.cursor()
+    try:
+        if hasattr(cursor, "copy"):
+            # psycopg 3
+            with cursor.copy(sql) as copy:
+                while data := buffer.read(1 << 20):
+                    copy.write(data)
+        else:
+            # psycopg2
+            cursor.copy_expert(sql, buffer)
+    finally:
+        cursor.close()
+    return len(df)
+
+
+def insert_dataframe(db: Session, table: Table, df: pd.DataFrame) -> int:
+    """DB 종류에 맞는 가장 빠른 방식으로 DataFrame 적재 (호출 측에서 commit)"""
+    if df.empty:
+        return 0
+    if db.get_bind().dialect.name == "postgresql" and not has_null_marker(df):
+        return copy_dataframe(db, table, df)
+    db.execute(insert(table), dataframe_records(df))
+    return len(df)
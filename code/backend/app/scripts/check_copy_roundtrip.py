@@ -0,0 +1,119 @@
+"""
+대량 적재(insert_dataframe) 왕복 점검
+
+까다로운 값(NULL과 빈 문자열, 따옴표/쉼표/줄바꿈, 문자열 \\N, 정수/실수/날짜 결측)을
+임시 테이블에 적재한 뒤 다시 읽어 원래 값과 같은지, DataFrame에 없는 컬럼에
+server_default가 채워졌는지 확인합니다. PostgreSQL이면 COPY 경로와 문자열 \\N이 있을 때의
+INSERT 대체 경로를 점검하고, 그 외 DB에서는 INSERT 경로만 점검합니다. 불일치가 있으면 종료 코드 1.
+
+usage: DATABASE_URL=postgresql+psycopg://... python -m app.scripts.check_copy_roundtrip
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import datetime
+import math
+from typing import List
+import pandas as pd
+from sqlalchemy import (
+    Column, Date, DateTime, Float, Integer, MetaData, String, Table, Text, func, select, text,
+)
+from app.database import SessionLocal
+from app.scripts.bulk_insert import COPY_NULL, dataframe_records, insert_dataframe
+
+
+# 값 컬럼 (DataFrame에 포함) + server_default 컬럼 (DataFrame에서 제외)
+VALUE_COLUMNS = ("label", "note", "count", "score", "day")
+
+
+def roundtrip_table(name: str) -> Table:
+    return Table(
+        name,
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("label", String(50)),
+        Column("note", Text),
+        Column("count", Integer),
+        Column("score", Float),
+        Column("day", Date),
+        Column("status", String(20), server_default=text("'new'")),
+        Column("created_at", DateTime(timezone=True), server_default=func.now()),
+        prefixes=["TEMPORARY"],
+    )
+
+
+def sample_frame(include_null_marker: bool) -> pd.DataFrame:
+    notes = [
+        None,
+        "",
+        " ",
+        'say "hi"',
+        "a,b",
+        "line1\nline2",
+        "crlf\r\nend",
+        "tab\there",
+        "back\\slash",
+        "한글 값",
+    ]
+    if include_null_marker:
+        notes.append(COPY_NULL)
+    rows = len(notes)
+    return pd.DataFrame({
+        "label": [f"row{i}" for i in range(rows)],
+        "note": pd.Series(notes, dtype=object),
+        "count": pd.array([None if i % 3 == 0 else i * 10 for i in range(rows)], dtype="Int64"),
+        "score": [math.nan if i % 4 == 1 else i / 3 for i in range(rows)],
+        "day": [None if i % 5 == 2 else datetime.date(2024, 1, 1 + i) for i in range(rows)],
+    })
+
+
+def compare(label: str, df: pd.DataFrame, rows) -> List[str]:
+    """다시 읽은 행과 원래 값 비교 → 불일치 설명 목록"""
+    problems = []
+    if len(rows) != len(df):
+        return [f"{label}: {len(rows)} rows read back, expected {len(df)}"]
+    for expected, row in zip(dataframe_records(df), rows):
+        for column in VALUE_COLUMNS:
+            # 결측은 dataframe_records에서 None으로 바뀌므로 값 그대로 비교 (실수도 정확히 일치해야 함)
+            if expected[column] != getattr(row, column):
+                problems.append(
+                    f"{label} {expected['label']}.{column}: expected {expected[column]!r}, got {getattr(row, column)!r}"
+                )
+        if row.status != "new" or row.created_at is None:
+            problems.append(f"{label} {expected['label']}: server_default not applied ({row.status!r}, {row.created_at!r})")
+    return problems
+
+
+def roundtrip(db, name: str, df: pd.DataFrame) -> List[str]:
+    table = roundtrip_table(name)
+    table.create(db.connection())
+    try:
+        insert_dataframe(db, table, df)
+        rows = db.execute(select(table).order_by(table.c.id)).all()
+    finally:
+        table.drop(db.connection())
+    return compare(name, df, rows)
+
+
+def main() -> int:
+    db = SessionLocal()
+    try:
+        if db.get_bind().dialect.name != "postgresql":
+            print("COPY path skipped (not PostgreSQL)")
+        # 문자열 \N이 없는 프레임은 COPY, 있는 프레임은 INSERT로 적재됨 (PostgreSQL)
+        problems = roundtrip(db, "roundtrip_copy", sample_frame(include_null_marker=False))
+        problems += roundtrip(db, "roundtrip_marker", sample_frame(include_null_marker=True))
+        db.rollback()
+    finally:
+        db.close()
+
+    for problem in problems:
+        print(f"MISMATCH {problem}")
+    print("OK" if not problems else f"{len(problems)} mismatches")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
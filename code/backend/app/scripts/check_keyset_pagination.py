@@ -0,0 +1,102 @@
+"""
+프로그램 목록 키셋 페이지네이션 점검
+
+관련도 점수가 같은 행이 페이지 경계에 걸쳐도 커서로 넘긴 페이지들이
+OFFSET 한 번에 조회한 결과와 같은 순서/같은 행인지 확인합니다 (중복/누락 없음).
+설정된 DATABASE_URL(PostgreSQL 또는 SQLite)에 점검용 프로그램을 넣고 끝나면 삭제합니다.
+
+usage: python -m app.scripts.check_keyset_pagination [--rows N] [--limit L]
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import argparse
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from app.database import SessionLocal
+from app.main import app
+from app.models.program import Program
+from app.services.program_search import rebuild_search_index
+
+
+# 관련도 점수가 그룹마다 같아지도록 이름 형식을 몇 가지만 사용
+NAME_FORMATS = ("{marker}", "{marker} 수영", "{marker} 수영 교실", "초등 {marker} 농구 교실")
+
+
+def seed_programs(marker: str, rows: int) -> None:
+    """점검용 프로그램 삽입 (같은 이름 그룹 = 같은 관련도)"""
+    db = SessionLocal()
+    try:
+        db.add_all([
+            Program(
+                program_name=NAME_FORMATS[i % len(NAME_FORMATS)].format(marker=marker),
+                facility_name=f"{marker} 체육관",
+                region_sido="점검",
+            )
+            for i in range(rows)
+        ])
+        db.flush()
+        rebuild_search_index(db)
+        db.commit()
+    finally:
+        db.close()
+
+
+def remove_programs(marker: str) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Program).where(Program.facility_name == f"{marker} 체육관"))
+        rebuild_search_index(db)
+        db.commit()
+    finally:
+        db.close()
+
+
+def walk_pages(client: TestClient, params: dict, limit: int):
+    """next_cursor를 따라 모든 페이지의 id 목록 반환"""
+    ids, cursor = [], None
+    while True:
+        page_params = {**params, "limit": limit, "count_mode": "none"}
+        if cursor:
+            page_params["cursor"] = cursor
+        response = client.get("/api/programs", params=page_params)
+        response.raise_for_status()
+        body = response.json()
+        ids.extend(item["id"] for item in body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            return ids
+
+
+def check(rows: int, limit: int) -> bool:
+    marker = f"keyset{uuid.uuid4().hex[:8]}"
+    seed_programs(marker, rows)
+    try:
+        client = TestClient(app)
+        params = {"keyword": marker, "region_sido": "점검"}
+        expected = [
+            item["id"]
+            for item in client.get("/api/programs", params={**params, "limit": 100}).json()["items"]
+        ]
+        paged = walk_pages(client, params, limit)
+    finally:
+        remove_programs(marker)
+
+    duplicates = len(paged) - len(set(paged))
+    missing = set(expected) - set(paged)
+    print(f"rows={rows} limit={limit} pages={-(-len(paged) // limit)} "
+          f"fetched={len(paged)} duplicates={duplicates} missing={len(missing)}")
+    ok = len(expected) == rows and paged == expected
+    print("OK" if ok else "MISMATCH: cursor pages differ from single-page order")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=40, help="점검용 프로그램 수 (최대 100)")
+    parser.add_argument("--limit", type=int, default=7, help="페이지 크기 (동점 그룹이 경계에 걸치도록 작게)")
+    args = parser.parse_args()
+    sys.exit(0 if check(min(args.rows, 100), args.limit) else 1)
@@ -0,0 +1,82 @@
+"""
+분할 파일 적재 체크포인트 (load_checkpoints)
+
+- 배치를 적재할 때 같은 트랜잭션에서 (분할 파일, 적재 완료 행 수)를 갱신하므로
+  commit된 배치와 체크포인트가 항상 일치함 (중단 후 --resume 시 중복 적재 없음)
+- 분할 파일마다 배치가 순서대로 commit된다고 가정 (병렬 적재는 파일별로 writer 고정)
+- 분할 파일 내용 해시를 함께 저장하고, 재개 시 파일이 바뀌었거나 없어졌으면
+  체크포인트를 버리고 전체 재적재 (바뀐 파일의 앞부분을 건너뛰어 옛/새 데이터가 섞이지 않게 함)
+- 적재가 끝나면 마무리 트랜잭션 안에서 체크포인트 삭제
+"""
+
+import os
+from typing import Dict, List
+from sqlalchemy import delete, inspect, select, update
+from sqlalchemy.orm import Session
+from app.models.dataset import LoadCheckpoint
+from app.scripts.csv_cache import file_fingerprint
+
+
+checkpoints = LoadCheckpoint.__table__
+
+
+class ShardCheckpoints:
+    """데이터셋 하나의 분할 파일별 체크포인트"""
+
+    def __init__(self, name: str, target_table: str):
+        self.name = name
+        self.target_table = target_table
+
+    def saved(self, db: Session, data_files: List[str]) -> Dict[str, int]:
+        """
+        이전 실행의 분할 파일별 적재 완료 행 수 (파일 이름 → 행 수)
+
+        체크포인트의 분할 파일이 data_files에 없거나 내용 해시가 다르면 빈 dict를 반환하므로
+        호출 측은 전체 재적재합니다. 적재 대상 테이블이 다르면 (shadow 여부가 바뀐 경우 등) ValueError.
+        """
+        rows = db.execute(
+            select(
+                checkpoints.c.shard_file,
+                checkpoints.c.rows_done,
+                checkpoints.c.target_table,
+                checkpoints.c.shard_fingerprint,
+            )
+            .where(checkpoints.c.name == self.name)
+        ).all()
+        targets = {row.target_table for row in rows}
+        if targets and targets != {self.target_table}:
+            raise ValueError(
+                f"Checkpoint for {self.name} was written to {', '.join(sorted(targets))}, "
+                f"not {self.target_table} (resume with the same --shadow setting)"
+            )
+        if rows and not inspect(db.connection()).has_table(self.target_table):
+            raise ValueError(f"Checkpoint target table {self.target_table} no longer exists")
+
+        paths = {os.path.basename(path): path for path in data_files}
+        for row in rows:
+            path = paths.get(row.shard_file)
+            if path is None or row.shard_fingerprint != file_fingerprint(path):
+                print(f"Checkpoint for {self.name} is stale ({row.shard_file} changed or missing)")
+                return {}
+        return {row.shard_file: row.rows_done for row in rows}
+
+    def advance(self, db: Session, data_path: str, rows: int) -> None:
+        """분할 파일 적재 위치 전진 (commit하지 않음, 배치 적재와 같은 트랜잭션에서 호출)"""
+        shard_file = os.path.basename(data_path)
+        updated = db.execute(
+            update(checkpoints)
+            .where(checkpoints.c.name == self.name, checkpoints.c.shard_file == shard_file)
+            .values(rows_done=checkpoints.c.rows_done + rows)
+        ).rowcount
+        if not updated:
+            db.execute(checkpoints.insert().values(
+                name=self.name,
+                target_table=self.target_table,
+                shard_file=shard_file,
+                shard_fingerprint=file_fingerprint(data_path),
+                rows_done=rows,
+            ))
+
+    def clear(self, db: Session) -> None:
+        """체크포인트 삭제 (commit하지 않음)"""
+        db.execute(delete(checkpoints).where(checkpoints.c.name == self.name))
@@ -0,0 +1,193 @@
+"""
+원본 CSV의 Parquet 캐시
+
+- data/*.csv를 모든 컬럼이 문자열인 Parquet(사전 인코딩, zstd)으로 한 번 변환해 두고
+  이후 적재는 CSV 토크나이징 없이 필요한 컬럼만 메모리 매핑으로 읽음
+  (형 변환은 적재 스크립트의 ColumnSpec 규칙으로 app.scripts.loader에서만 수행)
+- 캐시 파일 이름에 원본 파일 내용 해시가 들어가므로 CSV가 바뀌면 자동으로 새로 변환하고
+  같은 원본의 이전 캐시 파일은 삭제
+- pyarrow가 없거나 DATA_PARQUET_CACHE=false이면 기존처럼 CSV를 직접 읽음
+
+usage: python -m app.scripts.csv_cache [--data-dir DIR]
+"""
+
+import sys
+import os
+import glob
+import hashlib
+import re
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from typing import Iterator, List, Optional
+import pandas as pd
+from app.config import settings
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pa = None
+    pq = None
+
+
+# 원본 CSV 인코딩
+CSV_ENCODING = "utf-8-sig"
+# 캐시 변환 시 CSV 청크 크기 (행)
+CONVERT_CHUNK_SIZE = 200000
+# 캐시 형식 버전 (변환 방식이 바뀌면 올려서 기존 캐시 무효화)
+CACHE_VERSION = 2
+
+
+def default_data_dir() -> str:
+    """backend/data 경로 (Docker에서는 /app/data)"""
+    backend_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(backend_root, "data")
+
+
+# (경로, 크기, 수정 시각) → 내용 해시 (한 프로세스 안에서 같은 파일을 다시 읽지 않음)
+_fingerprints = {}
+
+
+def file_fingerprint(path: str) -> str:
+    """파일 내용 sha256 (hex)"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    if key not in _fingerprints:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            while block := f.read(1 << 20):
+                digest.update(block)
+        _fingerprints[key] = digest.hexdigest()
+    return _fingerprints[key]
+
+
+def cache_enabled() -> bool:
+    return settings.DATA_PARQUET_CACHE and pq is not None
+
+
+def _cache_dir(source: str) -> str:
+    return settings.DATA_CACHE_DIR or os.path.join(os.path.dirname(source), ".parquet")
+
+
+def _stem(source: str) -> str:
+    return os.path.splitext(os.path.basename(source))[0]
+
+
+def cache_path(source: str) -> str:
+    """원본 CSV에 대응하는 캐시 파일 경로 (내용 해시 포함)"""
+    return os.path.join(
+        _cache_dir(source),
+        f"{_stem(source)}.{file_fingerprint(source)[:16]}.v{CACHE_VERSION}.parquet",
+    )
+
+
+def remove_stale_caches(source: str, keep: str) -> int:
+    """같은 원본의 이전 캐시 파일 삭제 (이전 버전 이름 형식 포함, 삭제한 파일 수 반환)"""
+    cache_dir = _cache_dir(source)
+    pattern = re.compile(rf"{re.escape(_stem(source))}\.[0-9a-f]{{16}}\.v\d+(\.(text|typed))?\.parquet")
+    removed = 0
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if pattern.fullmatch(name) and path != keep:
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass  # 다른 프로세스가 먼저 삭제
+    return removed
+
+
+def _read_source_chunks(source: str, chunk_size: int, columns=None) -> Iterator[pd.DataFrame]:
+    """CSV 청크 읽기 (모든 컬럼을 문자열로, columns는 있는 컬럼만 사용)"""
+    wanted = set(columns) if columns is not None else None
+    return pd.read_csv(
+        source,
+        encoding=CSV_ENCODING,
+        dtype=str,
+        usecols=(lambda name: name in wanted) if wanted is not None else None,
+        chunksize=chunk_size,
+    )
+
+
+def convert_csv(source: str) -> str:
+    """
+    CSV → 문자열 Parquet 변환 (이미 있으면 그대로 반환)
+
+    청크 단위로 변환하므로 원본 크기와 무관하게 메모리 사용량이 일정합니다.
+    """
+    target = cache_path(source)
+    if os.path.exists(target):
+        return target
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = f"{target}.tmp"
+    writer = None
+    try:
+        for chunk_df in _read_source_chunks(source, CONVERT_CHUNK_SIZE):
+            if writer is None:
+                schema = pa.schema([(name, pa.string()) for name in chunk_df.columns])
+                writer = pq.ParquetWriter(temp_path, schema, compression="zstd", use_dictionary=True)
+            writer.write_table(pa.Table.from_pandas(chunk_df, schema=writer.schema, preserve_index=False))
+    finally:
+        if writer is not None:
+            writer.close()
+    # 다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록 완성 후 이름 변경
+    os.replace(temp_path, target)
+    removed = remove_stale_caches(source, target)
+    print(f"Cached {os.path.basename(source)} -> {target}" + (f" (removed {removed} stale)" if removed else ""))
+    return target
+
+
+def _projected(parquet_file, columns: Optional[List[str]]) -> Optional[List[str]]:
+    """캐시에 있는 컬럼만 남긴 projection"""
+    if columns is None:
+        return None
+    available = set(parquet_file.schema_arrow.names)
+    return [name for name in columns if name in available]
+
+
+def read_csv(source: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """원본 CSV 전체를 문자열로 읽기 (캐시가 있으면 필요한 컬럼만 Parquet에서 읽음)"""
+    if not cache_enabled():
+        wanted = set(columns) if columns is not None else None
+        return pd.read_csv(
+            source,
+            encoding=CSV_ENCODING,
+            dtype=str,
+            usecols=(lambda name: name in wanted) if wanted is not None else None,
+        )
+    parquet_file = pq.ParquetFile(convert_csv(source), memory_map=True)
+    return parquet_file.read(columns=_projected(parquet_file, columns)).to_pandas()
+
+
+def read_csv_chunks(
+    source: str,
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    """원본 CSV 청크 단위로 문자열로 읽기 (캐시가 있으면 Parquet 배치로 읽음)"""
+    if not cache_enabled():
+        yield from _read_source_chunks(source, chunk_size, columns)
+        return
+    parquet_file = pq.ParquetFile(convert_csv(source), memory_map=True)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=_projected(parquet_file, columns)):
+        yield batch.to_pandas()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert source CSVs to Parquet cache")
+    parser.add_argument("--data-dir", default=None, help="Directory containing source CSVs")
+    args = parser.parse_args()
+
+    if pq is None:
+        print("pyarrow is not installed")
+        return
+
+    data_dir = args.data_dir or default_data_dir()
+    for source in sorted(glob.glob(os.path.join(data_dir, "*.csv"))):
+        convert_csv(source)
+
+
+if __name__ == "__main__":
+    main()
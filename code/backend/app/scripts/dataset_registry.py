@@ -0,0 +1,58 @@
+"""
+데이터셋 적재 기록 (dataset_registry)
+
+원본 파일 내용 해시와 적재 옵션으로 지문(fingerprint)을 만들어 두고,
+지문과 행 수가 그대로면 컨테이너 재시작 시 재적재를 생략합니다.
+"""
+
+import os
+import hashlib
+import json
+from typing import Dict, List, Optional
+from sqlalchemy import Table, func, select
+from app.database import SessionLocal
+from app.models.dataset import DatasetRegistry
+from app.scripts.csv_cache import file_fingerprint
+
+
+def dataset_fingerprint(paths: List[str], options: Optional[Dict] = None) -> str:
+    """원본 파일 이름/내용 해시 + 적재 옵션(예: programs limit)의 sha256"""
+    canonical = {
+        "files": [[os.path.basename(path), file_fingerprint(path)] for path in sorted(paths)],
+        "options": options or {},
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def is_dataset_current(name: str, fingerprint: str, table: Table) -> bool:
+    """기록된 지문이 같고 테이블 행 수도 기록과 같으면 True"""
+    db = SessionLocal()
+    try:
+        entry = db.query(DatasetRegistry).filter(DatasetRegistry.name == name).first()
+        if entry is None or entry.fingerprint != fingerprint:
+            return False
+        # 테이블이 비워졌거나 다른 경로로 바뀐 경우 재적재
+        row_count = db.scalar(select(func.count()).select_from(table))
+        return row_count == entry.row_count
+    finally:
+        db.close()
+
+
+def record_dataset_load(name: str, fingerprint: str, paths: List[str], table: Table) -> int:
+    """적재 완료 기록 (이름별 한 행, 있으면 갱신), 기록한 테이블 행 수 반환"""
+    db = SessionLocal()
+    try:
+        row_count = db.scalar(select(func.count()).select_from(table))
+        entry = db.query(DatasetRegistry).filter(DatasetRegistry.name == name).first()
+        if entry is None:
+            entry = DatasetRegistry(name=name)
+            db.add(entry)
+        entry.fingerprint = fingerprint
+        entry.source_files = ", ".join(os.path.basename(path) for path in sorted(paths))[:1000]
+        entry.row_count = row_count
+        entry.loaded_at = func.now()
+        db.commit()
+        return row_count
+    finally:
+        db.close()
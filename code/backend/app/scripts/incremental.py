@@ -0,0 +1,192 @@
+"""
+증분 적재 (자연키 + 내용 해시 비교)
+
+- 원본 행과 DB 행을 같은 방식으로 정규화해 자연키 해시와 내용 해시를 계산
+- 새 키는 INSERT, 내용 해시가 달라진 키는 id를 유지한 채 UPDATE,
+  원본에서 사라진 키는 DELETE (바뀌지 않은 행은 건드리지 않음)
+- 자연키가 중복되는 행은 내용이 같은 행끼리 먼저 짝지은 뒤, 남은 행을
+  등장 순서(원본: 파일 순서, DB: id 순서)대로 짝지어 UPDATE
+
+DB 쪽 해시는 실행 시 id 순 배치로 읽어 계산하므로 별도 컬럼이 필요 없습니다.
+변경 사항은 호출 측 트랜잭션 하나에 모두 반영됩니다 (호출 측에서 commit).
+"""
+
+import hashlib
+from typing import Dict, List, Optional, Sequence
+import pandas as pd
+from sqlalchemy import Table, bindparam, delete, select, update
+from sqlalchemy.orm import Session
+from app.scripts.bulk_insert import dataframe_records, insert_dataframe
+
+
+# 해시 길이 (sha256 hex 앞부분)
+HASH_LENGTH = 32
+# 정규화 문자열 컬럼 구분자
+FIELD_SEPARATOR = "\x1f"
+# DB 행 조회/삭제 배치 크기
+BATCH_SIZE = 50000
+
+
+def normalized_text(series: pd.Series) -> pd.Series:
+    """
+    해시 입력용 문자열 (결측은 빈 문자열)
+
+    정수 값의 실수(결측 때문에 float가 된 정수 컬럼)는 정수 표기로 맞춰
+    원본/DB 쪽 dtype 차이로 해시가 달라지지 않게 합니다.
+    """
+    if pd.api.types.is_float_dtype(series):
+        integral = series.notna() & (series % 1 == 0)
+        text = series.astype("string")
+        text[integral] = series[integral].astype("int64").astype("string")
+        return text.fillna("")
+    return series.astype("string").fillna("")
+
+
+def hash_columns(df: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+    """지정 컬럼 값을 이어 붙인 문자열의 행별 해시"""
+    joined = normalized_text(df[columns[0]])
+    for column in columns[1:]:
+        joined = joined + FIELD_SEPARATOR + normalized_text(df[column])
+    return joined.map(lambda value: hashlib.sha256(value.encode("utf-8")).hexdigest()[:HASH_LENGTH])
+
+
+class KeyCounter:
+    """키 등장 횟수 (청크를 넘어 누적, 중복 키 구분용)"""
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+
+    def numbered(self, keys: pd.Series) -> pd.Series:
+        occurrence = keys.groupby(keys).cumcount() + keys.map(self.counts).fillna(0).astype("int64")
+        for key, count in keys.value_counts().items():
+            self.counts[key] = self.counts.get(key, 0) + int(count)
+        return keys + ":" + occurrence.astype("string")
+
+
+def _pair_numbered(keys: pd.Series) -> pd.Series:
+    """한 번에 주어진 키 목록 안에서 등장 순서 번호 부여"""
+    return keys + ":" + keys.groupby(keys).cumcount().astype("string")
+
+
+class IncrementalLoad:
+    """
+    테이블 하나의 증분 적재
+
+    사용 순서: apply(원본 DataFrame 청크) 반복 → finish()로 변경 반영 및 요약
+    DataFrame 컬럼은 id/created_at을 제외한 테이블 컬럼이어야 합니다.
+
+    내용까지 같은 행은 청크마다 바로 확정하고, 짝이 없는 원본 행만 모아 두었다가
+    finish()에서 자연키로 기존 행과 짝지어 UPDATE/INSERT/DELETE 합니다.
+    """
+
+    def __init__(self, db: Session, table: Table, key_columns: Sequence[str]):
+        self.db = db
+        self.table = table
+        self.key_columns = list(key_columns)
+        self.value_columns: Optional[List[str]] = None
+        self.existing: Optional[pd.DataFrame] = None
+        self.source_counter = KeyCounter()
+        self.matched_ids = set()
+        self.pending: List[pd.DataFrame] = []
+        self.summary = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 0}
+
+    def _keyed(self, df: pd.DataFrame, counter: KeyCounter) -> pd.DataFrame:
+        """(자연키 해시, 자연키+내용 해시 + 등장 순서) 키"""
+        base_key = hash_columns(df, self.key_columns)
+        exact_key = counter.numbered(base_key + ":" + hash_columns(df, self.value_columns))
+        return pd.DataFrame({"base_key": base_key, "exact_key": exact_key}, index=df.index)
+
+    def _load_existing(self) -> None:
+        """DB 행 키 계산 (id 순 배치)"""
+        columns = [self.table.c.id] + [self.table.c[name] for name in self.value_columns]
+        counter = KeyCounter()
+        frames, last_id = [], 0
+        while True:
+            rows = self.db.execute(
+                select(*columns).where(self.table.c.id > last_id).order_by(self.table.c.id).limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                break
+            batch = pd.DataFrame(rows, columns=["id"] + self.value_columns)
+            keyed = self._keyed(batch, counter)
+            keyed["id"] = batch["id"]
+            frames.append(keyed)
+            last_id = rows[-1].id
+
+        if frames:
+            self.existing = pd.concat(frames, ignore_index=True).set_index("exact_key")
+        else:
+            self.existing = pd.DataFrame(
+                {"base_key": pd.Series(dtype="string"), "id": pd.Series(dtype="int64")},
+                index=pd.Index([], name="exact_key", dtype="string"),
+            )
+        print(f"Hashed {len(self.existing)} existing {self.table.name} rows")
+
+    def apply(self, df: pd.DataFrame) -> int:
+        """원본 청크 비교 (내용이 같은 행 확정, 나머지는 finish까지 보류), 처리한 행 수 반환"""
+        if df.empty:
+            return 0
+        if self.value_columns is None:
+            self.value_columns = list(df.columns)
+            self._load_existing()
+
+        keyed = self._keyed(df, self.source_counter)
+        existing_ids = self.existing["id"].reindex(keyed["exact_key"]).to_numpy()
+        unchanged = ~pd.isna(existing_ids)
+
+        self.matched_ids.update(int(row_id) for row_id in existing_ids[unchanged])
+        self.summary["unchanged"] += int(unchanged.sum())
+
+        pending = df[~unchanged].copy()
+        if not pending.empty:
+            pending["_base_key"] = keyed["base_key"][~unchanged]
+            self.pending.append(pending)
+        return len(df)
+
+    def finish(self) -> Dict[str, int]:
+        """보류된 원본 행을 자연키로 기존 행과 짝지어 UPDATE/INSERT/DELETE 후 변경 요약 반환"""
+        if self.existing is None:
+            # 원본이 비어 있으면 삭제하지 않음 (잘못된 파일로 전체 삭제 방지)
+            print(f"No source rows for {self.table.name}, skipping deletes")
+            return self.summary
+
+        leftover = self.existing[~self.existing["id"].isin(self.matched_ids)].sort_values("id")
+        leftover_ids = pd.Series(leftover["id"].to_numpy(), index=_pair_numbered(leftover["base_key"]).to_numpy())
+
+        paired_ids = set()
+        if self.pending:
+            pending = pd.concat(self.pending)
+            target_ids = _pair_numbered(pending.pop("_base_key")).map(leftover_ids).to_numpy()
+            is_update = ~pd.isna(target_ids)
+
+            updates = pending[is_update]
+            if not updates.empty:
+                records = dataframe_records(updates)
+                for record, row_id in zip(records, target_ids[is_update]):
+                    record["_row_id"] = int(row_id)
+                self.db.execute(
+                    update(self.table)
+                    .where(self.table.c.id == bindparam("_row_id"))
+                    .values({name: bindparam(name) for name in self.value_columns}),
+                    records,
+                )
+                paired_ids.update(int(row_id) for row_id in target_ids[is_update])
+
+            inserts = pending[~is_update]
+            if not inserts.empty:
+                insert_dataframe(self.db, self.table, inserts)
+
+            self.summary["updated"] = len(updates)
+            self.summary["inserted"] = len(inserts)
+
+        stale_ids = [int(row_id) for row_id in leftover["id"] if int(row_id) not in paired_ids]
+        for start in range(0, len(stale_ids), BATCH_SIZE):
+            self.db.execute(delete(self.table).where(self.table.c.id.in_(stale_ids[start:start + BATCH_SIZE])))
+        self.summary["deleted"] = len(stale_ids)
+
+        print(
+            f"Incremental {self.table.name}: {self.summary['inserted']} inserted, "
+            f"{self.summary['updated']} updated, {self.summary['deleted']} deleted, "
+            f"{self.summary['unchanged']} unchanged"
+        )
+        return self.summary
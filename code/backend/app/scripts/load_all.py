@@ -1,7 +1,11 @@
 """
 모든 데이터 적재 스크립트 실행
 
-usage: python -m app.scripts.load_all [--programs-limit N]
+원본 파일과 적재 옵션이 지난 적재와 같으면 (dataset_registry 지문 + 행 수 일치) 해당 데이터셋은 건너뜁니다.
+--force로 항상 다시 적재할 수 있습니다.
+--resume을 주면 중단된 프로그램 전체 적재를 마지막 체크포인트부터 이어서 적재합니다.
+
+usage: python -m app.scripts.load_all [--programs-limit N] [--shadow | --incremental] [--force] [--stream] [--resume]
 """
 
 import sys
@@ -9,37 +13,122 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import argparse
+import time
+from app.scripts.csv_cache import default_data_dir
+from app.scripts.dataset_registry import dataset_fingerprint, is_dataset_current, record_dataset_load
+
+
+def load_dataset(name, table, paths, load, options=None, force=False):
+    """데이터셋 하나 적재 (바뀌지 않았으면 건너뜀) 후 적재 기록"""
+    missing = [os.path.basename(path) for path in paths if not os.path.exists(path)]
+    if not paths or missing:
+        print(f"Skipping {name} (source files not found: {', '.join(missing) or 'no matching files'})")
+        return
+
+    started = time.perf_counter()
+    fingerprint = dataset_fingerprint(paths, options)
+    if not force and is_dataset_current(name, fingerprint, table):
+        print(f"Skipping {name} (unchanged, fingerprint {fingerprint[:12]}, checked in {time.perf_counter() - started:.1f}s)")
+        return
+
+    load()
+    row_count = record_dataset_load(name, fingerprint, paths, table)
+    print(f"Recorded {name}: {row_count} rows (fingerprint {fingerprint[:12]})")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Load all data into database")
     parser.add_argument("--programs-limit", type=int, default=10000,
                         help="Limit number of program records (default: 10000, full data is ~1.5M)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--shadow", action="store_true",
+                      help="Load into shadow tables and swap atomically (API keeps serving old data)")
+    mode.add_argument("--incremental", action="store_true",
+                      help="Apply only inserted/changed/deleted rows (keeps primary keys stable)")
+    parser.add_argument("--force", action="store_true",
+                        help="Reload every dataset even if its source files are unchanged")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream fixed-size batches (bounded memory) and print a load report per dataset")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Also report peak tracemalloc allocations (with --stream)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted program load from its last checkpoint")
     args = parser.parse_args()
+    if args.resume and args.incremental:
+        parser.error("--resume cannot be combined with --incremental")
+
+    from app.models import FacilityStats, SupportStats, CoachStats, Program, Facility
+    from app.scripts import load_facility_stats, load_support_stats, load_coach_stats, load_programs, load_facilities
+
+    data_dir = default_data_dir()
 
     print("=" * 60)
     print("Starting data load...")
     print("=" * 60)
 
     # 1. 시설 통계
-    print("\n[1/4] Loading Facility Stats...")
-    from app.scripts.load_facility_stats import load_facility_stats
-    load_facility_stats()
+    print("\n[1/5] Loading Facility Stats...")
+    load_dataset(
+        "facility_stats",
+        FacilityStats.__table__,
+        [os.path.join(data_dir, load_facility_stats.DATA_FILE)],
+        lambda: load_facility_stats.load_facility_stats(
+            shadow=args.shadow, incremental=args.incremental, stream=args.stream, trace_memory=args.trace_memory
+        ),
+        force=args.force,
+    )
 
     # 2. 스포츠강좌이용권 통계
-    print("\n[2/4] Loading Support Stats...")
-    from app.scripts.load_support_stats import load_support_stats
-    load_support_stats()
+    print("\n[2/5] Loading Support Stats...")
+    load_dataset(
+        "support_stats",
+        SupportStats.__table__,
+        [os.path.join(data_dir, load_support_stats.DATA_FILE)],
+        lambda: load_support_stats.load_support_stats(
+            shadow=args.shadow, incremental=args.incremental, stream=args.stream, trace_memory=args.trace_memory
+        ),
+        force=args.force,
+    )
 
     # 3. 체육지도자 통계
-    print("\n[3/4] Loading Coach Stats...")
-    from app.scripts.load_coach_stats import load_coach_stats
-    load_coach_stats()
-
-    # 4. 프로그램 (대용량)
-    print(f"\n[4/4] Loading Programs (limit: {args.programs_limit})...")
-    from app.scripts.load_programs import load_programs
-    load_programs(limit=args.programs_limit)
+    print("\n[3/5] Loading Coach Stats...")
+    load_dataset(
+        "coach_stats",
+        CoachStats.__table__,
+        [os.path.join(data_dir, load_coach_stats.DATA_FILE)],
+        lambda: load_coach_stats.load_coach_stats(
+            shadow=args.shadow, incremental=args.incremental, stream=args.stream, trace_memory=args.trace_memory
+        ),
+        force=args.force,
+    )
+
+    # 4. 프로그램 (대용량, limit이 바뀌면 다시 적재)
+    print(f"\n[4/5] Loading Programs (limit: {args.programs_limit})...")
+    load_dataset(
+        "programs",
+        Program.__table__,
+        load_programs.find_data_files(data_dir),
+        lambda: load_programs.load_programs(
+            limit=args.programs_limit,
+            shadow=args.shadow,
+            incremental=args.incremental,
+            stream=args.stream,
+            trace_memory=args.trace_memory,
+            resume=args.resume,
+        ),
+        options={"limit": args.programs_limit},
+        force=args.force,
+    )
+
+    # 5. 시설 (프로그램 분할 파일의 시설 정보 전체, programs limit과 무관)
+    print("\n[5/5] Loading Facilities...")
+    load_dataset(
+        "facilities",
+        Facility.__table__,
+        load_programs.find_data_files(data_dir),
+        lambda: load_facilities.load_facilities(shadow=args.shadow, incremental=args.incremental),
+        force=args.force,
+    )
 
     print("\n" + "=" * 60)
     print("All data loaded successfully!")
@@ -8,73 +8,70 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-import pandas as pd
 from app.database import SessionLocal
+from app.services.dashboard_service import refresh_dashboard_summary
 from app.models.coach import CoachStats
+from app.scripts.csv_cache import default_data_dir, read_csv
+from app.scripts.loader import ColumnSpec, source_columns, transform_frame, stream_csv, load_batches
+from app.scripts.streaming import LoadReport
 
 
-# 컬럼 매핑
-COLUMN_MAP = {
-    "QUALF_YEAR": "qualification_year",
-    "HEALTH_MVM_MNGER_CO": "health_exercise_manager",
-    "SCLS1_SPCLTY_SPORTS_INSTOR_CO": "professional_sports_1",
-    "SCLS2_SPCLTY_SPORTS_INSTOR_CO": "professional_sports_2",
-    "SCLS1_LVLH_SPORTS_INSTOR_CO": "living_sports_1",
-    "SCLS2_LVLH_SPORTS_INSTOR_CO": "living_sports_2",
-    "YUTH_SPORTS_INSTOR_CO": "youth_sports",
-    "SNCTZ_SPORTS_INSTOR_CO": "senior_sports",
-    "SCLS1_DSPSN_SPORTS_INSTOR_CO": "disabled_sports_1",
-    "SCLS2_DSPSN_SPORTS_INSTOR_CO": "disabled_sports_2",
-}
+# 원본 파일 (data/ 아래)
+DATA_FILE = "체육지도자 연도별 자격취득현황 데이터(202508).csv"
 
+# 컬럼 규칙: CSV 컬럼 → DB 컬럼 (타입, 최대 길이, 기본값)
+COLUMNS = [
+    ColumnSpec("QUALF_YEAR", "qualification_year", "int", default=0),
+    ColumnSpec("HEALTH_MVM_MNGER_CO", "health_exercise_manager", "int", default=0),
+    ColumnSpec("SCLS1_SPCLTY_SPORTS_INSTOR_CO", "professional_sports_1", "int", default=0),
+    ColumnSpec("SCLS2_SPCLTY_SPORTS_INSTOR_CO", "professional_sports_2", "int", default=0),
+    ColumnSpec("SCLS1_LVLH_SPORTS_INSTOR_CO", "living_sports_1", "int", default=0),
+    ColumnSpec("SCLS2_LVLH_SPORTS_INSTOR_CO", "living_sports_2", "int", default=0),
+    ColumnSpec("YUTH_SPORTS_INSTOR_CO", "youth_sports", "int", default=0),
+    ColumnSpec("SNCTZ_SPORTS_INSTOR_CO", "senior_sports", "int", default=0),
+    ColumnSpec("SCLS1_DSPSN_SPORTS_INSTOR_CO", "disabled_sports_1", "int", default=0),
+    ColumnSpec("SCLS2_DSPSN_SPORTS_INSTOR_CO", "disabled_sports_2", "int", default=0),
+]
 
-def load_coach_stats():
+# 증분 적재 자연키 (자격취득연도)
+KEY_COLUMNS = ("qualification_year",)
+
+
+def load_coach_stats(shadow=False, incremental=False, stream=False, trace_memory=False):
     """체육지도자 통계 데이터 적재"""
-    # backend 폴더 기준 (Docker에서는 /app)
-    backend_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    data_path = os.path.join(
-        backend_root,
-        "data",
-        "체육지도자 연도별 자격취득현황 데이터(202508).csv"
-    )
+    data_path = os.path.join(default_data_dir(), DATA_FILE)
 
     print(f"Loading data from: {data_path}")
 
-    # CSV 읽기
-    df = pd.read_csv(data_path, encoding="utf-8-sig")
-    print(f"Loaded {len(df)} rows")
+    report = None
+    if stream:
+        # 고정 크기 배치로 읽기 → 변환 → 적재 (메모리 상한 고정, 단계별 계측)
+        report = LoadReport("coach_stats", trace_memory=trace_memory)
+        batches = stream_csv(data_path, COLUMNS, report)
+    else:
+        # CSV 읽기 (Parquet 캐시가 있으면 캐시에서, 필요한 컬럼만 문자열로)
+        df = read_csv(data_path, columns=source_columns(COLUMNS))
+        print(f"Loaded {len(df)} rows")
+
+        # 컬럼 단위 변환
+        batches = [transform_frame(df, COLUMNS)]
 
     # DB 세션
     db = SessionLocal()
 
     try:
-        # 기존 데이터 삭제
-        deleted = db.query(CoachStats).delete()
-        db.commit()
-        print(f"Deleted {deleted} existing records")
-
-        # 배치 삽입
-        records = []
-
-        for _, row in df.iterrows():
-            record = CoachStats(
-                qualification_year=int(row["QUALF_YEAR"]) if pd.notna(row.get("QUALF_YEAR")) else 0,
-                health_exercise_manager=int(row["HEALTH_MVM_MNGER_CO"]) if pd.notna(row.get("HEALTH_MVM_MNGER_CO")) else 0,
-                professional_sports_1=int(row["SCLS1_SPCLTY_SPORTS_INSTOR_CO"]) if pd.notna(row.get("SCLS1_SPCLTY_SPORTS_INSTOR_CO")) else 0,
-                professional_sports_2=int(row["SCLS2_SPCLTY_SPORTS_INSTOR_CO"]) if pd.notna(row.get("SCLS2_SPCLTY_SPORTS_INSTOR_CO")) else 0,
-                living_sports_1=int(row["SCLS1_LVLH_SPORTS_INSTOR_CO"]) if pd.notna(row.get("SCLS1_LVLH_SPORTS_INSTOR_CO")) else 0,
-                living_sports_2=int(row["SCLS2_LVLH_SPORTS_INSTOR_CO"]) if pd.notna(row.get("SCLS2_LVLH_SPORTS_INSTOR_CO")) else 0,
-                youth_sports=int(row["YUTH_SPORTS_INSTOR_CO"]) if pd.notna(row.get("YUTH_SPORTS_INSTOR_CO")) else 0,
-                senior_sports=int(row["SNCTZ_SPORTS_INSTOR_CO"]) if pd.notna(row.get("SNCTZ_SPORTS_INSTOR_CO")) else 0,
-                disabled_sports_1=int(row["SCLS1_DSPSN_SPORTS_INSTOR_CO"]) if pd.notna(row.get("SCLS1_DSPSN_SPORTS_INSTOR_CO")) else 0,
-                disabled_sports_2=int(row["SCLS2_DSPSN_SPORTS_INSTOR_CO"]) if pd.notna(row.get("SCLS2_DSPSN_SPORTS_INSTOR_CO")) else 0,
-            )
-            records.append(record)
-
-        db.bulk_save_objects(records)
+        load_batches(
+            db, CoachStats.__table__, batches, KEY_COLUMNS,
+            shadow=shadow, incremental=incremental, report=report,
+        )
+
+        # 대시보드 요약 스냅샷 갱신
+        refresh_dashboard_summary(db)
         db.commit()
-        print(f"Inserted {len(records)} records")
+
         print("Done!")
+        if report is not None:
+            report.print()
 
     except Exception as e:
         db.rollback()
@@ -85,4 +82,12 @@ def load_coach_stats():
 
 
 if __name__ == "__main__":
-    load_coach_stats()
+    import argparse
+    parser = argparse.ArgumentParser()
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--shadow", action="store_true", help="Load into a shadow table and swap atomically")
+    mode.add_argument("--incremental", action="store_true", help="Apply only inserted/changed/deleted rows")
+    parser.add_argument("--stream", action="store_true", help="Stream fixed-size batches and print a load report")
+    parser.add_argument("--trace-memory", action="store_true", help="Also report peak tracemalloc allocations (with --stream)")
+    args = parser.parse_args()
+    load_coach_stats(shadow=args.shadow, incremental=args.incremental, stream=args.stream, trace_memory=args.trace_memory)
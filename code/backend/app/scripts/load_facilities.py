@@ -0,0 +1,143 @@
+"""
+공공체육시설(facilities) 적재 스크립트
+
+데이터 파일: data/청소년_프로그램_*.csv (프로그램 분할 파일의 FCLTY_* 컬럼)
+
+시설 원본 파일이 따로 없으므로 프로그램 행에서 시설 정보를 뽑아
+시설명 + 주소 기준으로 한 행씩 남깁니다 (좌표가 있는 행 우선).
+
+좌표 검증: 국내 범위를 벗어난 좌표는 위경도가 뒤바뀐 경우 교정하고,
+그 외에는 결측으로 처리합니다. 유효한 좌표에는 영역/반경 검색용 geohash를 채웁니다.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from typing import Dict
+import numpy as np
+import pandas as pd
+from app.database import SessionLocal
+from app.models.facility import Facility
+from app.services.geo import encode_geohash_array, valid_coordinate_mask
+from app.scripts.csv_cache import read_csv_chunks
+from app.scripts.load_programs import find_data_files
+from app.scripts.loader import ColumnSpec, source_columns, transform_frame, load_batches
+
+
+# 컬럼 규칙: CSV 컬럼 → DB 컬럼 (타입, 최대 길이, 기본값)
+COLUMNS = [
+    ColumnSpec("FCLTY_NM", "name", "str", max_length=200),
+    ColumnSpec("FCLTY_SDIV_CD", "facility_type_code", "str", max_length=20),
+    ColumnSpec("FCLTY_FLAG_NM", "facility_type_name", "str", max_length=100),
+    ColumnSpec("INDUTY_CD", "industry_code", "str", max_length=20),
+    ColumnSpec("INDUTY_NM", "industry_name", "str", max_length=100),
+    ColumnSpec("CTPRVN_CD", "region_sido_code", "str", max_length=20),
+    ColumnSpec("CTPRVN_NM", "region_sido", "str", max_length=50),
+    ColumnSpec("SIGNGU_CD", "region_sigungu_code", "str", max_length=20),
+    ColumnSpec("SIGNGU_NM", "region_sigungu", "str", max_length=50),
+    ColumnSpec("EMD_NM", "emd_name", "str", max_length=50),
+    ColumnSpec("FCLTY_ADDR", "address", "str", max_length=500),
+    ColumnSpec("FCLTY_LA", "latitude", "float"),
+    ColumnSpec("FCLTY_LO", "longitude", "float"),
+    ColumnSpec("HMPG_URL", "homepage_url", "str", max_length=500),
+]
+
+# 시설 자연키 (증분 적재 및 중복 제거 기준)
+KEY_COLUMNS = ("name", "address")
+
+# 청크 크기 (행)
+CHUNK_SIZE = 100000
+
+
+def validate_coordinates(frame: pd.DataFrame) -> Dict[str, int]:
+    """
+    좌표 검증 (frame을 직접 수정)
+
+    국내 범위 밖 좌표 중 위경도를 바꾸면 유효한 경우는 교정하고, 나머지는 결측 처리합니다.
+
+    Returns:
+        {"swapped": 교정된 행 수, "invalid": 결측 처리된 행 수}
+    """
+    lat = frame["latitude"].to_numpy(dtype=np.float64, na_value=np.nan)
+    lon = frame["longitude"].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = valid_coordinate_mask(lat, lon)
+    swapped = ~valid & valid_coordinate_mask(lon, lat)
+    invalid = ~valid & ~swapped & ~(np.isnan(lat) & np.isnan(lon))
+
+    frame["latitude"] = np.where(swapped, lon, np.where(invalid, np.nan, lat))
+    frame["longitude"] = np.where(swapped, lat, np.where(invalid, np.nan, lon))
+    return {"swapped": int(swapped.sum()), "invalid": int(invalid.sum())}
+
+
+def dedupe_facilities(frame: pd.DataFrame) -> pd.DataFrame:
+    """자연키별 한 행 (좌표가 있는 행 우선, 원본 순서 유지)"""
+    ordered = frame.assign(
+        _order=np.arange(len(frame)),
+        _located=frame["latitude"].notna(),
+    ).sort_values(["_located", "_order"], ascending=[False, True], kind="stable")
+    deduped = ordered.drop_duplicates(subset=list(KEY_COLUMNS))
+    return deduped.sort_values("_order").drop(columns=["_order", "_located"]).reset_index(drop=True)
+
+
+def load_facilities(data_dir=None, shadow=False, incremental=False):
+    """시설 데이터 적재"""
+    data_files = find_data_files(data_dir)
+
+    if not data_files:
+        print("No data files found!")
+        return
+
+    print(f"Found {len(data_files)} data files")
+
+    # 청크마다 변환/검증/중복 제거 후 누적 (시설 수는 프로그램 행 수보다 훨씬 적음)
+    frames = []
+    checked = {"rows": 0, "swapped": 0, "invalid": 0}
+    for data_path in data_files:
+        print(f"Loading data from: {data_path}")
+        for chunk_df in read_csv_chunks(data_path, CHUNK_SIZE, columns=source_columns(COLUMNS)):
+            frame = transform_frame(chunk_df, COLUMNS)
+            frame = frame[frame["name"].notna()].copy()
+            result = validate_coordinates(frame)
+            checked["rows"] += len(frame)
+            checked["swapped"] += result["swapped"]
+            checked["invalid"] += result["invalid"]
+            frames.append(dedupe_facilities(frame))
+
+    if not frames:
+        print("No facility rows found!")
+        return
+
+    facilities = dedupe_facilities(pd.concat(frames, ignore_index=True))
+    facilities["geohash"] = encode_geohash_array(facilities["latitude"].to_numpy(), facilities["longitude"].to_numpy())
+    print(
+        f"Extracted {len(facilities)} facilities from {checked['rows']} program rows "
+        f"(coordinates: {checked['swapped']} swapped, {checked['invalid']} out of range, "
+        f"{int(facilities['geohash'].isna().sum())} facilities without location)"
+    )
+
+    # DB 세션
+    db = SessionLocal()
+
+    try:
+        load_batches(db, Facility.__table__, [facilities], KEY_COLUMNS, shadow=shadow, incremental=incremental)
+
+        print("Done!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"Error: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--data-dir", default=None, help="Directory containing 청소년_프로그램_*.csv")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--shadow", action="store_true", help="Load into a shadow table and swap atomically")
+    mode.add_argument("--incremental", action="store_true", help="Apply only inserted/changed/deleted rows")
+    args = parser.parse_args()
+    load_facilities(data_dir=args.data_dir, shadow=args.shadow, incremental=args.incremental)
@@ -8,91 +8,69 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-import pandas as pd
 from app.database import SessionLocal
+from app.services.dashboard_service import refresh_dashboard_summary
 from app.models.facility import FacilityStats
+from app.scripts.csv_cache import default_data_dir, read_csv
+from app.scripts.loader import ColumnSpec, source_columns, transform_frame, stream_csv, load_batches
+from app.scripts.streaming import LoadReport
 
 
-# 컬럼 매핑
-COLUMN_MAP = {
-    "BASE_YM": "base_ym",
-    "CTPRVN_CD": "region_sido_code",
-    "CTPRVN_NM": "region_sido",
-    "SIGNGU_CD": "region_sigungu_code",
-    "SIGNGU_NM": "region_sigungu",
-    "SIGNGU_ACCTO_FCLTY_CO": "facility_count",
-    "SIGNGU_ACCTO_POPLTN_CO": "population",
-    "PSNBY_FCLTY_CO": "facility_per_person",
-    "PSNBY_FCL_CO_RANK_CO": "rank",
-}
+# 원본 파일 (data/ 아래)
+DATA_FILE = "지역별공공체육시설보급현황정보(202507).csv"
 
+# 컬럼 규칙: CSV 컬럼 → DB 컬럼 (타입, 최대 길이, 기본값)
+COLUMNS = [
+    ColumnSpec("BASE_YM", "base_ym", "str", max_length=10),
+    ColumnSpec("CTPRVN_CD", "region_sido_code", "str", max_length=20),
+    ColumnSpec("CTPRVN_NM", "region_sido", "str", max_length=50),
+    ColumnSpec("SIGNGU_CD", "region_sigungu_code", "str", max_length=20),
+    ColumnSpec("SIGNGU_NM", "region_sigungu", "str", max_length=50),
+    ColumnSpec("SIGNGU_ACCTO_FCLTY_CO", "facility_count", "int", default=0),
+    ColumnSpec("SIGNGU_ACCTO_POPLTN_CO", "population", "int", default=0),
+    ColumnSpec("PSNBY_FCLTY_CO", "facility_per_person", "float", default=0.0),
+    ColumnSpec("PSNBY_FCL_CO_RANK_CO", "rank", "int", default=0),
+]
 
-def load_facility_stats():
+# 증분 적재 자연키 (기준년월 + 시도/시군구 코드)
+KEY_COLUMNS = ("base_ym", "region_sido_code", "region_sigungu_code")
+
+
+def load_facility_stats(shadow=False, incremental=False, stream=False, trace_memory=False):
     """시설 통계 데이터 적재"""
-    # backend 폴더 기준 (Docker에서는 /app)
-    backend_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    data_path = os.path.join(
-        backend_root,
-        "data",
-        "지역별공공체육시설보급현황정보(202507).csv"
-    )
+    data_path = os.path.join(default_data_dir(), DATA_FILE)
 
     print(f"Loading data from: {data_path}")
 
-    # CSV 읽기
-    df = pd.read_csv(data_path, encoding="utf-8-sig")
-    print(f"Loaded {len(df)} rows")
+    report = None
+    if stream:
+        # 고정 크기 배치로 읽기 → 변환 → 적재 (메모리 상한 고정, 단계별 계측)
+        report = LoadReport("facility_stats", trace_memory=trace_memory)
+        batches = stream_csv(data_path, COLUMNS, report)
+    else:
+        # CSV 읽기 (Parquet 캐시가 있으면 캐시에서, 필요한 컬럼만 문자열로)
+        df = read_csv(data_path, columns=source_columns(COLUMNS))
+        print(f"Loaded {len(df)} rows")
 
-    # 컬럼 이름 변경
-    df = df.rename(columns=COLUMN_MAP)
-
-    # NaN 처리
-    df = df.fillna({
-        "facility_count": 0,
-        "population": 0,
-        "facility_per_person": 0.0,
-        "rank": 0,
-    })
+        # 컬럼 단위 변환
+        batches = [transform_frame(df, COLUMNS)]
 
     # DB 세션
     db = SessionLocal()
 
     try:
-        # 기존 데이터 삭제 (선택적)
-        deleted = db.query(FacilityStats).delete()
-        print(f"Deleted {deleted} existing records")
-
-        # 배치 삽입
-        batch_size = 1000
-        records = []
-
-        for _, row in df.iterrows():
-            record = FacilityStats(
-                base_ym=str(row["base_ym"]),
-                region_sido_code=str(row["region_sido_code"]) if pd.notna(row.get("region_sido_code")) else None,
-                region_sido=str(row["region_sido"]) if pd.notna(row.get("region_sido")) else None,
-                region_sigungu_code=str(row["region_sigungu_code"]) if pd.notna(row.get("region_sigungu_code")) else None,
-                region_sigungu=str(row["region_sigungu"]) if pd.notna(row.get("region_sigungu")) else None,
-                facility_count=int(row["facility_count"]) if pd.notna(row.get("facility_count")) else 0,
-                population=int(row["population"]) if pd.notna(row.get("population")) else 0,
-                facility_per_person=float(row["facility_per_person"]) if pd.notna(row.get("facility_per_person")) else 0.0,
-                rank=int(row["rank"]) if pd.notna(row.get("rank")) else 0,
-            )
-            records.append(record)
-
-            if len(records) >= batch_size:
-                db.bulk_save_objects(records)
-                db.commit()
-                print(f"Inserted {len(records)} records...")
-                records = []
-
-        # 남은 레코드 삽입
-        if records:
-            db.bulk_save_objects(records)
-            db.commit()
-            print(f"Inserted {len(records)} remaining records")
+        load_batches(
+            db, FacilityStats.__table__, batches, KEY_COLUMNS,
+            shadow=shadow, incremental=incremental, report=report,
+        )
+
+        # 대시보드 요약 스냅샷 갱신
+        refresh_dashboard_summary(db)
+        db.commit()
 
         print("Done!")
+        if report is not None:
+            report.print()
 
     except Exception as e:
         db.rollback()
@@ -103,4 +81,12 @@ def load_facility_stats():
 
 
 if __name__ == "__main__":
-    load_facility_stats()
+    import argparse
+    parser = argparse.ArgumentParser()
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--shadow", action="store_true", help="Load into a shadow table and swap atomically")
+    mode.add_argument("--incremental", action="store_true", help="Apply only inserted/changed/deleted rows")
+    parser.add_argument("--stream", action="store_true", help="Stream fixed-size batches and print a load report")
+    parser.add_argument("--trace-memory", action="store_true", help="Also report peak tracemalloc allocations (with --stream)")
+    args = parser.parse_args()
+    load_facility_stats(shadow=args.shadow, incremental=args.incremental, stream=args.stream, trace_memory=args.trace_memory)
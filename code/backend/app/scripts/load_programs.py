@@ -2,66 +2,351 @@
 청소년 유아동 이용가능 체육시설 프로그램 정보 적재 스크립트
 
 데이터 파일: data/청소년_프로그램_*.csv (분할된 파일들)
+
+청크 단위로 컬럼 전체를 벡터 연산으로 변환한 뒤
+PostgreSQL은 COPY FROM STDIN, SQLite는 executemany로 일괄 적재합니다.
+
+--shadow를 주면 shadow 테이블에 적재한 뒤 한 트랜잭션에서 교체하므로
+적재 중에도 API는 기존 데이터를 그대로 제공합니다.
+
+--incremental을 주면 자연키(시설+프로그램+일정)와 내용 해시를 비교해
+바뀐 행만 INSERT/UPDATE/DELETE 하므로 기존 행의 id(북마크 대상)가 유지됩니다.
+
+--workers 2 이상이면 분할 파일을 프로세스 풀에서 병렬로 파싱하고,
+크기 제한 대기열을 거쳐 --writers 개의 커넥션이 동시에 적재합니다.
+
+--stream을 주면 읽기 → 변환 → 고정 크기 배치 → 적재를 제너레이터 단계로 연결해
+순차 적재하고 (메모리 상한 고정), 단계별 처리량/지연과 최대 RSS를 보고합니다.
+
+전체 재적재 중에는 배치를 commit할 때마다 분할 파일별 적재 위치를 체크포인트로 남기며,
+--resume을 주면 기존 데이터를 지우지 않고 마지막 체크포인트 이후 행부터 이어서 적재합니다.
 """
 
 import sys
 import os
 import glob
+import time
+import queue
+import threading
+import multiprocessing
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 import pandas as pd
-from datetime import datetime
-from app.database import SessionLocal
-from app.models.program import Program
-
-
-# 컬럼 매핑
-COLUMN_MAP = {
-    "FCLTY_NM": "facility_name",
-    "FCLTY_SDIV_CD": "facility_type_code",
-    "FCLTY_FLAG_NM": "facility_type_name",
-    "INDUTY_CD": "industry_code",
-    "INDUTY_NM": "industry_name",
-    "CTPRVN_CD": "region_sido_code",
-    "CTPRVN_NM": "region_sido",
-    "SIGNGU_CD": "region_sigungu_code",
-    "SIGNGU_NM": "region_sigungu",
-    "EMD_NM": "emd_name",
-    "FCLTY_ADDR": "address",
-    "FCLTY_LA": "latitude",
-    "FCLTY_LO": "longitude",
-    "PROGRM_TY_NM": "program_type",
-    "PROGRM_NM": "program_name",
-    "PROGRM_TRGET_NM": "target_group",
-    "PROGRM_BEGIN_DE": "start_date",
-    "PROGRM_END_DE": "end_date",
-    "PROGRM_ESTBL_WKDAY_NM": "schedule_weekdays",
-    "PROGRM_ESTBL_TIZN_VALUE": "schedule_time",
-    "PROGRM_RCRIT_NMPR_CO": "capacity",
-    "PROGRM_PRC": "price",
-    "PROGRM_PRC_TY_NM": "price_type",
-    "HMPG_URL": "homepage_url",
-}
-
-
-def parse_date(date_str):
-    """날짜 문자열 파싱"""
-    if pd.isna(date_str) or not date_str:
-        return None
+from app.config import settings
+from app.database import SessionLocal, engine
+from app.services.dashboard_service import refresh_dashboard_summary
+from app.services.program_search import rebuild_search_index
+from app.services.geo import encode_geohash_array
+from app.services.sport_tagging import rebuild_sport_tags
+from app.models.program import Program, ProgramSportTag
+from app.scripts.bulk_insert import insert_dataframe
+from app.scripts.csv_cache import default_data_dir, read_csv_chunks
+from app.scripts.table_swap import ReloadTarget
+from app.scripts.incremental import IncrementalLoad
+from app.scripts.checkpoints import ShardCheckpoints
+from app.scripts.loader import ColumnSpec, source_columns, transform_frame
+from app.scripts.streaming import LoadReport, rebatch, skip_rows, take_rows
+
+
+# 컬럼 규칙: CSV 컬럼 → DB 컬럼 (타입, 최대 길이, 기본값)
+COLUMNS = [
+    ColumnSpec("FCLTY_NM", "facility_name", "str", max_length=200),
+    ColumnSpec("FCLTY_SDIV_CD", "facility_type_code", "str", max_length=20),
+    ColumnSpec("FCLTY_FLAG_NM", "facility_type_name", "str", max_length=100),
+    ColumnSpec("INDUTY_CD", "industry_code", "str", max_length=20),
+    ColumnSpec("INDUTY_NM", "industry_name", "str", max_length=100),
+    ColumnSpec("CTPRVN_CD", "region_sido_code", "str", max_length=20),
+    ColumnSpec("CTPRVN_NM", "region_sido", "str", max_length=50),
+    ColumnSpec("SIGNGU_CD", "region_sigungu_code", "str", max_length=20),
+    ColumnSpec("SIGNGU_NM", "region_sigungu", "str", max_length=50),
+    ColumnSpec("EMD_NM", "emd_name", "str", max_length=50),
+    ColumnSpec("FCLTY_ADDR", "address", "str", max_length=500),
+    ColumnSpec("FCLTY_LA", "latitude", "float"),
+    ColumnSpec("FCLTY_LO", "longitude", "float"),
+    ColumnSpec("PROGRM_TY_NM", "program_type", "str", max_length=100),
+    ColumnSpec("PROGRM_NM", "program_name", "str", max_length=200),
+    ColumnSpec("PROGRM_TRGET_NM", "target_group", "str", max_length=100),
+    ColumnSpec("PROGRM_BEGIN_DE", "start_date", "date"),
+    ColumnSpec("PROGRM_END_DE", "end_date", "date"),
+    ColumnSpec("PROGRM_ESTBL_WKDAY_NM", "schedule_weekdays", "str", max_length=50),
+    ColumnSpec("PROGRM_ESTBL_TIZN_VALUE", "schedule_time", "str", max_length=50),
+    ColumnSpec("PROGRM_RCRIT_NMPR_CO", "capacity", "int"),
+    ColumnSpec("PROGRM_PRC", "price", "float"),
+    ColumnSpec("PROGRM_PRC_TY_NM", "price_type", "str", max_length=50),
+    ColumnSpec("HMPG_URL", "homepage_url", "str", max_length=500),
+]
+
+# 증분 적재 자연키 (시설 + 프로그램 + 일정)
+PROGRAM_KEY_COLUMNS = (
+    "facility_name",
+    "address",
+    "program_name",
+    "target_group",
+    "schedule_weekdays",
+    "schedule_time",
+)
+
+# 청크 크기 (행)
+CHUNK_SIZE = 50000
+
+
+def transform_chunk(chunk_df: pd.DataFrame) -> pd.DataFrame:
+    """CSV 청크 → programs 테이블 컬럼 DataFrame (컬럼 단위 벡터 연산 + geohash)"""
+    out = transform_frame(chunk_df, COLUMNS)
+    out["geohash"] = encode_geohash_array(out["latitude"].to_numpy(), out["longitude"].to_numpy())
+    return out
+
+
+def find_data_files(data_dir=None):
+    """분할된 프로그램 CSV 파일 목록"""
+    data_dir = data_dir or default_data_dir()
+    return sorted(glob.glob(os.path.join(data_dir, "청소년_프로그램_*.csv")))
+
+
+def read_chunks(data_path, chunk_size=CHUNK_SIZE, skip=0):
+    """
+    CSV 청크 읽기 (Parquet 캐시가 있으면 캐시에서, 필요한 컬럼만)
+
+    모든 컬럼을 문자열로 읽어 코드 값의 '123.0' 변환을 막고, 숫자/날짜는 transform_chunk에서 변환합니다.
+    skip은 앞에서 건너뛸 행 수 (--resume 시 이미 적재된 행).
+    """
+    chunks = read_csv_chunks(data_path, chunk_size, columns=source_columns(COLUMNS))
+    return skip_rows(chunks, skip) if skip else chunks
+
+
+def finalize_program_load(db, reload_target, checkpoints=None):
+    """적재 후 파생 데이터 갱신 (종목 태그, shadow 교체, 검색 인덱스, 대시보드 요약, 체크포인트 삭제)"""
+    # 종목 태그 계산 (추천 API용)
+    tag_count = rebuild_sport_tags(
+        db,
+        program_table=reload_target.target(Program.__table__),
+        tag_table=reload_target.target(ProgramSportTag.__table__),
+    )
+    db.commit()
+    print(f"Tagged {tag_count} program sports")
+
+    def on_swap(db):
+        rebuild_search_index(db)
+        if checkpoints is not None:
+            checkpoints.clear(db)
+
+    # 검색 인덱스 동기화, 체크포인트 삭제 (shadow 모드면 교체와 같은 트랜잭션)
+    reload_target.finish(db, on_swap=on_swap)
+    print("Search index rebuilt")
+
+    # 대시보드 요약 스냅샷 갱신
+    refresh_dashboard_summary(db)
+    db.commit()
+
+
+class LoadProgress:
+    """적재 진행 상황 (여러 writer 스레드 공용)"""
+
+    def __init__(self, label: str = "Inserted", initial: int = 0):
+        self.label = label
+        # 이전 실행에서 적재된 행 수 (--resume, 속도 계산에서 제외)
+        self.initial = initial
+        self.total = initial
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, count: int) -> None:
+        with self._lock:
+            self.total += count
+            elapsed = time.perf_counter() - self.started
+            print(f"{self.label} {self.total} records... ({(self.total - self.initial) / elapsed:,.0f} rows/sec)")
+
+
+def load_sequential(data_files, limit, progress, write_batch, offsets=None):
+    """
+    분할 파일을 한 프로세스에서 순서대로 파싱 후 write_batch(파일, 변환된 DataFrame)로 적재
+
+    offsets: 분할 파일 이름 → 건너뛸 행 수 (--resume)
+    """
+    offsets = offsets or {}
+    for data_path in data_files:
+        print(f"Loading data from: {data_path}")
+
+        if limit and progress.total >= limit:
+            break
+
+        # 청크 단위로 읽어 변환 후 일괄 적재
+        for chunk_df in read_chunks(data_path, skip=offsets.get(os.path.basename(data_path), 0)):
+            if limit:
+                remaining = limit - progress.total
+                if remaining <= 0:
+                    break
+                chunk_df = chunk_df.iloc[:remaining]
+
+            progress.add(write_batch(data_path, transform_chunk(chunk_df)))
+
+
+def stream_batches(data_files, limit, report, offsets=None):
+    """
+    분할 파일 → 읽기 → (limit) → 변환 → 고정 크기 배치 (제너레이터 단계, 단계별 계측)
+
+    (분할 파일, 배치)를 반환하며 배치는 분할 파일 경계를 넘지 않습니다 (체크포인트 단위).
+    limit은 이번 실행에서 읽을 행 수 (None이면 전체), offsets는 load_sequential과 같음.
+    """
+    offsets = offsets or {}
+    remaining = limit
+    for data_path in data_files:
+        if remaining is not None and remaining <= 0:
+            return
+        print(f"Loading data from: {data_path}")
+
+        chunks = read_chunks(data_path, settings.LOAD_STREAM_BATCH_ROWS, skip=offsets.get(os.path.basename(data_path), 0))
+        frames = report.source("read", chunks)
+        if remaining is not None:
+            frames = take_rows(frames, remaining)
+        frames = report.map("transform", transform_chunk, frames)
+        for batch in rebatch(frames):
+            if remaining is not None:
+                remaining -= len(batch)
+            yield data_path, batch
+
+
+# 파싱 워커 프로세스 전역 (Pool initializer에서 설정)
+_parsed_batches = None
+_stop_parsing = None
+
+
+def _init_parse_worker(parsed_batches, stop_parsing):
+    global _parsed_batches, _stop_parsing
+    _parsed_batches = parsed_batches
+    _stop_parsing = stop_parsing
+
+
+def parse_shard(task):
+    """
+    (워커 프로세스) 분할 파일 하나를 청크 단위로 변환해 대기열에 넣음
+
+    task: (파일, 건너뛸 행 수)
+    대기열 메시지: ("batch", 파일, 변환된 DataFrame) / ("done", 파일, 오류 메시지 또는 None)
+    """
+    data_path, skip = task
+    error = None
     try:
-        return datetime.strptime(str(date_str)[:8], "%Y%m%d").date()
-    except Exception:
-        return None
+        for chunk_df in read_chunks(data_path, skip=skip):
+            if _stop_parsing.is_set():
+                break
+            _parsed_batches.put(("batch", data_path, transform_chunk(chunk_df)))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        _parsed_batches.put(("done", data_path, error))
+
+
+def write_batches(table, ready, progress, errors, checkpoints=None):
+    """(writer 스레드) 대기열의 (파일, 배치)를 전용 커넥션으로 적재 (체크포인트도 같은 트랜잭션)"""
+    db = SessionLocal()
+    try:
+        while True:
+            item = ready.get()
+            if item is None:
+                break
+            if errors:
+                # 다른 곳에서 실패했으면 남은 배치는 버리고 종료 신호까지 비움
+                continue
+            data_path, batch = item
+            try:
+                inserted = insert_dataframe(db, table, batch)
+                if checkpoints is not None:
+                    checkpoints.advance(db, data_path, inserted)
+                db.commit()
+                progress.add(inserted)
+            except Exception as e:
+                db.rollback()
+                errors.append(e)
+    finally:
+        db.close()
+
+
+def load_parallel(table, data_files, limit, progress, workers, writers, checkpoints=None, offsets=None):
+    """
+    분할 파일 병렬 적재
 
+    파싱/변환은 프로세스 풀(workers)에서, 적재는 writer 스레드(writers, 각자 커넥션)에서
+    수행합니다. 두 단계 사이 대기열은 크기가 제한되어 있어 적재가 밀리면 파싱도 멈춥니다.
+    분할 파일마다 writer를 고정해 파일 안의 배치는 순서대로 commit됩니다 (체크포인트).
+    """
+    offsets = offsets or {}
+    if engine.dialect.name == "sqlite":
+        # SQLite는 동시 쓰기 불가
+        writers = 1
 
-def load_programs(limit=None):
+    ctx = multiprocessing.get_context()
+    parsed_batches = ctx.Queue(maxsize=settings.LOAD_QUEUE_MAXSIZE)
+    stop_parsing = ctx.Event()
+    ready = [queue.Queue(maxsize=settings.LOAD_QUEUE_MAXSIZE) for _ in range(writers)]
+    shard_writer = {data_path: index % writers for index, data_path in enumerate(data_files)}
+    errors = []
+
+    writer_threads = [
+        threading.Thread(target=write_batches, args=(table, writer_queue, progress, errors, checkpoints), daemon=True)
+        for writer_queue in ready
+    ]
+    for thread in writer_threads:
+        thread.start()
+
+    print(f"Parallel load: {workers} parse workers, {writers} writer connections")
+
+    shard_rows = {data_path: 0 for data_path in data_files}
+    shards_done = 0
+    forwarded = progress.total
+    tasks = [(data_path, offsets.get(os.path.basename(data_path), 0)) for data_path in data_files]
+
+    with ctx.Pool(workers, initializer=_init_parse_worker, initargs=(parsed_batches, stop_parsing)) as pool:
+        pool.map_async(parse_shard, tasks)
+
+        # 워커 결과를 writer 대기열로 전달 (모든 분할 파일이 끝날 때까지 비움)
+        while shards_done < len(data_files):
+            kind, data_path, payload = parsed_batches.get()
+            shard_name = os.path.basename(data_path)
+
+            if kind == "done":
+                shards_done += 1
+                if payload:
+                    errors.append(RuntimeError(f"{shard_name}: {payload}"))
+                print(f"[{shards_done}/{len(data_files)}] {shard_name} parsed ({shard_rows[data_path]} rows)")
+            elif not errors and not stop_parsing.is_set():
+                batch = payload
+                if limit:
+                    batch = batch.iloc[:limit - forwarded]
+                shard_rows[data_path] += len(batch)
+                forwarded += len(batch)
+                ready[shard_writer[data_path]].put((data_path, batch))
+
+            if errors or (limit and forwarded >= limit):
+                stop_parsing.set()
+
+    for writer_queue in ready:
+        writer_queue.put(None)
+    for thread in writer_threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def load_programs(
+    limit=None,
+    data_dir=None,
+    workers=None,
+    writers=None,
+    shadow=False,
+    incremental=False,
+    stream=False,
+    trace_memory=False,
+    resume=False,
+):
     """프로그램 데이터 적재"""
-    # backend 폴더 기준 (Docker에서는 /app)
-    backend_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    data_dir = os.path.join(backend_root, "data")
+    if resume and incremental:
+        raise ValueError("--resume cannot be combined with --incremental")
 
-    # 분할된 파일들 찾기
-    data_files = sorted(glob.glob(os.path.join(data_dir, "청소년_프로그램_*.csv")))
+    workers = workers or settings.LOAD_PARSE_WORKERS
+    writers = writers or settings.LOAD_WRITER_CONNECTIONS
+    data_files = find_data_files(data_dir)
 
     if not data_files:
         print("No data files found!")
@@ -69,70 +354,76 @@ def load_programs(limit=None):
 
     print(f"Found {len(data_files)} data files")
 
-    # CSV 읽기 (대용량이므로 청크로 처리)
-    chunk_size = 10000
-    total_inserted = 0
-
     db = SessionLocal()
 
+    # 스트리밍 적재 단계 계측 (--stream)
+    report = LoadReport("programs", trace_memory=trace_memory) if stream else None
+
     try:
-        # 기존 데이터 삭제
-        deleted = db.query(Program).delete()
-        db.commit()
-        print(f"Deleted {deleted} existing records")
+        reload_target = ReloadTarget([Program.__table__, ProgramSportTag.__table__], shadow=shadow and not incremental)
 
-        # 각 분할 파일 처리
-        for data_path in data_files:
-            print(f"Loading data from: {data_path}")
+        if incremental:
+            # 바뀐 행만 반영 (파일 순서로 중복 키를 구분하므로 순차 처리, 한 트랜잭션)
+            changes = IncrementalLoad(db, Program.__table__, PROGRAM_KEY_COLUMNS)
+            progress = LoadProgress("Compared")
+            checkpoints = None
+            if stream:
+                for _, batch in stream_batches(data_files, limit or None, report):
+                    progress.add(report.measure("compare", changes.apply, batch))
+            else:
+                load_sequential(data_files, limit, progress, lambda data_path, batch: changes.apply(batch))
+            changes.finish()
+            db.commit()
+        else:
+            table = reload_target.target(Program.__table__)
+            checkpoints = ShardCheckpoints("programs", table.name)
+            offsets = checkpoints.saved(db, data_files) if resume else {}
 
-            if limit and total_inserted >= limit:
-                break
+            if offsets:
+                print(f"Resuming from checkpoint: {sum(offsets.values())} rows already loaded into {table.name}")
+            else:
+                if resume:
+                    print("No usable checkpoint, starting a full load")
+                # 이전 체크포인트 삭제 후 기존 데이터 삭제 (종목 태그 먼저) 또는 shadow 테이블 준비
+                checkpoints.clear(db)
+                db.commit()
+                deleted = reload_target.prepare(db)
+                if reload_target.shadow:
+                    print("Loading into shadow tables")
+                else:
+                    print(f"Deleted {deleted} existing records")
 
-            # 청크 단위로 읽기
-            for chunk_df in pd.read_csv(data_path, encoding="utf-8-sig", chunksize=chunk_size):
-                if limit and total_inserted >= limit:
-                    break
+            progress = LoadProgress(initial=sum(offsets.values()))
+
+            def write_batch(data_path, batch):
+                # 배치와 체크포인트를 한 트랜잭션으로 commit
+                inserted = insert_dataframe(db, table, batch)
+                checkpoints.advance(db, data_path, inserted)
+                db.commit()
+                return inserted
+
+            if stream:
+                remaining = max(limit - progress.total, 0) if limit else None
+                for data_path, batch in stream_batches(data_files, remaining, report, offsets):
+                    progress.add(report.measure("write", lambda frame: write_batch(data_path, frame), batch))
+            elif workers > 1 and len(data_files) > 1:
+                load_parallel(
+                    table, data_files, limit, progress, min(workers, len(data_files)), writers,
+                    checkpoints=checkpoints, offsets=offsets,
+                )
+            else:
+                load_sequential(data_files, limit, progress, write_batch, offsets)
+
+        total_inserted = progress.total
+        elapsed = time.perf_counter() - progress.started
+        loaded = total_inserted - progress.initial
+        print(f"Loaded {loaded} rows in {elapsed:.1f}s ({loaded / max(elapsed, 1e-9):,.0f} rows/sec)")
 
-                records = []
-                for _, row in chunk_df.iterrows():
-                    if limit and total_inserted + len(records) >= limit:
-                        break
-
-                    record = Program(
-                        facility_name=str(row["FCLTY_NM"])[:200] if pd.notna(row.get("FCLTY_NM")) else None,
-                        facility_type_code=str(row["FCLTY_SDIV_CD"])[:20] if pd.notna(row.get("FCLTY_SDIV_CD")) else None,
-                        facility_type_name=str(row["FCLTY_FLAG_NM"])[:100] if pd.notna(row.get("FCLTY_FLAG_NM")) else None,
-                        industry_code=str(row["INDUTY_CD"])[:20] if pd.notna(row.get("INDUTY_CD")) else None,
-                        industry_name=str(row["INDUTY_NM"])[:100] if pd.notna(row.get("INDUTY_NM")) else None,
-                        region_sido_code=str(row["CTPRVN_CD"])[:20] if pd.notna(row.get("CTPRVN_CD")) else None,
-                        region_sido=str(row["CTPRVN_NM"])[:50] if pd.notna(row.get("CTPRVN_NM")) else None,
-                        region_sigungu_code=str(row["SIGNGU_CD"])[:20] if pd.notna(row.get("SIGNGU_CD")) else None,
-                        region_sigungu=str(row["SIGNGU_NM"])[:50] if pd.notna(row.get("SIGNGU_NM")) else None,
-                        emd_name=str(row["EMD_NM"])[:50] if pd.notna(row.get("EMD_NM")) else None,
-                        address=str(row["FCLTY_ADDR"])[:500] if pd.notna(row.get("FCLTY_ADDR")) else None,
-                        latitude=float(row["FCLTY_LA"]) if pd.notna(row.get("FCLTY_LA")) else None,
-                        longitude=float(row["FCLTY_LO"]) if pd.notna(row.get("FCLTY_LO")) else None,
-                        program_type=str(row["PROGRM_TY_NM"])[:100] if pd.notna(row.get("PROGRM_TY_NM")) else None,
-                        program_name=str(row["PROGRM_NM"])[:200] if pd.notna(row.get("PROGRM_NM")) else None,
-                        target_group=str(row["PROGRM_TRGET_NM"])[:100] if pd.notna(row.get("PROGRM_TRGET_NM")) else None,
-                        start_date=parse_date(row.get("PROGRM_BEGIN_DE")),
-                        end_date=parse_date(row.get("PROGRM_END_DE")),
-                        schedule_weekdays=str(row["PROGRM_ESTBL_WKDAY_NM"])[:50] if pd.notna(row.get("PROGRM_ESTBL_WKDAY_NM")) else None,
-                        schedule_time=str(row["PROGRM_ESTBL_TIZN_VALUE"])[:50] if pd.notna(row.get("PROGRM_ESTBL_TIZN_VALUE")) else None,
-                        capacity=int(float(row["PROGRM_RCRIT_NMPR_CO"])) if pd.notna(row.get("PROGRM_RCRIT_NMPR_CO")) else None,
-                        price=float(row["PROGRM_PRC"]) if pd.notna(row.get("PROGRM_PRC")) else None,
-                        price_type=str(row["PROGRM_PRC_TY_NM"])[:50] if pd.notna(row.get("PROGRM_PRC_TY_NM")) else None,
-                        homepage_url=str(row["HMPG_URL"])[:500] if pd.notna(row.get("HMPG_URL")) else None,
-                    )
-                    records.append(record)
-
-                if records:
-                    db.bulk_save_objects(records)
-                    db.commit()
-                    total_inserted += len(records)
-                    print(f"Inserted {total_inserted} records...")
+        finalize_program_load(db, reload_target, checkpoints)
 
         print(f"Done! Total inserted: {total_inserted}")
+        if report is not None:
+            report.print()
 
     except Exception as e:
         db.rollback()
@@ -146,5 +437,30 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument("--limit", type=int, default=None, help="Limit number of records to insert")
+    parser.add_argument("--data-dir", default=None, help="Directory containing 청소년_프로그램_*.csv")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"CSV parse processes (default: LOAD_PARSE_WORKERS={settings.LOAD_PARSE_WORKERS})")
+    parser.add_argument("--writers", type=int, default=None,
+                        help=f"Writer connections (default: LOAD_WRITER_CONNECTIONS={settings.LOAD_WRITER_CONNECTIONS})")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--shadow", action="store_true", help="Load into shadow tables and swap atomically")
+    mode.add_argument("--incremental", action="store_true", help="Apply only inserted/changed/deleted rows")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream fixed-size batches sequentially and print a load report")
+    parser.add_argument("--trace-memory", action="store_true", help="Also report peak tracemalloc allocations (with --stream)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted full load from its last checkpoint (same --shadow setting)")
     args = parser.parse_args()
-    load_programs(limit=args.limit)
+    if args.resume and args.incremental:
+        parser.error("--resume cannot be combined with --incremental")
+    load_programs(
+        limit=args.limit,
+        data_dir=args.data_dir,
+        workers=args.workers,
+        writers=args.writers,
+        shadow=args.shadow,
+        incremental=args.incremental,
+        stream=args.stream,
+        trace_memory=args.trace_memory,
+        resume=args.resume,
+    )
@@ -8,75 +8,71 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-import pandas as pd
 from app.database import SessionLocal
+from app.services.dashboard_service import refresh_dashboard_summary
 from app.models.support import SupportStats
-
-
-# 컬럼 매핑
-COLUMN_MAP = {
-    "BASE_YEAR": "base_year",
-    "CTPRVN_CD": "region_sido_code",
-    "CTPRVN_NM": "region_sido",
-    "SIGNGU_CD": "region_sigungu_code",
-    "SIGNGU_NM": "region_sigungu",
-    "SIGNGU_ACCTO_POPLTN_CO": "population",
-    "SIGNGU_ACCTO_FCLTY_CO": "facility_count",
-    "RECIPT_FLAG_CD": "recipient_type_code",
-    "RECIPT_FLAG_NM": "recipient_type_name",
-    "CRRSPND_FLAG_TRGET_NMPR_CO": "target_count",
-    "CRRSPND_FLAG_RECIPT_NMPR_CO": "recipient_count",
-}
-
-
-def load_support_stats():
+from app.scripts.csv_cache import default_data_dir, read_csv
+from app.scripts.loader import ColumnSpec, source_columns, transform_frame, stream_csv, load_batches
+from app.scripts.streaming import LoadReport
+
+
+# 원본 파일 (data/ 아래)
+DATA_FILE = "지역별스포츠강좌이용권활용정보(202507).csv"
+
+# 컬럼 규칙: CSV 컬럼 → DB 컬럼 (타입, 최대 길이, 기본값)
+COLUMNS = [
+    ColumnSpec("BASE_YEAR", "base_year", "int", default=2025),
+    ColumnSpec("CTPRVN_CD", "region_sido_code", "str", max_length=20),
+    ColumnSpec("CTPRVN_NM", "region_sido", "str", max_length=50),
+    ColumnSpec("SIGNGU_CD", "region_sigungu_code", "str", max_length=20),
+    ColumnSpec("SIGNGU_NM", "region_sigungu", "str", max_length=50),
+    ColumnSpec("SIGNGU_ACCTO_POPLTN_CO", "population", "int"),
+    ColumnSpec("SIGNGU_ACCTO_FCLTY_CO", "facility_count", "int"),
+    ColumnSpec("RECIPT_FLAG_CD", "recipient_type_code", "str", max_length=10),
+    ColumnSpec("RECIPT_FLAG_NM", "recipient_type_name", "str", max_length=100),
+    ColumnSpec("CRRSPND_FLAG_TRGET_NMPR_CO", "target_count", "int"),
+    ColumnSpec("CRRSPND_FLAG_RECIPT_NMPR_CO", "recipient_count", "int"),
+]
+
+# 증분 적재 자연키 (기준연도 + 시도/시군구 코드 + 수혜 구분)
+KEY_COLUMNS = ("base_year", "region_sido_code", "region_sigungu_code", "recipient_type_code")
+
+
+def load_support_stats(shadow=False, incremental=False, stream=False, trace_memory=False):
     """스포츠강좌이용권 통계 데이터 적재"""
-    # backend 폴더 기준 (Docker에서는 /app)
-    backend_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    data_path = os.path.join(
-        backend_root,
-        "data",
-        "지역별스포츠강좌이용권활용정보(202507).csv"
-    )
+    data_path = os.path.join(default_data_dir(), DATA_FILE)
 
     print(f"Loading data from: {data_path}")
 
-    # CSV 읽기
-    df = pd.read_csv(data_path, encoding="utf-8-sig")
-    print(f"Loaded {len(df)} rows")
+    report = None
+    if stream:
+        # 고정 크기 배치로 읽기 → 변환 → 적재 (메모리 상한 고정, 단계별 계측)
+        report = LoadReport("support_stats", trace_memory=trace_memory)
+        batches = stream_csv(data_path, COLUMNS, report)
+    else:
+        # CSV 읽기 (Parquet 캐시가 있으면 캐시에서, 필요한 컬럼만 문자열로)
+        df = read_csv(data_path, columns=source_columns(COLUMNS))
+        print(f"Loaded {len(df)} rows")
+
+        # 컬럼 단위 변환
+        batches = [transform_frame(df, COLUMNS)]
 
     # DB 세션
     db = SessionLocal()
 
     try:
-        # 기존 데이터 삭제
-        deleted = db.query(SupportStats).delete()
-        db.commit()
-        print(f"Deleted {deleted} existing records")
-
-        # 배치 삽입
-        records = []
-
-        for _, row in df.iterrows():
-            record = SupportStats(
-                base_year=int(row["BASE_YEAR"]) if pd.notna(row.get("BASE_YEAR")) else 2025,
-                region_sido_code=str(row["CTPRVN_CD"])[:20] if pd.notna(row.get("CTPRVN_CD")) else None,
-                region_sido=str(row["CTPRVN_NM"])[:50] if pd.notna(row.get("CTPRVN_NM")) else None,
-                region_sigungu_code=str(row["SIGNGU_CD"])[:20] if pd.notna(row.get("SIGNGU_CD")) else None,
-                region_sigungu=str(row["SIGNGU_NM"])[:50] if pd.notna(row.get("SIGNGU_NM")) else None,
-                population=int(row["SIGNGU_ACCTO_POPLTN_CO"]) if pd.notna(row.get("SIGNGU_ACCTO_POPLTN_CO")) else None,
-                facility_count=int(row["SIGNGU_ACCTO_FCLTY_CO"]) if pd.notna(row.get("SIGNGU_ACCTO_FCLTY_CO")) else None,
-                recipient_type_code=str(row["RECIPT_FLAG_CD"])[:10] if pd.notna(row.get("RECIPT_FLAG_CD")) else None,
-                recipient_type_name=str(row["RECIPT_FLAG_NM"])[:100] if pd.notna(row.get("RECIPT_FLAG_NM")) else None,
-                target_count=int(row["CRRSPND_FLAG_TRGET_NMPR_CO"]) if pd.notna(row.get("CRRSPND_FLAG_TRGET_NMPR_CO")) else None,
-                recipient_count=int(row["CRRSPND_FLAG_RECIPT_NMPR_CO"]) if pd.notna(row.get("CRRSPND_FLAG_RECIPT_NMPR_CO")) else None,
-            )
-            records.append(record)
-
-        db.bulk_save_objects(records)
+        load_batches(
+            db, SupportStats.__table__, batches, KEY_COLUMNS,
+            shadow=shadow, incremental=incremental, report=report,
+        )
+
+        # 대시보드 요약 스냅샷 갱신
+        refresh_dashboard_summary(db)
         db.commit()
-        print(f"Inserted {len(records)} records")
+
         print("Done!")
+        if report is not None:
+            report.print()
 
     except Exception as e:
         db.rollback()
@@ -87,4 +83,12 @@ def load_support_stats():
 
 
 if __name__ == "__main__":
-    load_support_stats()
+    import argparse
+    parser = argparse.ArgumentParser()
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--shadow", action="store_true", help="Load into a shadow table and swap atomically")
+    mode.add_argument("--incremental", action="store_true", help="Apply only inserted/changed/deleted rows")
+    parser.add_argument("--stream", action="store_true", help="Stream fixed-size batches and print a load report")
+    parser.add_argument("--trace-memory", action="store_true", help="Also report peak tracemalloc allocations (with --stream)")
+    args = parser.parse_args()
+    load_support_stats(shadow=args.shadow, incremental=args.incremental, stream=args.stream, trace_memory=args.trace_memory)
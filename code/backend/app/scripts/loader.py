@@ -0,0 +1,152 @@
+"""
+적재 스크립트 공용 프레임워크
+
+- ColumnSpec: CSV 컬럼 → DB 컬럼 선언 (타입, 최대 길이, 기본값)
+- transform_frame: 선언대로 컬럼 단위 벡터 변환 (형 변환/자르기/결측 처리)
+- load_batches: 변환된 배치를 전체 재적재(DELETE 또는 shadow 교체) 또는 증분 적재
+- stream_csv: 고정 크기 배치로 읽기 → 변환 (--stream, 메모리 상한 고정)
+
+원본은 모든 컬럼을 문자열로 읽고 (csv_cache.read_csv) 형 변환은 여기서만 합니다.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.scripts.bulk_insert import insert_dataframe
+from app.scripts.csv_cache import read_csv_chunks
+from app.scripts.incremental import IncrementalLoad
+from app.scripts.streaming import LoadReport, rebatch
+from app.scripts.table_swap import ReloadTarget
+
+
+# 지원 타입
+COLUMN_KINDS = ("str", "int", "float", "date")
+
+
+class ColumnSpec:
+    """CSV 컬럼 하나의 적재 규칙"""
+
+    def __init__(
+        self,
+        source: str,
+        target: str,
+        kind: str = "str",
+        max_length: Optional[int] = None,
+        default: Any = None,
+    ):
+        if kind not in COLUMN_KINDS:
+            raise ValueError(f"unknown column kind: {kind}")
+        self.source = source
+        self.target = target
+        self.kind = kind
+        self.max_length = max_length
+        self.default = default
+
+    def __repr__(self) -> str:
+        return f"ColumnSpec({self.source!r} -> {self.target!r}, {self.kind})"
+
+
+def source_columns(specs: Sequence[ColumnSpec]) -> List[str]:
+    """읽어야 할 CSV 컬럼 목록 (projection용)"""
+    return [spec.source for spec in specs]
+
+
+def _source(df: pd.DataFrame, source: str) -> pd.Series:
+    """CSV 컬럼 (없으면 전체 결측)"""
+    if source in df:
+        return df[source]
+    return pd.Series(pd.NA, index=df.index, dtype="object")
+
+
+def parse_date_series(series: pd.Series) -> pd.Series:
+    """날짜 문자열 컬럼 파싱 (앞 8자리 YYYYMMDD, 실패 시 None)"""
+    parsed = pd.to_datetime(series.astype("string").str.slice(0, 8), format="%Y%m%d", errors="coerce")
+    return parsed.dt.date.astype(object).where(parsed.notna(), None)
+
+
+def _convert(series: pd.Series, spec: ColumnSpec) -> pd.Series:
+    if spec.kind == "str":
+        values = series.astype("string")
+        if spec.max_length:
+            values = values.str.slice(0, spec.max_length)
+    elif spec.kind == "float":
+        values = pd.to_numeric(series, errors="coerce").astype("float64")
+    elif spec.kind == "int":
+        # 소수점이 있는 값은 버림 (예: "12.7" → 12)
+        values = np.trunc(pd.to_numeric(series, errors="coerce").astype("float64")).astype("Int64")
+    else:
+        values = parse_date_series(series)
+
+    if spec.default is not None:
+        values = values.fillna(spec.default)
+    return values
+
+
+def transform_frame(df: pd.DataFrame, specs: Sequence[ColumnSpec]) -> pd.DataFrame:
+    """원본 DataFrame → DB 컬럼 DataFrame (컬럼 단위 벡터 연산)"""
+    return pd.DataFrame(
+        {spec.target: _convert(_source(df, spec.source), spec) for spec in specs},
+        index=df.index,
+    )
+
+
+def stream_csv(
+    source: str,
+    specs: Sequence[ColumnSpec],
+    report: LoadReport,
+    transform: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+) -> Iterator[pd.DataFrame]:
+    """원본 CSV → 읽기 → 변환 → 고정 크기 배치 (제너레이터 단계, 단계별 계측)"""
+    chunks = read_csv_chunks(source, settings.LOAD_STREAM_BATCH_ROWS, columns=source_columns(specs))
+    frames = report.source("read", chunks)
+    frames = report.map("transform", transform or (lambda df: transform_frame(df, specs)), frames)
+    return rebatch(frames)
+
+
+def load_batches(
+    db: Session,
+    table: Table,
+    batches: Iterable[pd.DataFrame],
+    key_columns: Sequence[str],
+    shadow: bool = False,
+    incremental: bool = False,
+    report: Optional[LoadReport] = None,
+) -> int:
+    """
+    변환된 배치 적재 (배치마다 commit), 처리한 행 수 반환
+
+    - incremental: 배치마다 비교하고 변경은 마지막에 한 트랜잭션으로 반영
+    - shadow: shadow 테이블에 적재 후 원본과 교체
+    - 기본: 기존 행 DELETE 후 적재
+    """
+    if incremental:
+        changes = IncrementalLoad(db, table, key_columns)
+        apply = changes.apply
+    else:
+        reload_target = ReloadTarget([table], shadow=shadow)
+        deleted = reload_target.prepare(db)
+        if shadow:
+            print("Loading into shadow table")
+        else:
+            print(f"Deleted {deleted} existing records")
+
+        def apply(batch: pd.DataFrame) -> int:
+            inserted = insert_dataframe(db, reload_target.target(table), batch)
+            db.commit()
+            return inserted
+
+    written = report.map("write", apply, batches) if report is not None else map(apply, batches)
+    total = sum(written)
+
+    if incremental:
+        changes.finish()
+        db.commit()
+    else:
+        print(f"Inserted {total} records")
+        # shadow 모드면 인덱스 생성 후 원본과 교체
+        reload_target.finish(db)
+    return total
+
@@ -0,0 +1,203 @@
+"""
+스트리밍 적재 (메모리 상한 고정) 및 단계별 계측
+
+- 원본 읽기 → 변환 → 고정 크기 배치 → 적재를 제너레이터 단계로 연결해
+  한 번에 배치 몇 개만 메모리에 올라오게 함 (작은 인스턴스에서 OOM 방지)
+- 단계별 처리 행/초, 바이트/초(DataFrame 메모리 크기 기준), 배치 지연(평균/최대)과
+  최대 RSS(resource), 선택적으로 tracemalloc 최대 할당량을 적재 끝에 보고
+"""
+
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+import pandas as pd
+from app.config import settings
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+# 바이트 추정용 표본 행 수 (문자열 컬럼 deep 계산 비용 제한)
+BYTES_SAMPLE_ROWS = 2000
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    """DataFrame 메모리 크기 추정 (큰 프레임은 앞부분 표본으로 추정)"""
+    if len(df) <= BYTES_SAMPLE_ROWS:
+        return int(df.memory_usage(index=False, deep=True).sum())
+    sample = int(df.iloc[:BYTES_SAMPLE_ROWS].memory_usage(index=False, deep=True).sum())
+    return sample * len(df) // BYTES_SAMPLE_ROWS
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """프로세스 최대 RSS (resource 미지원 환경이면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _megabytes(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value / (1 << 20):,.1f} MB"
+
+
+class StageStats:
+    """단계 하나의 누적 처리량/지연"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows = 0
+        self.bytes = 0
+        self.batches = 0
+        self.seconds = 0.0
+        self.max_latency = 0.0
+
+    def record(self, rows: int, nbytes: int, latency: float) -> None:
+        self.rows += rows
+        self.bytes += nbytes
+        self.batches += 1
+        self.seconds += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def summary(self) -> str:
+        seconds = max(self.seconds, 1e-9)
+        average = self.seconds / self.batches if self.batches else 0.0
+        return (
+            f"{self.name:<10} {self.rows:>10,} rows {self.batches:>6,} batches  "
+            f"{self.rows / seconds:>12,.0f} rows/s {_megabytes(self.bytes / seconds):>11}/s  "
+            f"latency avg {average * 1000:,.1f} ms / max {self.max_latency * 1000:,.1f} ms"
+        )
+
+
+class LoadReport:
+    """
+    스트리밍 적재 단계 계측 및 최종 보고
+
+    source()/map()으로 제너레이터 단계를 감싸면 각 단계 자신의 처리 시간만 측정합니다
+    (앞 단계를 기다린 시간은 포함하지 않음).
+    """
+
+    def __init__(self, label: str, trace_memory: bool = False):
+        self.label = label
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, StageStats] = {}
+        self.started = time.perf_counter()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stage(self, name: str) -> StageStats:
+        if name not in self.stages:
+            self.stages[name] = StageStats(name)
+        return self.stages[name]
+
+    def source(self, name: str, frames: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """원본 단계 (다음 프레임을 만드는 데 걸린 시간 측정)"""
+        # 보고 순서가 파이프라인 순서가 되도록 감쌀 때 바로 등록
+        return self._timed_source(self.stage(name), iter(frames))
+
+    def map(self, name: str, fn: Callable, frames: Iterable[pd.DataFrame]) -> Iterator:
+        """변환/적재 단계 (fn 호출 시간 측정, 결과가 DataFrame이 아니면 입력 크기로 기록)"""
+        return self._timed_map(self.stage(name), fn, frames)
+
+    def measure(self, name: str, fn: Callable, frame: pd.DataFrame):
+        """배치 하나에 대해 fn 호출 후 결과 반환 (map과 같은 방식으로 기록)"""
+        return next(self.map(name, fn, [frame]))
+
+    @staticmethod
+    def _timed_source(stats: StageStats, frames: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        while True:
+            started = time.perf_counter()
+            try:
+                frame = next(frames)
+            except StopIteration:
+                return
+            stats.record(len(frame), frame_bytes(frame), time.perf_counter() - started)
+            yield frame
+
+    @staticmethod
+    def _timed_map(stats: StageStats, fn: Callable, frames: Iterable[pd.DataFrame]) -> Iterator:
+        for frame in frames:
+            started = time.perf_counter()
+            result = fn(frame)
+            latency = time.perf_counter() - started
+            measured = result if isinstance(result, pd.DataFrame) else frame
+            stats.record(len(measured), frame_bytes(measured), latency)
+            yield result
+
+    def print(self) -> None:
+        elapsed = time.perf_counter() - self.started
+        print(f"Load report: {self.label} ({elapsed:.1f}s)")
+        for stats in self.stages.values():
+            print(f"  {stats.summary()}")
+        print(f"  peak RSS {_megabytes(peak_rss_bytes())}")
+        if self.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  peak traced allocations {_megabytes(peak)}")
+
+
+def skip_rows(frames: Iterable[pd.DataFrame], count: int) -> Iterator[pd.DataFrame]:
+    """앞에서부터 count 행을 버리고 나머지 전달"""
+    remaining = count
+    for frame in frames:
+        if remaining >= len(frame):
+            remaining -= len(frame)
+            continue
+        if remaining:
+            frame = frame.iloc[remaining:]
+            remaining = 0
+        yield frame
+
+
+def take_rows(frames: Iterable[pd.DataFrame], limit: int) -> Iterator[pd.DataFrame]:
+    """앞에서부터 limit 행까지만 전달 (도달하면 앞 단계도 더 읽지 않음)"""
+    remaining = limit
+    if remaining <= 0:
+        return
+    for frame in frames:
+        frame = frame.iloc[:remaining]
+        remaining -= len(frame)
+        yield frame
+        if remaining <= 0:
+            return
+
+
+def rebatch(
+    frames: Iterable[pd.DataFrame],
+    batch_rows: Optional[int] = None,
+    batch_bytes: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    고정 크기 배치로 다시 자르기
+
+    batch_rows 행 또는 batch_bytes 바이트(첫 프레임의 행당 크기로 추정) 중 작은 쪽을
+    배치 크기로 씁니다. 기본값은 LOAD_STREAM_BATCH_ROWS / LOAD_STREAM_BATCH_MB.
+    """
+    batch_rows = batch_rows or settings.LOAD_STREAM_BATCH_ROWS
+    batch_bytes = batch_bytes or settings.LOAD_STREAM_BATCH_MB << 20
+    size = None
+    buffered: List[pd.DataFrame] = []
+    buffered_rows = 0
+
+    for frame in frames:
+        if frame.empty:
+            continue
+        if size is None:
+            row_bytes = max(frame_bytes(frame) // len(frame), 1)
+            size = max(1, min(batch_rows, batch_bytes // row_bytes))
+        buffered.append(frame)
+        buffered_rows += len(frame)
+        while buffered_rows >= size:
+            merged = pd.concat(buffered) if len(buffered) > 1 else buffered[0]
+            yield merged.iloc[:size]
+            # 남은 행만 복사해 합친 프레임 전체가 메모리에 남지 않게 함
+            rest = merged.iloc[size:].copy()
+            buffered = [rest] if len(rest) else []
+            buffered_rows = len(rest)
+
+    if buffered:
+        yield pd.concat(buffered) if len(buffered) > 1 else buffered[0]
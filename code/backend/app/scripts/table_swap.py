@@ -0,0 +1,203 @@
+"""
+전체 재적재 대상 테이블 관리
+
+- 기본: 기존 행 DELETE 후 원본 테이블에 직접 적재 (적재 중에는 빈/부분 데이터가 보임)
+- shadow: 같은 구조의 {테이블}__shadow에 적재 → 보조 인덱스 일괄 생성/ANALYZE →
+  한 트랜잭션에서 이름 교체 (조회 측은 교체 전 데이터 또는 완성된 데이터만 봄)
+
+교체는 묶음 단위로 수행하므로 programs와 program_sport_tags처럼 외래키로 엮인 테이블은
+함께 넘겨야 합니다 (부모 테이블이 먼저).
+"""
+
+import re
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import Column, ForeignKey, Index, MetaData, Table, delete, text
+from sqlalchemy.orm import Session
+
+
+# shadow 테이블/인덱스/제약조건 이름 접미사
+SHADOW_SUFFIX = "__shadow"
+# 교체 직후 잠시 남는 기존 테이블 이름 접미사
+OLD_SUFFIX = "__old"
+
+
+def _copy_table(table: Table, metadata: MetaData, shadow_names: Dict[str, str]) -> Table:
+    """컬럼/기본키만 복사한 shadow 테이블 정의 (외래키는 묶음 안의 shadow 테이블로 연결)"""
+    columns = []
+    for column in table.columns:
+        foreign_keys = [
+            ForeignKey(f"{shadow_names[fk.column.table.name]}.{fk.column.name}", ondelete=fk.ondelete)
+            for fk in column.foreign_keys
+            if fk.column.table.name in shadow_names
+        ]
+        columns.append(Column(
+            column.name,
+            column.type,
+            *foreign_keys,
+            primary_key=column.primary_key,
+            nullable=column.nullable,
+            server_default=column.server_default.arg if column.server_default is not None else None,
+        ))
+    return Table(shadow_names[table.name], metadata, *columns)
+
+
+class ReloadTarget:
+    """
+    재적재 대상 테이블 묶음
+
+    사용 순서: prepare() → target(table)에 적재 → finish()
+    """
+
+    def __init__(self, tables: List[Table], shadow: bool = False):
+        self.tables = tables
+        self.shadow = shadow
+        self._targets = {table.name: table for table in tables}
+        if shadow:
+            metadata = MetaData()
+            shadow_names = {table.name: f"{table.name}{SHADOW_SUFFIX}" for table in tables}
+            self._targets = {
+                table.name: _copy_table(table, metadata, shadow_names) for table in tables
+            }
+
+    def target(self, table: Table) -> Table:
+        """적재할 테이블 (shadow 모드면 shadow 테이블)"""
+        return self._targets[table.name]
+
+    def prepare(self, db: Session) -> Optional[int]:
+        """
+        적재 준비 (commit 포함)
+
+        Returns:
+            기본 모드: 첫 번째 테이블에서 삭제된 행 수 / shadow 모드: None
+        """
+        if not self.shadow:
+            deleted = 0
+            for table in reversed(self.tables):
+                deleted = db.execute(delete(table)).rowcount
+            db.commit()
+            return deleted
+
+        bind = db.connection()
+        # 이전 실행이 남긴 shadow 테이블 정리 후 생성 (보조 인덱스 없이)
+        for table in reversed(self.tables):
+            self.target(table).drop(bind, checkfirst=True)
+        for table in self.tables:
+            self.target(table).create(bind)
+            if bind.dialect.name == "postgresql":
+                # id가 기존 테이블 이후 값부터 이어지도록 시퀀스 맞춤
+                db.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence(:shadow, 'id'), "
+                    f"coalesce((SELECT max(id) FROM {table.name}), 0) + 1, false)"
+                ), {"shadow": self.target(table).name})
+        db.commit()
+        return None
+
+    def finish(self, db: Session, on_swap: Optional[Callable[[Session], None]] = None) -> None:
+        """
+        적재 완료 처리 (commit 포함)
+
+        shadow 모드: 보조 인덱스 생성/ANALYZE 후 원본과 교체.
+        on_swap은 교체 트랜잭션 안에서 호출됩니다 (SQLite FTS 재구성 등).
+        """
+        if not self.shadow:
+            if on_swap is not None:
+                on_swap(db)
+            db.commit()
+            return
+
+        dialect_name = db.get_bind().dialect.name
+        if dialect_name == "postgresql":
+            self._swap_postgresql(db, on_swap)
+        else:
+            self._swap_sqlite(db, on_swap)
+
+    def _shadow_indexes(self, table: Table, suffix: str) -> List[Index]:
+        """원본 테이블의 모델 정의 인덱스를 shadow 테이블 컬럼 기준으로 복사"""
+        shadow = self.target(table)
+        return [
+            Index(f"{index.name}{suffix}", *[shadow.c[column.name] for column in index.columns], unique=index.unique)
+            for index in table.indexes
+        ]
+
+    def _swap_postgresql(self, db: Session, on_swap) -> None:
+        bind = db.connection()
+
+        # 1. 보조 인덱스 일괄 생성 (모델 정의 + 마이그레이션으로 만든 pg_trgm 등) 및 통계 갱신
+        for table in self.tables:
+            shadow_name = self.target(table).name
+            for index in self._shadow_indexes(table, SHADOW_SUFFIX):
+                index.create(bind)
+            model_index_names = {index.name for index in table.indexes}
+            extra_indexes = db.execute(text(
+                "SELECT indexname, indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = :table "
+                "AND indexname NOT IN (SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass))"
+            ), {"table": table.name}).all()
+            for name, definition in extra_indexes:
+                if name in model_index_names:
+                    continue
+                definition = definition.replace(f" {name} ON ", f" {name}{SHADOW_SUFFIX} ON ", 1)
+                definition = re.sub(rf" ON (\S+\.)?{table.name} USING", rf" ON \g<1>{shadow_name} USING", definition, count=1)
+                db.execute(text(definition))
+            db.execute(text(f"ANALYZE {shadow_name}"))
+        db.commit()
+
+        # 2. 한 트랜잭션에서 교체 (DDL도 트랜잭션 적용, 커밋 전까지 조회 측은 기존 테이블을 봄)
+        try:
+            for table in self.tables:
+                db.execute(text(f"ALTER TABLE {table.name} RENAME TO {table.name}{OLD_SUFFIX}"))
+                db.execute(text(f"ALTER TABLE {self.target(table).name} RENAME TO {table.name}"))
+            for table in reversed(self.tables):
+                # 묶음 밖에서 참조하는 외래키가 있으면 함께 제거됨
+                db.execute(text(f"DROP TABLE {table.name}{OLD_SUFFIX} CASCADE"))
+
+            # 제약조건/인덱스/시퀀스 이름 원복 (기본키 제약조건 이름을 바꾸면 인덱스도 함께 바뀜)
+            for table in self.tables:
+                constraints = db.execute(text(
+                    "SELECT conname FROM pg_constraint "
+                    "WHERE conrelid = CAST(:table AS regclass) AND conname LIKE :pattern"
+                ), {"table": table.name, "pattern": f"%{SHADOW_SUFFIX}%"}).scalars().all()
+                for name in constraints:
+                    db.execute(text(
+                        f"ALTER TABLE {table.name} RENAME CONSTRAINT {name} TO {name.replace(SHADOW_SUFFIX, '')}"
+                    ))
+                indexes = db.execute(text(
+                    "SELECT indexname FROM pg_indexes "
+                    "WHERE schemaname = current_schema() AND tablename = :table AND indexname LIKE :pattern"
+                ), {"table": table.name, "pattern": f"%{SHADOW_SUFFIX}%"}).scalars().all()
+                for name in indexes:
+                    db.execute(text(f"ALTER INDEX {name} RENAME TO {name.replace(SHADOW_SUFFIX, '')}"))
+                sequence = db.scalar(text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table.name})
+                if sequence and SHADOW_SUFFIX in sequence:
+                    db.execute(text(f"ALTER SEQUENCE {sequence} RENAME TO {table.name}_id_seq"))
+
+            if on_swap is not None:
+                on_swap(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+    def _swap_sqlite(self, db: Session, on_swap) -> None:
+        # SQLite는 인덱스 이름 변경이 불가하므로 교체 트랜잭션 안에서 원래 이름으로 생성
+        db.commit()
+        db.connection().exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            for table in self.tables:
+                db.execute(text(f"ALTER TABLE {table.name} RENAME TO {table.name}{OLD_SUFFIX}"))
+                db.execute(text(f"ALTER TABLE {self.target(table).name} RENAME TO {table.name}"))
+            for table in reversed(self.tables):
+                db.execute(text(f"DROP TABLE {table.name}{OLD_SUFFIX}"))
+            for table in self.tables:
+                for index in table.indexes:
+                    columns = ", ".join(column.name for column in index.columns)
+                    unique = "UNIQUE " if index.unique else ""
+                    db.execute(text(f"CREATE {unique}INDEX {index.name} ON {table.name} ({columns})"))
+                db.execute(text(f"ANALYZE {table.name}"))
+
+            if on_swap is not None:
+                on_swap(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
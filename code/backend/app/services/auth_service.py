@@ -1,5 +1,9 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Dict
 from jose import JWTError, jwt
 import bcrypt
 from sqlalchemy.orm import Session
@@ -22,6 +26,108 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+class PasswordHasherBusyError(Exception):
+    """bcrypt 대기 작업이 상한을 넘어 요청을 거절함"""
+
+
+class PasswordHasher:
+    """
+    bcrypt 전용 스레드 풀
+
+    bcrypt는 수백 ms 동안 CPU를 사용하므로 이벤트 루프 밖의 고정 크기
+    스레드 풀에서 실행하고, 대기 작업 수가 상한을 넘으면 즉시 거절한다.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.pending = 0  # 실행 중 + 대기 중
+        self.active = 0  # 실행 중
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="bcrypt",
+            )
+        return self._executor
+
+    def _run(self, func, args, submitted_at: float):
+        wait_ms = (time.perf_counter() - submitted_at) * 1000
+        with self._lock:
+            self.active += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+
+    def _release(self, _future) -> None:
+        # 완료/취소 모두 대기 슬롯 반환
+        with self._lock:
+            self.pending -= 1
+
+    async def run(self, func, *args):
+        """스레드 풀에서 실행 (대기 상한 초과 시 PasswordHasherBusyError)"""
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusyError()
+            self.pending += 1
+        try:
+            future = self._get_executor().submit(self._run, func, args, time.perf_counter())
+        except Exception:
+            with self._lock:
+                self.pending -= 1
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "pending": self.pending,
+                "queued": self.pending - self.active,
+                "active": self.active,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_ms / self.completed, 2) if self.completed else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 2),
+            }
+
+
+password_hasher = PasswordHasher(
+    max_workers=max(1, settings.BCRYPT_WORKERS),
+    max_pending=max(1, settings.BCRYPT_MAX_PENDING),
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (bcrypt 전용 스레드 풀)"""
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (bcrypt 전용 스레드 풀)"""
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰 생성"""
     to_encode = data.copy()
@@ -53,6 +159,19 @@ def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     return user
 
 
+async def authenticate_user_async(db: Session, email: str, password: str) -> Optional[User]:
+    """이메일/비밀번호로 사용자 인증 (bcrypt는 전용 스레드 풀에서 실행)"""
+    user = db.query(User).filter(User.email == email).first()
+    if not user:
+        return None
+    # bcrypt 대기 중 DB 커넥션을 점유하지 않도록 세션에서 분리 후 트랜잭션 종료
+    db.expunge(user)
+    db.rollback()
+    if not await verify_password_async(password, user.password_hash):
+        return None
+    return user
+
+
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
     """이메일로 사용자 조회"""
     return db.query(User).filter(User.email == email).first()
@@ -71,10 +190,11 @@ def create_user(
     role: str,
     school_or_org: str = None,
     region_sido: str = None,
-    region_sigungu: str = None
+    region_sigungu: str = None,
+    password_hash: Optional[str] = None
 ) -> User:
-    """새 사용자 생성"""
-    hashed_password = hash_password(password)
+    """새 사용자 생성 (password_hash가 주어지면 해싱 생략)"""
+    hashed_password = password_hash or hash_password(password)
     user = User(
         name=name,
         email=email,
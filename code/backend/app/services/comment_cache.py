@@ -0,0 +1,170 @@
+"""
+Gemini 코멘트 캐시
+- 프롬프트 입력(나이, 성별, 상위 3개 종목/점수)의 정규화 해시를 키로 사용
+- 점수를 구간으로 묶어 거의 같은 프로필이 같은 항목을 공유
+- 메모리 LRU + TTL, 선택적으로 comment_cache 테이블에 영구 저장
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Tuple
+from app.config import settings
+from app.database import SessionLocal
+from app.models.comment_cache import CommentCache
+
+
+# 캐시 키 형식 버전 (프롬프트가 바뀌면 올려서 기존 항목 무효화)
+CACHE_KEY_VERSION = 1
+
+
+def bucket_score(score: float, width: Optional[float] = None) -> float:
+    """점수를 구간 하한값으로 내림 (예: 폭 1.0 → 83.7 → 83.0)"""
+    width = width or settings.COMMENT_CACHE_SCORE_BUCKET
+    if width <= 0:
+        return round(score, 1)
+    return round(math.floor(round(score, 1) / width) * width, 1)
+
+
+def make_cache_key(scores: List[Dict], user_profile: Dict) -> str:
+    """프롬프트 입력을 정규화하여 SHA-256 캐시 키 생성"""
+    canonical = {
+        "v": CACHE_KEY_VERSION,
+        "age": user_profile.get("age"),
+        # 프롬프트는 M 이외를 모두 여학생으로 표기
+        "gender": "M" if user_profile.get("gender") == "M" else "F",
+        "top": [[s["sport"], bucket_score(s["score"])] for s in scores[:3]],
+    }
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CommentCacheStore:
+    """메모리 LRU/TTL 캐시 + 적중률 카운터"""
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        comment, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return comment
+
+    def set(self, key: str, comment: str, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (comment, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "persistent_hits": self.persistent_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "llm_calls_saved": self.hits,
+        }
+
+
+comment_cache = CommentCacheStore(
+    max_size=settings.COMMENT_CACHE_SIZE,
+    ttl=settings.COMMENT_CACHE_TTL,
+)
+
+
+def load_persistent_comment(key: str) -> Optional[Tuple[str, float]]:
+    """comment_cache 테이블 조회 (동기) → (코멘트, 남은 TTL 초)"""
+    db = SessionLocal()
+    try:
+        entry = db.query(CommentCache).filter(CommentCache.cache_key == key).first()
+        if not entry:
+            return None
+        remaining = float(settings.COMMENT_CACHE_TTL)
+        if entry.created_at:
+            created_at = entry.created_at
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            expires_at = created_at + timedelta(seconds=settings.COMMENT_CACHE_TTL)
+            remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+            if remaining <= 0:
+                return None
+        return entry.comment, remaining
+    finally:
+        db.close()
+
+
+def save_persistent_comment(key: str, comment: str) -> None:
+    """comment_cache 테이블 저장 (동기, 만료된 기존 항목은 교체)"""
+    db = SessionLocal()
+    try:
+        db.query(CommentCache).filter(CommentCache.cache_key == key).delete()
+        db.add(CommentCache(cache_key=key, comment=comment))
+        db.commit()
+    except Exception:
+        # 다른 워커가 먼저 저장한 경우 등은 무시
+        db.rollback()
+    finally:
+        db.close()
+
+
+async def lookup_comment(key: str) -> Optional[str]:
+    """캐시 조회 (메모리 → 영구 저장소 순), 적중/미스 카운터 갱신"""
+    comment = comment_cache.get(key)
+    if comment is not None:
+        comment_cache.hits += 1
+        return comment
+
+    if settings.COMMENT_CACHE_PERSISTENT:
+        stored = await asyncio.to_thread(load_persistent_comment, key)
+        if stored:
+            comment, remaining = stored
+            comment_cache.set(key, comment, ttl=remaining)
+            comment_cache.hits += 1
+            comment_cache.persistent_hits += 1
+            return comment
+
+    comment_cache.misses += 1
+    return None
+
+
+async def store_comment(key: str, comment: str) -> None:
+    """생성된 코멘트를 캐시에 저장"""
+    comment_cache.set(key, comment)
+    if settings.COMMENT_CACHE_PERSISTENT:
+        await asyncio.to_thread(save_persistent_comment, key, comment)
+
+
+def get_comment_cache_stats() -> Dict:
+    """코멘트 캐시 적중/미스 통계"""
+    return {
+        **comment_cache.stats(),
+        "persistent": settings.COMMENT_CACHE_PERSISTENT,
+        "ttl_seconds": settings.COMMENT_CACHE_TTL,
+        "score_bucket": settings.COMMENT_CACHE_SCORE_BUCKET,
+    }
@@ -0,0 +1,193 @@
+"""
+Gemini 코멘트 백그라운드 생성 파이프라인
+- 재능 진단 응답 경로에서 LLM 호출을 분리
+- asyncio 대기열에 쌓인 작업을 워커가 처리하여 TalentScore.comment에 저장
+- 클라이언트는 GET /api/talent/tests/{test_id}로 결과를 조회(폴링)
+- 대기열은 프로세스 메모리에만 있으므로 종료 시 처리하지 못한 작업과
+  재시작/장애로 잃은 작업(COMMENT_PENDING_TIMEOUT 경과)은 failed로 바꿔 폴링이 끝나게 함
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Set
+from sqlalchemy import update
+from app.config import settings
+from app.database import SessionLocal
+from app.models.talent import TalentTest, TalentScore, CommentStatus
+from app.services.gemini_client import generate_talent_comment
+
+
+_queue: Optional[asyncio.Queue] = None
+_workers: List[asyncio.Task] = []
+_sweeper: Optional[asyncio.Task] = None
+# 워커가 처리 중인 test_id (종료 시 취소되는 작업 확인용)
+_in_flight: Set[int] = set()
+
+
+def is_comment_enabled() -> bool:
+    """코멘트 생성 가능 여부 (API 키 설정 시에만 동작)"""
+    return bool(settings.GEMINI_API_KEY)
+
+
+def enqueue_talent_comment(test_id: int, scores: List[Dict], user_profile: Dict) -> bool:
+    """
+    코멘트 생성 작업을 대기열에 추가
+
+    Returns:
+        대기열 추가 성공 여부 (워커 미기동 또는 대기열 포화 시 False)
+    """
+    if _queue is None:
+        return False
+    try:
+        _queue.put_nowait((test_id, scores[:3], user_profile))
+        return True
+    except asyncio.QueueFull:
+        return False
+
+
+def get_comment_queue_stats() -> Dict:
+    """코멘트 대기열 상태 조회"""
+    return {
+        "running": _queue is not None,
+        "workers": len(_workers),
+        "queued": _queue.qsize() if _queue is not None else 0,
+        "max_size": settings.COMMENT_QUEUE_MAXSIZE,
+    }
+
+
+def _save_comment(test_id: int, comment: Optional[str]) -> None:
+    """생성된 코멘트를 최고 점수 종목의 TalentScore.comment에 저장"""
+    db = SessionLocal()
+    try:
+        test = db.query(TalentTest).filter(TalentTest.id == test_id).first()
+        if not test:
+            return
+
+        if comment:
+            top_score = db.query(TalentScore).filter(
+                TalentScore.talent_test_id == test_id
+            ).order_by(TalentScore.score.desc()).first()
+            if top_score:
+                top_score.comment = comment
+
+        test.comment_status = CommentStatus.completed if comment else CommentStatus.failed
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _fail_pending(test_ids: Optional[List[int]] = None, older_than: Optional[datetime] = None) -> int:
+    """아직 pending인 진단의 코멘트 상태를 failed로 변경 (변경된 행 수 반환)"""
+    db = SessionLocal()
+    try:
+        statement = update(TalentTest).where(TalentTest.comment_status == CommentStatus.pending)
+        if test_ids is not None:
+            statement = statement.where(TalentTest.id.in_(test_ids))
+        if older_than is not None:
+            statement = statement.where(TalentTest.created_at < older_than)
+        count = db.execute(statement.values(comment_status=CommentStatus.failed)).rowcount
+        db.commit()
+        return count
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def fail_stale_comments() -> int:
+    """
+    COMMENT_PENDING_TIMEOUT보다 오래 pending인 코멘트를 failed로 정리
+
+    이전 프로세스의 대기열과 함께 사라진 작업도 여기서 정리됩니다.
+    대기열이 길어 늦게 끝난 작업은 저장 시 completed로 다시 바뀝니다.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.COMMENT_PENDING_TIMEOUT)
+    return _fail_pending(older_than=cutoff)
+
+
+async def _stale_comment_sweeper() -> None:
+    """기동 직후와 이후 주기적으로 오래된 pending 코멘트 정리"""
+    interval = max(settings.COMMENT_PENDING_TIMEOUT / 2, 1)
+    while True:
+        try:
+            count = await asyncio.to_thread(fail_stale_comments)
+            if count:
+                print(f"Marked {count} stale pending comments as failed")
+        except Exception as e:
+            print(f"Stale comment sweep error: {e}")
+        await asyncio.sleep(interval)
+
+
+async def _comment_worker() -> None:
+    """대기열에서 작업을 꺼내 코멘트를 생성하고 저장"""
+    while True:
+        test_id, scores, user_profile = await _queue.get()
+        _in_flight.add(test_id)
+        try:
+            comment = await generate_talent_comment(scores=scores, user_profile=user_profile)
+            await asyncio.to_thread(_save_comment, test_id, comment)
+        except Exception as e:
+            # 워커는 계속 동작해야 하므로 실패는 기록만 남김
+            print(f"Comment worker error (test_id={test_id}): {e}")
+        finally:
+            _in_flight.discard(test_id)
+            _queue.task_done()
+
+
+async def start_comment_workers() -> None:
+    """코멘트 대기열과 워커 태스크, pending 정리 태스크 기동 (FastAPI lifespan 시작 시)"""
+    global _queue, _sweeper
+    if _sweeper is None:
+        _sweeper = asyncio.create_task(_stale_comment_sweeper())
+    if not is_comment_enabled() or _queue is not None:
+        return
+
+    _queue = asyncio.Queue(maxsize=settings.COMMENT_QUEUE_MAXSIZE)
+    for _ in range(max(1, settings.COMMENT_WORKER_COUNT)):
+        _workers.append(asyncio.create_task(_comment_worker()))
+
+
+async def stop_comment_workers(timeout: float = 10.0) -> None:
+    """
+    남은 작업을 제한 시간 내에 처리한 뒤 워커 종료 (FastAPI lifespan 종료 시)
+
+    제한 시간 안에 끝나지 않은 작업(대기 중 + 처리 중 취소)은 failed로 기록합니다.
+    """
+    global _queue, _sweeper
+    if _sweeper is not None:
+        _sweeper.cancel()
+        await asyncio.gather(_sweeper, return_exceptions=True)
+        _sweeper = None
+    if _queue is None:
+        return
+
+    unfinished = []
+    try:
+        await asyncio.wait_for(_queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        while True:
+            try:
+                test_id, _, _ = _queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            unfinished.append(test_id)
+            _queue.task_done()
+
+    # 취소되면 워커가 _in_flight에서 지우므로 취소 전에 복사
+    unfinished.extend(_in_flight)
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+    _queue = None
+
+    if unfinished:
+        try:
+            count = await asyncio.to_thread(_fail_pending, unfinished)
+            print(f"Comment worker shutdown: {count} unfinished comments marked failed")
+        except Exception as e:
+            print(f"Comment worker shutdown: could not mark {len(unfinished)} comments failed: {e}")
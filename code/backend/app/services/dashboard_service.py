@@ -0,0 +1,166 @@
+"""
+대시보드 요약 스냅샷 서비스
+- 적재 스크립트 실행 후 전체 재계산 (refresh_dashboard_summary)
+- 재능 진단 저장 시 진단 수만 증분 갱신 (increment_talent_test_count)
+- API는 dashboard_summary 단일 행만 조회
+"""
+
+from typing import Dict
+from sqlalchemy import select, func, update
+from sqlalchemy.orm import Session
+from app.models.dashboard import DashboardSummary
+from app.models.facility import FacilityStats
+from app.models.support import SupportStats
+from app.models.coach import CoachStats
+from app.models.program import Program
+from app.models.talent import TalentTest
+
+
+# 스냅샷 행 ID (단일 행)
+SUMMARY_ID = 1
+
+# 체육지도자 합계에 포함하는 자격 유형 컬럼
+COACH_COLUMNS = (
+    CoachStats.health_exercise_manager,
+    CoachStats.professional_sports_1,
+    CoachStats.professional_sports_2,
+    CoachStats.living_sports_1,
+    CoachStats.living_sports_2,
+    CoachStats.youth_sports,
+    CoachStats.senior_sports,
+    CoachStats.disabled_sports_1,
+    CoachStats.disabled_sports_2,
+)
+
+
+def compute_dashboard_summary(db: Session) -> Dict:
+    """원본 테이블에서 요약 값 집계 (DB 집계 함수 사용)"""
+    values = {
+        "program_count": db.scalar(select(func.count(Program.id))) or 0,
+        "talent_test_count": db.scalar(select(func.count(TalentTest.id))) or 0,
+    }
+
+    # 시설 통계 (최신 기준년월)
+    latest_facility_ym = db.scalar(select(func.max(FacilityStats.base_ym)))
+    facility_total, facility_region_count = 0, 0
+    if latest_facility_ym:
+        facility_total, facility_region_count = db.execute(
+            select(
+                func.coalesce(func.sum(FacilityStats.facility_count), 0),
+                func.count(FacilityStats.id),
+            ).where(FacilityStats.base_ym == latest_facility_ym)
+        ).one()
+    values.update(
+        facility_total=int(facility_total),
+        facility_base_ym=latest_facility_ym,
+        facility_region_count=int(facility_region_count),
+    )
+
+    # 스포츠강좌이용권 수혜자 수 (최신 연도)
+    latest_support_year = db.scalar(select(func.max(SupportStats.base_year)))
+    support_total = 0
+    if latest_support_year:
+        support_total = db.scalar(
+            select(func.coalesce(func.sum(SupportStats.recipient_count), 0))
+            .where(SupportStats.base_year == latest_support_year)
+        )
+    values.update(
+        support_total_recipients=int(support_total),
+        support_base_year=latest_support_year,
+    )
+
+    # 체육지도자 수 (최신 연도 첫 행)
+    latest_coach_year = db.scalar(select(func.max(CoachStats.qualification_year)))
+    coach_total = 0
+    if latest_coach_year:
+        row = db.execute(
+            select(*COACH_COLUMNS)
+            .where(CoachStats.qualification_year == latest_coach_year)
+            .limit(1)
+        ).first()
+        coach_total = sum(v or 0 for v in row) if row else 0
+    values.update(
+        coach_total=coach_total,
+        coach_latest_year=latest_coach_year,
+    )
+
+    return values
+
+
+def _summary_upsert(db: Session, values: Dict):
+    """스냅샷 행 upsert 문 (PostgreSQL/SQLite ON CONFLICT, 그 외 dialect는 None)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        return None
+    return insert(DashboardSummary).values(id=SUMMARY_ID, **values).on_conflict_do_update(
+        index_elements=[DashboardSummary.id],
+        set_={**values, "refreshed_at": func.now()},
+    )
+
+
+def refresh_dashboard_summary(db: Session) -> DashboardSummary:
+    """
+    스냅샷 전체 재계산 (호출 측에서 commit)
+
+    첫 조회가 동시에 들어와도 INSERT가 충돌하지 않도록 upsert로 저장합니다.
+    """
+    values = compute_dashboard_summary(db)
+    statement = _summary_upsert(db, values)
+    if statement is not None:
+        db.execute(statement)
+        return db.get(DashboardSummary, SUMMARY_ID, populate_existing=True)
+
+    summary = db.get(DashboardSummary, SUMMARY_ID)
+    if summary is None:
+        summary = DashboardSummary(id=SUMMARY_ID, **values)
+        db.add(summary)
+    else:
+        for key, value in values.items():
+            setattr(summary, key, value)
+    db.flush()
+    return summary
+
+
+def increment_talent_test_count(db: Session, count: int = 1) -> None:
+    """
+    진단 저장 트랜잭션 안에서 진단 수 증분 갱신
+
+    스냅샷 행이 아직 없으면 갱신할 행이 없어 증분이 버려집니다.
+    첫 조회나 다음 적재 때 refresh_dashboard_summary가 talent_tests 전체를
+    다시 세므로 그 시점에 누락분이 반영됩니다.
+    """
+    db.execute(
+        update(DashboardSummary)
+        .where(DashboardSummary.id == SUMMARY_ID)
+        .values(talent_test_count=DashboardSummary.talent_test_count + count)
+    )
+
+
+def serialize_dashboard_summary(summary: DashboardSummary) -> Dict:
+    """스냅샷 행 → 대시보드 요약 응답"""
+    return {
+        "programs": {
+            "total": summary.program_count,
+        },
+        "facilities": {
+            "total": summary.facility_total,
+            "base_ym": summary.facility_base_ym,
+            "region_count": summary.facility_region_count,
+        },
+        "support": {
+            "total_recipients": summary.support_total_recipients,
+            "base_year": summary.support_base_year,
+        },
+        "coaches": {
+            "total": summary.coach_total,
+            "latest_year": summary.coach_latest_year,
+        },
+        "talent_tests": {
+            "total": summary.talent_test_count,
+        },
+    }
+
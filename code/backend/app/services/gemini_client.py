@@ -2,15 +2,186 @@
 Gemini API 클라이언트
 - 재능 점수에 대한 설명/코멘트 생성
 - GEMINI_API_KEY가 설정된 경우에만 동작
+- 애플리케이션 수명 동안 공유하는 커넥션 풀 (FastAPI lifespan에서 생성/종료)
+- 동시 호출 상한, 429/5xx 지터 백오프 재시도, 서킷 브레이커
+- 같은 프롬프트 입력은 코멘트 캐시에서 응답 (comment_cache)
 """
 
+import asyncio
+import random
+import time
 import httpx
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from app.config import settings
 from app.services.scoring_service import SPORT_NAMES_KO
+from app.services.comment_cache import make_cache_key, lookup_comment, store_comment
 
 
-GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-3-pro:generateContent"
+# 재시도 대상 상태 코드 (요청 한도 초과 + 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class CircuitBreaker:
+    """
+    연속 실패 시 일정 시간 동안 호출을 건너뛰는 서킷 브레이커
+
+    - closed: 정상 호출
+    - open: cooldown 동안 호출 차단
+    - half-open: cooldown 이후 1건만 시험 호출, 성공 시 closed로 복귀
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow_request(self) -> Tuple[bool, bool]:
+        """
+        호출 허용 여부
+
+        Returns:
+            (허용 여부, 이 호출이 half-open 시험 호출인지)
+            시험 호출을 받은 호출만 record_*(probe=True)/release_probe로 표시를 해제합니다.
+        """
+        state = self.state
+        if state == "closed":
+            return True, False
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True, True
+        return False, False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self, probe: bool = False) -> None:
+        self.failures += 1
+        if probe:
+            self._probing = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """시험 호출 표시 해제 (시험 호출이 성공/실패 기록 없이 예외·취소로 끝난 경우)"""
+        self._probing = False
+
+
+_client: Optional[httpx.AsyncClient] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_breaker = CircuitBreaker(
+    failure_threshold=settings.GEMINI_BREAKER_THRESHOLD,
+    cooldown=settings.GEMINI_BREAKER_COOLDOWN,
+)
+
+
+async def init_gemini_client() -> None:
+    """공유 HTTP 클라이언트 생성 (FastAPI lifespan 시작 시)"""
+    global _client, _semaphore
+    if _client is not None:
+        return
+
+    _client = httpx.AsyncClient(
+        timeout=settings.GEMINI_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=settings.GEMINI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GEMINI_MAX_CONNECTIONS,
+            keepalive_expiry=60.0,
+        ),
+        headers={"Content-Type": "application/json"},
+    )
+    _semaphore = asyncio.Semaphore(max(1, settings.GEMINI_MAX_CONCURRENCY))
+
+
+async def close_gemini_client() -> None:
+    """공유 HTTP 클라이언트 종료 (FastAPI lifespan 종료 시)"""
+    global _client, _semaphore
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _semaphore = None
+
+
+def get_gemini_client_stats() -> Dict:
+    """클라이언트 상태 (서킷 브레이커/동시 호출) 조회"""
+    return {
+        "initialized": _client is not None,
+        "breaker_state": _breaker.state,
+        "consecutive_failures": _breaker.failures,
+        "max_concurrency": settings.GEMINI_MAX_CONCURRENCY,
+    }
+
+
+def _backoff_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """지수 백오프 + full jitter (Retry-After 헤더가 있으면 우선 적용)"""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), settings.GEMINI_BREAKER_COOLDOWN)
+    return random.uniform(0, settings.GEMINI_RETRY_BACKOFF * (2 ** attempt))
+
+
+async def _post_with_retry(payload: Dict) -> Optional[Dict]:
+    """
+    Gemini API 호출 (동시성 제한 + 재시도 + 서킷 브레이커)
+
+    동시 호출 슬롯은 시도마다 잡고 놓으므로 백오프 대기 중에는 다른 호출이 슬롯을 씁니다.
+
+    Returns:
+        응답 JSON 또는 None (차단/실패 시)
+    """
+    allowed, probe = _breaker.allow_request()
+    if not allowed:
+        return None
+
+    try:
+        if _client is None:
+            # lifespan 밖(스크립트 등)에서 호출된 경우 지연 생성
+            await init_gemini_client()
+
+        url = f"{settings.GEMINI_API_URL}?key={settings.GEMINI_API_KEY}"
+
+        for attempt in range(settings.GEMINI_MAX_RETRIES + 1):
+            response = None
+            try:
+                async with _semaphore:
+                    response = await _client.post(url, json=payload)
+            except httpx.HTTPError as e:
+                print(f"Gemini API HTTP error (attempt {attempt + 1}): {e}")
+            else:
+                if response.status_code == 200:
+                    _breaker.record_success()
+                    try:
+                        return response.json()
+                    except ValueError:
+                        return None
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    # 요청 자체의 문제(4xx)는 상위 서비스 장애로 보지 않음
+                    print(f"Gemini API error: HTTP {response.status_code}")
+                    _breaker.record_success()
+                    return None
+
+            if attempt < settings.GEMINI_MAX_RETRIES:
+                await asyncio.sleep(_backoff_delay(attempt, response))
+
+        _breaker.record_failure(probe=probe)
+        return None
+    finally:
+        # 예상 밖 예외/작업 취소로 빠져나가도 half-open 시험 호출이 영구히 잡혀 있지 않게 함
+        # (closed 상태에서 시작한 느린 호출이 다른 호출의 시험 표시를 지우지 않도록 시험 호출만 해제)
+        if probe:
+            _breaker.release_probe()
 
 
 async def generate_talent_comment(
@@ -31,6 +202,12 @@ async def generate_talent_comment(
         return None
 
     try:
+        # 같은 프로필(점수 구간 기준)의 코멘트가 캐시에 있으면 재사용
+        cache_key = make_cache_key(scores, user_profile)
+        cached = await lookup_comment(cache_key)
+        if cached is not None:
+            return cached
+
         # 상위 3개 종목 추출
         top_scores = scores[:3]
         top_sports_text = ", ".join([
@@ -53,34 +230,31 @@ async def generate_talent_comment(
 
 코멘트:"""
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{GEMINI_API_URL}?key={settings.GEMINI_API_KEY}",
-                json={
-                    "contents": [
-                        {
-                            "parts": [
-                                {"text": prompt}
-                            ]
-                        }
-                    ],
-                    "generationConfig": {
-                        "temperature": 0.7,
-                        "maxOutputTokens": 300,
-                    }
-                },
-                headers={"Content-Type": "application/json"}
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                candidates = data.get("candidates", [])
-                if candidates:
-                    content = candidates[0].get("content", {})
-                    parts = content.get("parts", [])
-                    if parts:
-                        return parts[0].get("text", "").strip()
-            return None
+        data = await _post_with_retry({
+            "contents": [
+                {
+                    "parts": [
+                        {"text": prompt}
+                    ]
+                }
+            ],
+            "generationConfig": {
+                "temperature": 0.7,
+                "maxOutputTokens": 300,
+            }
+        })
+
+        if data:
+            candidates = data.get("candidates", [])
+            if candidates:
+                content = candidates[0].get("content", {})
+                parts = content.get("parts", [])
+                if parts:
+                    comment = parts[0].get("text", "").strip()
+                    if comment:
+                        await store_comment(cache_key, comment)
+                    return comment
+        return None
 
     except Exception as e:
         # 실패해도 서비스 전체에 영향 없도록
@@ -0,0 +1,254 @@
+"""
+위치 기반 검색 도구
+- geohash 인코딩 (B-tree 인덱스 컬럼에 저장)
+- 반경/사각형 검색 영역을 덮는 geohash 접두사 구간 계산 → 인덱스 범위 조회
+- 대권(haversine) 거리 계산 및 가까운 순 정렬
+
+PostGIS 없이 PostgreSQL/SQLite 모두에서 동작하도록 문자열 B-tree 인덱스만 사용합니다.
+"""
+
+import math
+import numpy as np
+from typing import List, Optional, Tuple, Any, Iterable
+from sqlalchemy import Select, select, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9  # 저장 정밀도 (약 5m)
+EARTH_RADIUS_M = 6371008.8
+
+# 국내 좌표 범위 (제주 남단 ~ 강원 북단, 서해 ~ 독도)
+KOREA_LAT_RANGE = (33.0, 39.0)
+KOREA_LON_RANGE = (124.0, 132.0)
+
+# 반경 검색 시 사용할 최대 geohash 셀 수 (셀당 인덱스 범위 조회 1회)
+MAX_COVER_CELLS = 16
+
+# 처음 조회할 반경 (m). 결과가 부족하면 요청 반경까지 두 배씩 확장
+INITIAL_SEARCH_RADIUS_M = 500
+
+
+def is_valid_coordinate(lat: Optional[float], lon: Optional[float]) -> bool:
+    """국내 범위 안의 유효한 좌표인지 확인 (결측/0/뒤바뀐 좌표 제외)"""
+    if lat is None or lon is None:
+        return False
+    if isinstance(lat, float) and math.isnan(lat) or isinstance(lon, float) and math.isnan(lon):
+        return False
+    return (
+        KOREA_LAT_RANGE[0] <= lat <= KOREA_LAT_RANGE[1]
+        and KOREA_LON_RANGE[0] <= lon <= KOREA_LON_RANGE[1]
+    )
+
+
+def valid_coordinate_mask(lat, lon) -> np.ndarray:
+    """위경도 배열 → 국내 범위 안의 유효한 좌표 여부 배열 (is_valid_coordinate 벡터화 버전)"""
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        return (
+            (lat >= KOREA_LAT_RANGE[0]) & (lat <= KOREA_LAT_RANGE[1])
+            & (lon >= KOREA_LON_RANGE[0]) & (lon <= KOREA_LON_RANGE[1])
+        )
+
+
+def encode_geohash(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    """위경도 → geohash 문자열"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bit, ch, even = 0, 0, True
+    while len(chars) < precision:
+        if even:
+            mid = (lon_range[0] + lon_range[1]) / 2
+            if lon >= mid:
+                ch = (ch << 1) | 1
+                lon_range[0] = mid
+            else:
+                ch <<= 1
+                lon_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                ch = (ch << 1) | 1
+                lat_range[0] = mid
+            else:
+                ch <<= 1
+                lat_range[1] = mid
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(GEOHASH_ALPHABET[ch])
+            bit, ch = 0, 0
+    return "".join(chars)
+
+
+def geohash_or_none(lat: Optional[float], lon: Optional[float]) -> Optional[str]:
+    """유효한 좌표면 geohash, 아니면 None (적재 스크립트용)"""
+    if not is_valid_coordinate(lat, lon):
+        return None
+    return encode_geohash(float(lat), float(lon))
+
+
+def encode_geohash_array(lat, lon, precision: int = GEOHASH_PRECISION) -> np.ndarray:
+    """
+    위경도 배열 → geohash 배열 (적재 스크립트용 벡터화 버전)
+
+    국내 범위를 벗어나거나 결측인 좌표는 None. encode_geohash와 같은 결과를 냅니다.
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    result = np.full(lat.shape, None, dtype=object)
+
+    valid = valid_coordinate_mask(lat, lon)
+    if not valid.any():
+        return result
+
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    # 구간 이분 탐색(>= mid → 1)은 격자 인덱스 내림과 같음
+    lat_index = np.floor((lat[valid] + 90.0) / 180.0 * (1 << lat_bits)).astype(np.uint64)
+    lon_index = np.floor((lon[valid] + 180.0) / 360.0 * (1 << lon_bits)).astype(np.uint64)
+    lat_index = np.minimum(lat_index, np.uint64((1 << lat_bits) - 1))
+    lon_index = np.minimum(lon_index, np.uint64((1 << lon_bits) - 1))
+
+    # 경도부터 비트를 번갈아 인터리빙
+    code = np.zeros(lat_index.shape, dtype=np.uint64)
+    for i in range(bits):
+        if i % 2 == 0:
+            bit = (lon_index >> np.uint64(lon_bits - 1 - i // 2)) & np.uint64(1)
+        else:
+            bit = (lat_index >> np.uint64(lat_bits - 1 - i // 2)) & np.uint64(1)
+        code = (code << np.uint64(1)) | bit
+
+    alphabet = np.array(list(GEOHASH_ALPHABET), dtype=object)
+    hashes = np.full(code.shape, "", dtype=object)
+    for k in range(precision):
+        hashes = hashes + alphabet[((code >> np.uint64(5 * (precision - 1 - k))) & np.uint64(31)).astype(np.int64)]
+    result[valid] = hashes
+    return result
+
+
+def _cell_size(precision: int) -> Tuple[float, float]:
+    """geohash 정밀도별 셀 크기 (위도 도, 경도 도)"""
+    bits = precision * 5
+    lon_bits = (bits + 1) // 2
+    lat_bits = bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def bounding_box(lat: float, lon: float, radius_m: float) -> Tuple[float, float, float, float]:
+    """반경을 감싸는 위경도 사각형 (min_lat, min_lon, max_lat, max_lon)"""
+    dlat = math.degrees(radius_m / EARTH_RADIUS_M)
+    dlon = math.degrees(radius_m / (EARTH_RADIUS_M * max(math.cos(math.radians(lat)), 1e-6)))
+    return lat - dlat, lon - dlon, lat + dlat, lon + dlon
+
+
+def covering_prefixes(min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[str]:
+    """사각형 영역을 덮는 geohash 접두사 목록 (셀 수 MAX_COVER_CELLS 이하인 가장 세밀한 정밀도)"""
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        cell_lat, cell_lon = _cell_size(precision)
+        lat_start = math.floor((min_lat + 90) / cell_lat)
+        lat_end = math.floor((max_lat + 90) / cell_lat)
+        lon_start = math.floor((min_lon + 180) / cell_lon)
+        lon_end = math.floor((max_lon + 180) / cell_lon)
+        if (lat_end - lat_start + 1) * (lon_end - lon_start + 1) > MAX_COVER_CELLS and precision > 1:
+            continue
+        prefixes = set()
+        for i in range(lat_start, lat_end + 1):
+            for j in range(lon_start, lon_end + 1):
+                center_lat = min(90.0, -90 + (i + 0.5) * cell_lat)
+                center_lon = min(180.0, -180 + (j + 0.5) * cell_lon)
+                prefixes.add(encode_geohash(center_lat, center_lon, precision))
+        return sorted(prefixes)
+    return []
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """접두사 구간의 상한 (마지막 문자를 알파벳 순서상 다음 문자로 올림, 범위 끝이면 None)"""
+    chars = list(prefix)
+    while chars:
+        index = GEOHASH_ALPHABET.index(chars[-1])
+        if index + 1 < len(GEOHASH_ALPHABET):
+            chars[-1] = GEOHASH_ALPHABET[index + 1]
+            return "".join(chars)
+        chars.pop()
+    return None
+
+
+def geohash_range_filter(column, prefixes: Iterable[str]):
+    """geohash 접두사 목록 → 인덱스 범위 조건 (LIKE 대신 범위 비교로 정렬 규칙과 무관하게 인덱스 사용)"""
+    conditions = []
+    for prefix in prefixes:
+        upper = _prefix_upper_bound(prefix)
+        if upper is None:
+            conditions.append(column >= prefix)
+        else:
+            conditions.append(and_(column >= prefix, column < upper))
+    return or_(*conditions)
+
+
+def area_conditions(model, min_lat: float, min_lon: float, max_lat: float, max_lon: float, geohash_column=None) -> list:
+    """사각형 영역 조회 조건 (geohash 인덱스 범위 + 위경도 범위)"""
+    geohash_column = geohash_column if geohash_column is not None else model.geohash
+    return [
+        geohash_range_filter(geohash_column, covering_prefixes(min_lat, min_lon, max_lat, max_lon)),
+        model.latitude.between(min_lat, max_lat),
+        model.longitude.between(min_lon, max_lon),
+    ]
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 지점 사이 대권 거리 (m)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+async def find_nearby(
+    db: AsyncSession,
+    model,
+    lat: float,
+    lon: float,
+    radius_m: float,
+    limit: int,
+    base_query: Optional[Select] = None,
+    geohash_column=None,
+) -> List[Tuple[Any, float]]:
+    """
+    반경 내 가까운 순 조회 (k-최근접)
+
+    작은 반경에서 시작해 limit개를 채울 때까지 반경을 두 배씩 넓히므로
+    밀집 지역에서도 조회 행 수가 결과 수에 비례합니다.
+    model은 latitude/longitude/geohash 컬럼을 가져야 합니다.
+    geohash_column을 주면 (조인된 태그 테이블 등) 해당 컬럼의 인덱스로 범위 조회합니다.
+
+    Returns:
+        [(행, 거리 m), ...] 가까운 순
+    """
+    base_query = base_query if base_query is not None else select(model)
+    search_radius = min(radius_m, INITIAL_SEARCH_RADIUS_M)
+
+    while True:
+        min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, search_radius)
+        query = base_query.where(*area_conditions(model, min_lat, min_lon, max_lat, max_lon, geohash_column))
+        candidates = (await db.scalars(query)).all()
+
+        within, seen = [], set()
+        for row in candidates:
+            # 조인으로 같은 행이 여러 번 나올 수 있음
+            if row.id in seen:
+                continue
+            seen.add(row.id)
+            distance = haversine_m(lat, lon, row.latitude, row.longitude)
+            if distance <= search_radius:
+                within.append((row, distance))
+
+        if len(within) >= limit or search_radius >= radius_m:
+            within.sort(key=lambda item: (item[1], item[0].id))
+            return within[:limit]
+
+        search_radius = min(radius_m, search_radius * 2)
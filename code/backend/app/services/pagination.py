@@ -0,0 +1,110 @@
+"""
+목록 조회 페이지네이션 도구
+- 키셋(커서) 페이지네이션용 불투명 커서 인코딩/디코딩
+- 필터 조합별 집계 결과 캐시 (총 개수, 패싯 등, TTL)
+- PostgreSQL 플래너 통계 기반 행 수 추정
+"""
+
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# 커서 형식 버전 (정렬 기준이 바뀌면 올려서 기존 커서 무효화)
+CURSOR_VERSION = 2
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없거나 다른 검색 조건으로 만들어진 커서"""
+
+
+def filter_signature(filters: Dict[str, Any]) -> str:
+    """필터 조합의 정규화 해시 (값이 없는 필터는 제외)"""
+    canonical = {k: v for k, v in filters.items() if v not in (None, "")}
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_cursor(last_id: int, signature: str, rank: Optional[float] = None) -> str:
+    """마지막 행의 정렬 키 → 불투명 커서 문자열"""
+    payload = {"v": CURSOR_VERSION, "id": last_id, "f": signature}
+    if rank is not None:
+        payload["r"] = rank
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, signature: str) -> Tuple[int, Optional[float]]:
+    """커서 문자열 → (마지막 id, 관련도 점수)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = int(payload["id"])
+        rank = payload.get("r")
+        rank = float(rank) if rank is not None else None
+        version, cursor_signature = payload.get("v"), payload.get("f")
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorError("유효하지 않은 커서입니다.")
+    if version != CURSOR_VERSION or cursor_signature != signature:
+        raise InvalidCursorError("검색 조건이 변경되어 커서를 사용할 수 없습니다.")
+    return last_id, rank
+
+
+class SignatureCache:
+    """필터 조합 시그니처별 집계 결과 캐시 (크기 제한 LRU + TTL)"""
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+async def estimate_row_count(db: AsyncSession, query: Select) -> Optional[int]:
+    """
+    플래너 통계 기반 결과 행 수 추정 (PostgreSQL EXPLAIN)
+
+    실제 스캔 없이 계획만 세우므로 필터 조합과 무관하게 비용이 일정합니다.
+    PostgreSQL이 아니면 None을 반환합니다.
+    """
+    if db.bind.dialect.name != "postgresql":
+        return None
+    connection = await db.connection()
+    compiled = query.compile(dialect=connection.dialect)
+    result = await connection.exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + str(compiled),
+        compiled.params,
+    )
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
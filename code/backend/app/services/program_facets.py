@@ -0,0 +1,93 @@
+"""
+프로그램 필터 패싯 집계
+- 현재 필터 조합에서 시도/시군구/유형/대상/업종별 프로그램 수
+- PostgreSQL: GROUPING SETS 한 번의 스캔으로 모든 패싯 집계
+- SQLite: 패싯별 GROUP BY를 UNION ALL로 묶어 한 번의 요청으로 집계
+"""
+
+from typing import Dict, List
+from sqlalchemy import Select, select, func, literal, union_all, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# 패싯 이름 (응답 키 순서)
+FACETS = ("region_sido", "region_sigungu", "program_type", "target_group", "industry_name")
+
+
+def _empty_facets() -> Dict[str, List[Dict]]:
+    return {name: [] for name in FACETS}
+
+
+def _append(result: Dict[str, List[Dict]], facet: str, sido, value, count: int) -> None:
+    if value is None:
+        return
+    item = {"value": value, "count": int(count)}
+    if facet == "region_sigungu":
+        # 시군구 이름은 시도마다 겹치므로(중구 등) 시도와 함께 반환
+        item = {"region_sido": sido, **item}
+    result[facet].append(item)
+
+
+def _sort(result: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+    for items in result.values():
+        items.sort(key=lambda item: (-item["count"], item.get("region_sido") or "", item["value"]))
+    return result
+
+
+async def compute_program_facets(db: AsyncSession, filtered_query: Select) -> Dict[str, List[Dict]]:
+    """필터가 적용된 프로그램 쿼리 → 패싯별 [{value, count}] (건수 내림차순)"""
+    programs = filtered_query.subquery("filtered")
+    c = programs.c
+    result = _empty_facets()
+
+    if db.bind.dialect.name == "postgresql":
+        query = select(
+            func.grouping(c.region_sido, c.region_sigungu, c.program_type, c.target_group, c.industry_name).label("g"),
+            c.region_sido,
+            c.region_sigungu,
+            c.program_type,
+            c.target_group,
+            c.industry_name,
+            func.count().label("count"),
+        ).group_by(func.grouping_sets(
+            tuple_(c.region_sido),
+            tuple_(c.region_sido, c.region_sigungu),
+            tuple_(c.program_type),
+            tuple_(c.target_group),
+            tuple_(c.industry_name),
+        ))
+        # GROUPING() 비트 (집계에서 제외된 컬럼 = 1): sido, sigungu, type, target, industry 순
+        facet_by_bits = {
+            0b01111: "region_sido",
+            0b00111: "region_sigungu",
+            0b11011: "program_type",
+            0b11101: "target_group",
+            0b11110: "industry_name",
+        }
+        for row in (await db.execute(query)).all():
+            facet = facet_by_bits.get(row.g)
+            if facet is None:
+                continue
+            value = row.region_sido if facet == "region_sido" else getattr(row, facet)
+            _append(result, facet, row.region_sido, value, row.count)
+        return _sort(result)
+
+    # 그 외 DB: 패싯별 GROUP BY를 한 문장으로 결합
+    parts = [
+        select(literal("region_sido").label("facet"), c.region_sido.label("sido"),
+               c.region_sido.label("value"), func.count().label("count"))
+        .group_by(c.region_sido),
+        select(literal("region_sigungu").label("facet"), c.region_sido.label("sido"),
+               c.region_sigungu.label("value"), func.count().label("count"))
+        .group_by(c.region_sido, c.region_sigungu),
+    ]
+    for facet in ("program_type", "target_group", "industry_name"):
+        column = c[facet]
+        parts.append(
+            select(literal(facet).label("facet"), literal(None).label("sido"),
+                   column.label("value"), func.count().label("count"))
+            .group_by(column)
+        )
+    for row in (await db.execute(union_all(*parts))).all():
+        _append(result, row.facet, row.sido, row.value, row.count)
+    return _sort(result)
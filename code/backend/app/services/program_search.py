@@ -0,0 +1,155 @@
+"""
+프로그램 검색 인덱스
+- PostgreSQL: pg_trgm GIN 인덱스가 기존 ILIKE '%키워드%' 조건을 그대로 처리
+  (유사도 similarity()로 관련도 정렬)
+- SQLite: FTS5 trigram 가상 테이블 programs_fts (외부 콘텐츠, bm25로 관련도 정렬)
+- 인덱스 생성은 Alembic 마이그레이션, 동기화는 프로그램 적재 스크립트에서 수행
+
+trigram 인덱스는 3글자 이상 검색어에만 사용되므로, 2글자 이하 검색어는
+기존 ILIKE 조건으로 처리합니다 (필터 의미는 동일: 대소문자 무시 부분 일치).
+"""
+
+from typing import Optional, Tuple
+from sqlalchemy import Float, Select, cast, select, func, text, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+from app.models.program import Program
+
+
+FTS_TABLE = "programs_fts"
+
+# FTS5 인덱스 대상 컬럼 (순서 = 가상 테이블 컬럼 순서)
+FTS_COLUMNS = ("program_name", "facility_name", "program_type", "target_group", "industry_name")
+
+# trigram 토크나이저가 처리할 수 있는 최소 검색어 길이
+MIN_TRIGRAM_LENGTH = 3
+
+CREATE_FTS_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    + ", ".join(FTS_COLUMNS)
+    + ", content='programs', content_rowid='id', tokenize='trigram')"
+)
+
+
+def _fts_phrase(term: str) -> str:
+    """FTS5 구문 문자열 (큰따옴표 이스케이프, trigram 구문 = 부분 일치)"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _indexable(term: Optional[str]) -> bool:
+    return bool(term) and len(term) >= MIN_TRIGRAM_LENGTH
+
+
+def apply_program_search(
+    query: Select,
+    dialect_name: str,
+    fts_available: bool = False,
+    program_type: Optional[str] = None,
+    target_group: Optional[str] = None,
+    industry_name: Optional[str] = None,
+    keyword: Optional[str] = None,
+) -> Tuple[Select, Optional[ColumnElement]]:
+    """
+    텍스트 필터/키워드 검색 적용
+
+    Returns:
+        (필터가 적용된 쿼리, 관련도 점수 식 — 클수록 관련도 높음, 키워드가 없으면 None)
+    """
+    text_filters = {
+        "program_type": program_type,
+        "target_group": target_group,
+        "industry_name": industry_name,
+    }
+
+    if dialect_name == "sqlite" and fts_available:
+        match_terms = []
+        for column_name, value in text_filters.items():
+            if _indexable(value):
+                match_terms.append(f"{column_name} : {_fts_phrase(value)}")
+            elif value:
+                query = query.where(getattr(Program, column_name).ilike(f"%{value}%"))
+
+        keyword_in_fts = _indexable(keyword)
+        if keyword_in_fts:
+            match_terms.insert(0, f"{{program_name facility_name}} : {_fts_phrase(keyword)}")
+        elif keyword:
+            query = query.where(
+                (Program.program_name.ilike(f"%{keyword}%")) |
+                (Program.facility_name.ilike(f"%{keyword}%"))
+            )
+
+        if not match_terms:
+            return query, None
+
+        fts = (
+            select(
+                literal_column("rowid").label("rowid"),
+                func.bm25(literal_column(FTS_TABLE)).label("rank"),
+            )
+            .select_from(text(FTS_TABLE))
+            .where(literal_column(FTS_TABLE).op("MATCH")(" AND ".join(match_terms)))
+            .subquery("fts")
+        )
+        query = query.join(fts, fts.c.rowid == Program.id)
+        # bm25는 작을수록 관련도가 높으므로 부호 반전
+        return query, (-fts.c.rank if keyword_in_fts else None)
+
+    # PostgreSQL (pg_trgm GIN 인덱스) 및 인덱스가 없는 환경: ILIKE 그대로 사용
+    for column_name, value in text_filters.items():
+        if value:
+            query = query.where(getattr(Program, column_name).ilike(f"%{value}%"))
+
+    if not keyword:
+        return query, None
+
+    query = query.where(
+        (Program.program_name.ilike(f"%{keyword}%")) |
+        (Program.facility_name.ilike(f"%{keyword}%"))
+    )
+    if dialect_name == "postgresql":
+        # similarity()는 real(float4)이므로 double로 변환해 커서 값과 정확히 비교되게 함
+        score = cast(func.greatest(
+            func.similarity(Program.program_name, keyword),
+            func.similarity(Program.facility_name, keyword),
+        ), Float(53))
+        return query, score
+    return query, None
+
+
+def has_fts_table(db: Session) -> bool:
+    """SQLite FTS5 테이블 존재 여부 (마이그레이션 미적용 환경 대비)"""
+    return db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first() is not None
+
+
+# FTS5 테이블 확인 결과 (한 번 확인되면 재조회하지 않음)
+_fts_ready = False
+
+
+async def search_dialect(db: AsyncSession) -> Tuple[str, bool]:
+    """(DB 방언 이름, SQLite FTS5 사용 가능 여부)"""
+    global _fts_ready
+    dialect_name = db.bind.dialect.name
+    if dialect_name != "sqlite":
+        return dialect_name, False
+    if not _fts_ready:
+        _fts_ready = await db.run_sync(has_fts_table)
+    return dialect_name, _fts_ready
+
+
+def rebuild_search_index(db: Session) -> None:
+    """
+    적재 후 검색 인덱스 동기화 (호출 측에서 commit)
+
+    - SQLite: FTS5 외부 콘텐츠 테이블을 programs 기준으로 재구성
+    - PostgreSQL: GIN 인덱스는 자동 갱신되므로 플래너 통계만 갱신
+    """
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        db.execute(text(CREATE_FTS_SQL))
+        db.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+    elif dialect_name == "postgresql":
+        db.execute(text("ANALYZE programs"))
@@ -0,0 +1,91 @@
+"""
+재능 진단 → 프로그램 추천
+- 진단 상위 종목(일반/패럴림픽)을 program_sport_tags 인덱스로 조회
+- 위치가 있으면 종목+geohash 인덱스로 가까운 순, 없으면 진단 지역 기준
+"""
+
+from typing import List, Optional, Tuple, Dict
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.program import Program, ProgramSportTag
+from app.services.geo import find_nearby
+
+
+async def _matched_sports(db: AsyncSession, program_ids: List[int], sports: List[str]) -> Dict[int, List[str]]:
+    """프로그램별 추천 종목 중 해당 종목 (진단 점수 순)"""
+    if not program_ids:
+        return {}
+    rows = (await db.execute(
+        select(ProgramSportTag.program_id, ProgramSportTag.sport).where(
+            ProgramSportTag.program_id.in_(program_ids),
+            ProgramSportTag.sport.in_(sports),
+        )
+    )).all()
+    order = {sport: i for i, sport in enumerate(sports)}
+    matched: Dict[int, List[str]] = {}
+    for program_id, sport in rows:
+        matched.setdefault(program_id, []).append(sport)
+    for program_id in matched:
+        matched[program_id].sort(key=order.get)
+    return matched
+
+
+async def recommend_programs(
+    db: AsyncSession,
+    sports: List[str],
+    limit: int,
+    lat: Optional[float] = None,
+    lon: Optional[float] = None,
+    radius_m: int = 5000,
+    region_sido: Optional[str] = None,
+    region_sigungu: Optional[str] = None,
+) -> List[Tuple[Program, List[str], Optional[float]]]:
+    """
+    추천 종목에 해당하는 프로그램 조회
+
+    Args:
+        sports: 추천 종목 코드 (진단 점수 높은 순)
+
+    Returns:
+        [(프로그램, 해당 종목 목록, 거리 m 또는 None), ...]
+    """
+    if not sports:
+        return []
+
+    base_query = (
+        select(Program)
+        .join(ProgramSportTag, ProgramSportTag.program_id == Program.id)
+        .where(ProgramSportTag.sport.in_(sports))
+    )
+
+    if lat is not None and lon is not None:
+        nearby = await find_nearby(
+            db, Program, lat, lon, radius_m, limit,
+            base_query=base_query,
+            geohash_column=ProgramSportTag.geohash,
+        )
+        matched = await _matched_sports(db, [p.id for p, _ in nearby], sports)
+        return [(p, matched.get(p.id, []), distance) for p, distance in nearby]
+
+    # 위치가 없으면 진단 지역 내 프로그램 (상위 종목 우선, 최신 등록순)
+    if region_sido:
+        base_query = base_query.where(Program.region_sido == region_sido)
+    if region_sigungu:
+        base_query = base_query.where(Program.region_sigungu == region_sigungu)
+
+    programs, seen = [], set()
+    for sport in sports:
+        if len(programs) >= limit:
+            break
+        rows = (await db.scalars(
+            base_query.where(ProgramSportTag.sport == sport)
+            .order_by(Program.id.desc())
+            .limit(limit)
+        )).all()
+        for program in rows:
+            if program.id not in seen and len(programs) < limit:
+                seen.add(program.id)
+                programs.append(program)
+
+    matched = await _matched_sports(db, [p.id for p in programs], sports)
+    return [(p, matched.get(p.id, []), None) for p in programs]
@@ -3,9 +3,12 @@
 - 체력 항목을 0~100점으로 정규화
 - 종목별 가중치 적용하여 점수 계산
 - 백분위/등급 추정
+- 대량 진단용 일괄 채점 (NumPy 행렬 연산)
 """
 
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Sequence
+
+import numpy as np
 
 
 # 체력 항목별 정규화 기준 (min, max) - 성별에 따라 분리
@@ -390,3 +393,156 @@ def calculate_all_sport_scores(
     # 점수 높은 순으로 정렬
     results.sort(key=lambda x: x["score"], reverse=True)
     return results
+
+
+# ===== 일괄 채점 (대량 진단용) =====
+# 정규화 기준과 가중치 테이블을 import 시점에 NumPy 배열로 미리 컴파일한다.
+
+# 체력 항목 순서 (지표 행렬의 열 순서)
+METRIC_KEYS = (
+    "grip_strength",
+    "sit_ups",
+    "standing_long_jump",
+    "shuttle_run_20m",
+    "sit_and_reach",
+)
+
+# 성별 인덱스: 0 = 미지정(기본 기준), 1 = M, 2 = F
+_GENDER_INDEX = {"M": 1, "F": 2}
+
+
+def _compile_ranges() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """정규화 기준을 (성별 3 x 항목 5) 배열로 변환"""
+    tables = [
+        NORMALIZATION_RANGES,
+        NORMALIZATION_RANGES_BY_GENDER["M"],
+        NORMALIZATION_RANGES_BY_GENDER["F"],
+    ]
+    mins = np.array([[float(t[m][0]) for m in METRIC_KEYS] for t in tables])
+    maxs = np.array([[float(t[m][1]) for m in METRIC_KEYS] for t in tables])
+    # normalize_score와 동일하게 (max - min)을 먼저 계산
+    spans = np.array([[float(t[m][1] - t[m][0]) for m in METRIC_KEYS] for t in tables])
+    return mins, maxs, spans
+
+
+def _compile_weights(sport_weights: Dict[str, Dict[str, float]]) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """종목별 가중치를 (항목 5 x 종목 K) 행렬로 변환"""
+    sports = tuple(sport_weights.keys())
+    matrix = np.array([
+        [float(sport_weights[sport].get(metric, 0.0)) for sport in sports]
+        for metric in METRIC_KEYS
+    ])
+    return sports, matrix
+
+
+_RANGE_MIN, _RANGE_MAX, _RANGE_SPAN = _compile_ranges()
+_GENERAL_SPORTS, _GENERAL_WEIGHT_MATRIX = _compile_weights(SPORT_WEIGHTS)
+_DISABILITY_WEIGHT_MATRICES = {
+    disability: _compile_weights(weights)
+    for disability, weights in DISABILITY_SPORT_WEIGHTS.items()
+}
+
+
+def metrics_to_matrix(rows: Sequence[Dict]) -> np.ndarray:
+    """
+    체력 측정값 딕셔너리 목록을 N x 5 지표 행렬로 변환
+
+    누락된 항목(None)은 NaN으로 표시되며 정규화 시 0점 처리됩니다.
+    """
+    matrix = np.full((len(rows), len(METRIC_KEYS)), np.nan)
+    for i, row in enumerate(rows):
+        for j, metric in enumerate(METRIC_KEYS):
+            value = row.get(metric)
+            if value is not None:
+                matrix[i, j] = float(value)
+    return matrix
+
+
+def normalize_metric_matrix(
+    metrics: np.ndarray,
+    genders: Sequence[Optional[str]],
+) -> np.ndarray:
+    """N x 5 지표 행렬을 성별 기준에 따라 0~100점으로 정규화"""
+    metrics = np.asarray(metrics, dtype=np.float64)
+    if metrics.ndim != 2 or metrics.shape[1] != len(METRIC_KEYS):
+        raise ValueError(f"metrics는 N x {len(METRIC_KEYS)} 행렬이어야 합니다.")
+    if len(genders) != metrics.shape[0]:
+        raise ValueError("genders 길이가 metrics 행 수와 다릅니다.")
+
+    gender_idx = np.array([_GENDER_INDEX.get(g, 0) for g in genders], dtype=np.intp)
+    mins = _RANGE_MIN[gender_idx]
+    maxs = _RANGE_MAX[gender_idx]
+    spans = _RANGE_SPAN[gender_idx]
+
+    missing = np.isnan(metrics)
+    clamped = np.minimum(maxs, np.maximum(mins, np.where(missing, mins, metrics)))
+    normalized = (clamped - mins) / spans * 100.0
+    return np.where(missing, 0.0, normalized)
+
+
+def _weighted_sum(norm: np.ndarray, weight_matrix: np.ndarray) -> np.ndarray:
+    """
+    정규화 점수 행렬 x 가중치 행렬
+
+    단건 경로(compute_sport_score)와 결과가 비트 단위로 같도록
+    항목 축을 같은 순서로 누적한다. (BLAS matmul은 합산 순서가 달라질 수 있음)
+    """
+    total = np.zeros((norm.shape[0], weight_matrix.shape[1]))
+    for j in range(weight_matrix.shape[0]):
+        total = total + norm[:, j:j + 1] * weight_matrix[j]
+    return total
+
+
+def calculate_sport_scores_batch(
+    metrics: np.ndarray,
+    genders: Sequence[Optional[str]],
+    disability_types: Optional[Sequence[Optional[str]]] = None,
+) -> List[list]:
+    """
+    여러 학생의 종목별 재능 점수를 한 번에 계산
+
+    Args:
+        metrics: N x 5 지표 행렬 (열 순서는 METRIC_KEYS, 누락값은 NaN)
+        genders: 길이 N의 성별 목록 ("M"/"F"/None)
+        disability_types: 길이 N의 장애 유형 목록 (None이면 모두 일반 종목)
+
+    Returns:
+        학생별 calculate_all_sport_scores 결과와 동일한 리스트의 리스트
+    """
+    norm = normalize_metric_matrix(metrics, genders)
+    n = norm.shape[0]
+    if disability_types is None:
+        disability_types = [None] * n
+    elif len(disability_types) != n:
+        raise ValueError("disability_types 길이가 metrics 행 수와 다릅니다.")
+
+    # 장애 유형별로 행을 묶어 가중치 행렬을 한 번씩만 곱한다
+    groups: Dict[Optional[str], List[int]] = {}
+    for i, disability in enumerate(disability_types):
+        key = disability if disability in _DISABILITY_WEIGHT_MATRICES else None
+        groups.setdefault(key, []).append(i)
+
+    results: List[list] = [[] for _ in range(n)]
+    for disability, row_indices in groups.items():
+        if disability is None:
+            sports, weight_matrix = _GENERAL_SPORTS, _GENERAL_WEIGHT_MATRIX
+        else:
+            sports, weight_matrix = _DISABILITY_WEIGHT_MATRICES[disability]
+
+        raw_scores = _weighted_sum(norm[row_indices], weight_matrix)
+        for row, i in zip(raw_scores.tolist(), row_indices):
+            items = []
+            for sport, raw in zip(sports, row):
+                score = round(raw, 2)
+                percentile, grade_level = estimate_percentile_and_grade(score)
+                items.append({
+                    "sport": sport,
+                    "sport_name_ko": SPORT_NAMES_KO.get(sport, sport),
+                    "score": score,
+                    "percentile": percentile,
+                    "grade_level": grade_level,
+                })
+            items.sort(key=lambda x: x["score"], reverse=True)
+            results[i] = items
+
+    return results
@@ -0,0 +1,144 @@
+"""
+프로그램 종목 태그
+- 재능 진단 종목(일반 + 패럴림픽)을 프로그램명/유형/업종 키워드로 매핑
+- 모든 키워드를 하나의 정규식으로 컴파일하여 텍스트를 한 번만 훑음 (다중 패턴 매칭)
+- 적재 시 한 번 계산하여 program_sport_tags 테이블(종목+geohash 인덱스)에 저장
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, insert, delete
+from app.models.program import Program, ProgramSportTag
+
+
+# 종목별 키워드 (공백 제거 후 비교)
+SPORT_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "soccer": ("축구", "풋살"),
+    "basketball": ("농구", "바스켓"),
+    "volleyball": ("배구",),
+    "sprint": ("육상", "달리기", "러닝", "스프린트", "트랙"),
+    "judo": ("유도",),
+    "swimming": ("수영", "아쿠아", "수중운동", "영법"),
+    "baseball": ("야구", "티볼"),
+    "taekwondo": ("태권도",),
+    # 패럴림픽 종목 (고유 명칭)
+    "boccia": ("보치아",),
+    "goalball": ("골볼",),
+    "sitting_volleyball": ("좌식배구",),
+    "wheelchair_basketball": ("휠체어농구",),
+    "wheelchair_tennis": ("휠체어테니스",),
+}
+
+# 장애인 프로그램 표지 + 일반 종목 키워드 조합으로 태그하는 패럴림픽 종목
+PARA_MARKERS = ("장애", "패럴", "특수체육", "어울림", "휠체어")
+PARA_SPORT_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "para_swimming": ("수영", "아쿠아"),
+    "para_athletics": ("육상", "달리기", "러닝"),
+    "para_table_tennis": ("탁구",),
+}
+
+# 진단 종목이 아닌 활동 (프로그램명에 있으면 업종명으로 보완하지 않음: 수영장의 필라테스 등)
+OTHER_ACTIVITY_KEYWORDS = (
+    "필라테스", "요가", "헬스", "피트니스", "에어로빅", "줌바", "댄스", "발레", "골프", "테니스",
+    "배드민턴", "탁구", "스쿼시", "클라이밍", "스케이트", "검도", "복싱", "주짓수", "체조", "줄넘기",
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _compile(keywords: Dict[str, Tuple[str, ...]]):
+    """
+    키워드 → 종목 목록 매핑과 전체 키워드 정규식
+
+    긴 키워드를 먼저 시도하므로 '휠체어농구'는 농구로 중복 태그되지 않습니다.
+    """
+    by_keyword: Dict[str, List[str]] = {}
+    for sport, words in keywords.items():
+        for word in words:
+            by_keyword.setdefault(word, []).append(sport)
+    ordered = sorted(by_keyword, key=len, reverse=True)
+    return by_keyword, re.compile("|".join(re.escape(word) for word in ordered))
+
+
+_SPORT_BY_KEYWORD, _SPORT_PATTERN = _compile(SPORT_KEYWORDS)
+_PARA_BY_KEYWORD, _PARA_PATTERN = _compile(PARA_SPORT_KEYWORDS)
+_PARA_MARKER_PATTERN = re.compile("|".join(re.escape(m) for m in PARA_MARKERS))
+_OTHER_ACTIVITY_PATTERN = re.compile("|".join(re.escape(k) for k in OTHER_ACTIVITY_KEYWORDS))
+
+
+def _normalize(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return _WHITESPACE.sub("", str(text)).lower()
+
+
+def tag_sports(
+    program_name: Optional[str],
+    program_type: Optional[str] = None,
+    industry_name: Optional[str] = None,
+) -> List[str]:
+    """
+    프로그램 종목 태그 계산
+
+    프로그램명/유형에서 먼저 찾고, 없으면 업종명(수영장, 태권도장 등)으로 보완합니다.
+    """
+    text = _normalize(program_name) + " " + _normalize(program_type)
+    sports = _match(text)
+    if not sports and not _OTHER_ACTIVITY_PATTERN.search(text):
+        sports = _match(_normalize(industry_name))
+    return sports
+
+
+def _match(text: str) -> List[str]:
+    """정규화된 텍스트 → 종목 태그 (정렬)"""
+    if not text.strip():
+        return []
+    sports = set()
+    for match in _SPORT_PATTERN.finditer(text):
+        sports.update(_SPORT_BY_KEYWORD[match.group()])
+    if _PARA_MARKER_PATTERN.search(text):
+        for match in _PARA_PATTERN.finditer(text):
+            sports.update(_PARA_BY_KEYWORD[match.group()])
+    return sorted(sports)
+
+
+def rebuild_sport_tags(db, batch_size: int = 10000, program_table=None, tag_table=None) -> int:
+    """
+    program_sport_tags 전체 재계산 (적재 후 호출, 호출 측에서 commit)
+
+    programs를 id 순 배치로 읽어 태그를 계산하고 일괄 삽입합니다.
+    db는 Session 또는 Connection 모두 사용 가능합니다.
+    program_table/tag_table로 shadow 테이블을 대신 지정할 수 있습니다.
+
+    Returns:
+        삽입된 태그 수
+    """
+    programs = (program_table if program_table is not None else Program.__table__).c
+    tag_table = tag_table if tag_table is not None else ProgramSportTag.__table__
+    db.execute(delete(tag_table))
+    total, last_id = 0, 0
+    while True:
+        rows = db.execute(
+            select(
+                programs.id,
+                programs.program_name,
+                programs.program_type,
+                programs.industry_name,
+                programs.geohash,
+            )
+            .where(programs.id > last_id)
+            .order_by(programs.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        tags = [
+            {"program_id": row.id, "sport": sport, "geohash": row.geohash}
+            for row in rows
+            for sport in tag_sports(row.program_name, row.program_type, row.industry_name)
+        ]
+        if tags:
+            db.execute(insert(tag_table), tags)
+            total += len(tags)
+        last_id = rows[-1].id
+    return total
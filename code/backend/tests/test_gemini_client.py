@@ -0,0 +1,175 @@
+"""
+Gemini 클라이언트 재시도/서킷 브레이커 테스트
+
+실제 API 대신 httpx.MockTransport로 만든 가짜 서버에 요청을 보냅니다.
+"""
+
+import asyncio
+import json
+import httpx
+import pytest
+from app.config import settings
+from app.services import gemini_client
+from app.services.gemini_client import CircuitBreaker
+
+
+COOLDOWN = 0.05
+OK_BODY = {"candidates": [{"content": {"parts": [{"text": "좋아요"}]}}]}
+
+
+class MockGemini:
+    """응답 순서를 지정하는 가짜 Gemini 서버 (모두 소진되면 마지막 응답 반복)"""
+
+    def __init__(self, *responses, gate: asyncio.Event = None):
+        self.responses = list(responses)
+        self.gate = gate
+        self.calls = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append(json.loads(request.content))
+        if self.gate is not None:
+            await self.gate.wait()
+        status = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if status == 200:
+            return httpx.Response(200, json=OK_BODY)
+        return httpx.Response(status, headers={"Retry-After": "0"})
+
+
+@pytest.fixture
+def mock_server(monkeypatch):
+    """가짜 서버를 공유 클라이언트에 연결하고 브레이커를 새로 만듦"""
+    monkeypatch.setattr(settings, "GEMINI_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "GEMINI_RETRY_BACKOFF", 0.001)
+    monkeypatch.setattr(gemini_client, "_breaker", CircuitBreaker(failure_threshold=2, cooldown=COOLDOWN))
+    monkeypatch.setattr(gemini_client, "_semaphore", asyncio.Semaphore(10))
+
+    def connect(server: MockGemini) -> MockGemini:
+        # MockTransport는 소켓을 열지 않으므로 별도 종료 불필요
+        monkeypatch.setattr(gemini_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(server)))
+        return server
+
+    return connect
+
+
+async def open_breaker() -> None:
+    """임계치만큼 실패시켜 브레이커를 연 뒤 cooldown이 지나 half-open이 될 때까지 대기"""
+    breaker = gemini_client._breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == "open"
+    await asyncio.sleep(COOLDOWN * 1.5)
+    assert breaker.state == "half-open"
+
+
+@pytest.mark.asyncio
+async def test_retries_429_and_5xx_until_success(mock_server):
+    server = mock_server(MockGemini(429, 503, 200))
+
+    assert await gemini_client._post_with_retry({"id": "a"}) == OK_BODY
+    assert len(server.calls) == 3
+    assert gemini_client._breaker.state == "closed"
+    assert gemini_client._breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_status_is_not_retried(mock_server):
+    server = mock_server(MockGemini(400))
+
+    assert await gemini_client._post_with_retry({"id": "a"}) is None
+    assert len(server.calls) == 1
+    assert gemini_client._breaker.failures == 0
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_then_half_open_probe_closes_it(mock_server):
+    server = mock_server(MockGemini(500))
+
+    # 재시도를 모두 소진한 호출 2건 → 임계치 도달로 open
+    assert await gemini_client._post_with_retry({"id": "a"}) is None
+    assert await gemini_client._post_with_retry({"id": "b"}) is None
+    assert len(server.calls) == 2 * (settings.GEMINI_MAX_RETRIES + 1)
+    assert gemini_client._breaker.state == "open"
+
+    # open 동안은 서버에 요청하지 않음
+    calls = len(server.calls)
+    assert await gemini_client._post_with_retry({"id": "c"}) is None
+    assert len(server.calls) == calls
+
+    # cooldown 이후 시험 호출이 성공하면 closed
+    await asyncio.sleep(COOLDOWN * 1.5)
+    assert gemini_client._breaker.state == "half-open"
+    server.responses = [200]
+    assert await gemini_client._post_with_retry({"id": "probe"}) == OK_BODY
+    assert gemini_client._breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens_breaker(mock_server):
+    server = mock_server(MockGemini(500))
+    await open_breaker()
+
+    assert await gemini_client._post_with_retry({"id": "probe"}) is None
+    assert gemini_client._breaker.state == "open"
+    assert len(server.calls) == settings.GEMINI_MAX_RETRIES + 1
+
+
+@pytest.mark.asyncio
+async def test_single_probe_under_concurrency(mock_server):
+    gate = asyncio.Event()
+    server = mock_server(MockGemini(200, gate=gate))
+    await open_breaker()
+
+    tasks = [asyncio.create_task(gemini_client._post_with_retry({"id": i})) for i in range(10)]
+    await asyncio.sleep(0.01)
+    gate.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(server.calls) == 1
+    assert sum(result == OK_BODY for result in results) == 1
+    assert results.count(None) == 9
+    assert gemini_client._breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_slow_closed_call_does_not_release_probe(mock_server):
+    gate = asyncio.Event()
+    server = mock_server(MockGemini(200, gate=gate))
+
+    # closed 상태에서 시작해 응답을 기다리는 느린 호출
+    slow = asyncio.create_task(gemini_client._post_with_retry({"id": "slow"}))
+    await asyncio.sleep(0.01)
+
+    # 그 사이 브레이커가 열렸다가 half-open이 되어 시험 호출이 진행 중
+    await open_breaker()
+    probe = asyncio.create_task(gemini_client._post_with_retry({"id": "probe"}))
+    await asyncio.sleep(0.01)
+    assert [call["id"] for call in server.calls] == ["slow", "probe"]
+
+    # 느린 호출이 취소되어도 시험 호출 표시는 남아 두 번째 시험 호출이 생기지 않음
+    slow.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await slow
+    assert await gemini_client._post_with_retry({"id": "second"}) is None
+    assert [call["id"] for call in server.calls] == ["slow", "probe"]
+
+    gate.set()
+    assert await probe == OK_BODY
+    assert gemini_client._breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_releases_probe(mock_server):
+    gate = asyncio.Event()
+    server = mock_server(MockGemini(200, gate=gate))
+    await open_breaker()
+
+    probe = asyncio.create_task(gemini_client._post_with_retry({"id": "probe"}))
+    await asyncio.sleep(0.01)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    # 취소된 시험 호출이 표시를 풀어 다음 호출이 시험 호출이 됨
+    gate.set()
+    assert await gemini_client._post_with_retry({"id": "next"}) == OK_BODY
+    assert [call["id"] for call in server.calls] == ["probe", "next"]